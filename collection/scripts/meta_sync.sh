@@ -2,6 +2,13 @@
 # ============================================================
 # 元数据同步：每 30 秒从 PostgreSQL 导出 CSV → Vector enrichment_tables
 # 文件更新后 Vector 自动热重载（inotify）
+#
+# 设置 META_SNAPSHOT_URL（如 http://meta-api:3000/meta/snapshot）时改为从
+# Meta API 拉取共享快照：带 If-None-Match 条件请求，未变化返回 304 不改写文件；
+# Meta API 不可用时回退到 psql 全量导出
+#
+# 从 Meta API 同步时以长轮询代替固定间隔：带上次的索引 ETag 请求 /meta/snapshot?wait=INTERVAL，
+# 快照内容变化立即返回（Meta API 开启 META_CATALOG_CHANNEL 时为亚秒级），超时无变化返回 304
 # ============================================================
 
 set -e
@@ -17,9 +24,52 @@ export PGPASSWORD="${PG_PASSWORD:-paimon123}"
 
 PG_CONN="-h $PG_HOST -p $PG_PORT -U $PG_USER -d $PG_DB"
 
+SNAPSHOT_URL="${META_SNAPSHOT_URL:-}"
+
 mkdir -p "$META_DIR"
 
-sync_once() {
+# 条件拉取单个快照文件：200 → 替换文件并记录 ETag；304 → 保持不变
+fetch_snapshot() {
+    local name="$1"
+    local target="${META_DIR}/${name}"
+    local etag_file="${META_DIR}/.${name}.etag"
+    local etag=""
+    if [ -f "$target" ] && [ -f "$etag_file" ]; then
+        etag=$(cat "$etag_file")
+    fi
+
+    local code
+    code=$(curl -sS -m 10 -o "${target}.tmp" -D "${target}.hdr" -w '%{http_code}' \
+        -H "If-None-Match: ${etag}" "${SNAPSHOT_URL}/${name}") || code="000"
+
+    case "$code" in
+        200)
+            mv -f "${target}.tmp" "$target"
+            sed -n 's/^[Ee][Tt][Aa][Gg]: *//p' "${target}.hdr" | tr -d '\r' > "$etag_file"
+            CHANGED=$((CHANGED + 1))
+            ;;
+        304)
+            rm -f "${target}.tmp"
+            ;;
+        *)
+            rm -f "${target}.tmp" "${target}.hdr"
+            return 1
+            ;;
+    esac
+    rm -f "${target}.hdr"
+}
+
+sync_from_api() {
+    CHANGED=0
+    for name in projects.csv valid_events.csv valid_properties.csv; do
+        fetch_snapshot "$name" || return 1
+    done
+    if [ "$CHANGED" -gt 0 ]; then
+        echo "[meta-sync] $(date '+%H:%M:%S') 快照已更新 ${CHANGED} 个文件 (projects=$(wc -l < ${META_DIR}/projects.csv) events=$(wc -l < ${META_DIR}/valid_events.csv) props=$(wc -l < ${META_DIR}/valid_properties.csv))"
+    fi
+}
+
+sync_from_pg() {
     # 1) 项目列表
     {
         echo "project_name,is_auto_create"
@@ -53,6 +103,41 @@ sync_once() {
     echo "[meta-sync] $(date '+%H:%M:%S') CSV 同步完成 (projects=$(wc -l < ${META_DIR}/projects.csv) events=$(wc -l < ${META_DIR}/valid_events.csv) props=$(wc -l < ${META_DIR}/valid_properties.csv))"
 }
 
+sync_once() {
+    FROM_API=0
+    if [ -n "$SNAPSHOT_URL" ] && command -v curl > /dev/null; then
+        if sync_from_api; then
+            FROM_API=1
+            return 0
+        fi
+        echo "[meta-sync] $(date '+%H:%M:%S') Meta API 快照不可用，回退到 psql 导出"
+        rm -f "${META_DIR}"/.*.etag
+    fi
+    sync_from_pg
+}
+
+# 等待下一次同步：上次从 Meta API 同步成功时长轮询快照索引，否则固定间隔
+INDEX_ETAG=""
+wait_next() {
+    if [ "$FROM_API" != "1" ]; then
+        sleep "$INTERVAL"
+        return
+    fi
+    local hdr="${META_DIR}/.index.hdr"
+    local code
+    code=$(curl -sS -m $((INTERVAL + 10)) -o /dev/null -D "$hdr" -w '%{http_code}' \
+        -H "If-None-Match: ${INDEX_ETAG}" "${SNAPSHOT_URL}?wait=${INTERVAL}") || code="000"
+    case "$code" in
+        200|304)
+            INDEX_ETAG=$(sed -n 's/^[Ee][Tt][Aa][Gg]: *//p' "$hdr" | tr -d '\r')
+            ;;
+        *)
+            sleep "$INTERVAL"
+            ;;
+    esac
+    rm -f "$hdr"
+}
+
 # 支持 --once 参数：仅执行一次（用于 entrypoint 初始化）
 if [ "$1" = "--once" ]; then
     sync_once
@@ -62,5 +147,5 @@ fi
 # 循环同步
 while true; do
     sync_once
-    sleep "$INTERVAL"
+    wait_next
 done
@@ -0,0 +1,507 @@
+"""
+meta-api /register 基准测试
+在进程内直接以 ASGI 调用 /register（不经过网络与 Docker），用生成的 NDJSON 批次驱动，
+统计吞吐、延迟分位与每批次的 SQL 往返次数，输出 JSON 便于对比优化前后的结果。
+
+后端二选一：
+  --backend memory    记录型连接池替身：按 meta_api 的 SQL 模板在内存中模拟各表（唯一索引 + ON CONFLICT DO NOTHING），
+                      统计语句数、往返次数与行数；--rtt-ms 为每次往返附加模拟网络延迟
+  --backend pg --dsn  本地一次性 PostgreSQL：每个场景新建临时数据库并执行 postgres/init/04-init-user-track.sql，
+                      结束后删除；--dsn 需要有 CREATE DATABASE 权限
+
+用法：
+  python3 meta-api/bench_register.py                                  # 内存替身跑全部预置场景
+  python3 meta-api/bench_register.py --scenario cold --batch-size 500 --rtt-ms 0.5
+  python3 meta-api/bench_register.py --env META_SQL_MODE=returning --output returning.json
+  python3 meta-api/bench_register.py --backend pg --dsn postgresql://postgres@localhost/postgres --concurrency 8
+
+预置场景（命令行参数覆盖场景中的同名取值）：
+  cached    全部 key 已注册，衡量缓存命中路径
+  cold      每个事件都带新事件名与新属性，衡量写入路径
+  mixed     5% 事件带新 key，接近稳定运行时的比例
+  identity  30% track_signup + 20% track_id_bind，衡量 user_id_mapping 写入
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import random
+import asyncio
+import argparse
+from pathlib import Path
+
+INIT_SQL = Path(__file__).resolve().parent.parent / "postgres" / "init" / "04-init-user-track.sql"
+
+SCENARIOS = {
+    "cached": {"new_ratio": 0.0},
+    "cold": {"new_ratio": 1.0},
+    "mixed": {"new_ratio": 0.05},
+    "identity": {"new_ratio": 0.0, "signup_share": 0.3, "bind_share": 0.2},
+}
+
+WORKLOAD_DEFAULTS = {
+    "batch_size": 200, "projects": 3, "events": 50, "properties": 200, "props_per_event": 8,
+    "users": 100000, "new_ratio": 0.0, "signup_share": 0.0, "bind_share": 0.0,
+}
+
+
+# ---------- 批次生成 ----------
+
+class BatchGenerator:
+    """按基数与比例生成 Vector format_meta_payload 形状的 NDJSON 批次"""
+
+    def __init__(self, seed, **workload):
+        self.rng = random.Random(seed)
+        self.w = workload
+        self.seq = 0
+
+    def _event(self):
+        rng, w = self.rng, self.w
+        project = f"bench_p{rng.randrange(w['projects'])}"
+        props = {f"prop_{rng.randrange(w['properties'])}": self._value() for _ in range(w["props_per_event"])}
+        if rng.random() < w["new_ratio"]:
+            self.seq += 1
+            event = f"new_ev_{self.seq}"
+            props[f"new_prop_{self.seq}"] = self._value()
+        else:
+            event = f"ev_{rng.randrange(w['events'])}"
+        user = f"u{rng.randrange(w['users'])}"
+        evt = {"project": project, "event": event, "type": "track", "distinct_id": user,
+               "login_id": None, "original_id": None, "properties": props, "properties_keys": list(props)}
+        roll = rng.random()
+        if roll < w["signup_share"]:
+            evt.update(type="track_signup", login_id=user, original_id=f"anon_{user}")
+        elif roll < w["signup_share"] + w["bind_share"]:
+            evt.update(type="track_id_bind", login_id=f"login_{user}")
+        return evt
+
+    def _value(self):
+        roll = self.rng.random()
+        if roll < 0.4:
+            return self.rng.randrange(1000)
+        if roll < 0.8:
+            return f"s{self.rng.randrange(1000)}"
+        return roll < 0.9
+
+    def batch(self) -> bytes:
+        return "\n".join(json.dumps(self._event(), separators=(",", ":"))
+                         for _ in range(self.w["batch_size"])).encode("utf-8")
+
+
+# ---------- SQL 往返统计 ----------
+
+class TripCounter:
+    """语句数（按 SQL 模板名）、往返次数、写入行数（参数数组长度）与返回行数"""
+
+    def __init__(self, names: dict):
+        self.names = {**names, "BEGIN": "BEGIN", "COMMIT": "COMMIT", "ROLLBACK": "ROLLBACK"}
+        self.reset()
+
+    def reset(self):
+        self.trips = 0
+        self.statements = {}
+        self.rows_written = 0
+        self.rows_returned = 0
+
+    def record(self, sql, args, returned=0):
+        name = self.names.get(sql, "other")
+        self.trips += 1
+        self.statements[name] = self.statements.get(name, 0) + 1
+        self.rows_written += len(args[0]) if args and isinstance(args[0], list) else 0
+        self.rows_returned += returned
+
+    def snapshot(self, batches) -> dict:
+        return {"trips": self.trips, "trips_per_batch": round(self.trips / batches, 3) if batches else 0,
+                "statements": dict(sorted(self.statements.items())),
+                "rows_written": self.rows_written, "rows_returned": self.rows_returned}
+
+
+class CountingTransaction:
+    def __init__(self, inner, counter, rtt):
+        self.inner = inner
+        self.counter = counter
+        self.rtt = rtt
+
+    async def __aenter__(self):
+        self.counter.record("BEGIN", ())
+        await _rtt(self.rtt)
+        return await self.inner.__aenter__()
+
+    async def __aexit__(self, *exc):
+        self.counter.record("COMMIT" if exc[0] is None else "ROLLBACK", ())
+        await _rtt(self.rtt)
+        return await self.inner.__aexit__(*exc)
+
+
+class CountingConnection:
+    """包装真实连接或内存替身，每次 execute / fetch 记一次往返"""
+
+    def __init__(self, inner, counter, rtt):
+        self.inner = inner
+        self.counter = counter
+        self.rtt = rtt
+
+    async def execute(self, sql, *args):
+        result = await self.inner.execute(sql, *args)
+        self.counter.record(sql, args)
+        await _rtt(self.rtt)
+        return result
+
+    async def fetch(self, sql, *args):
+        rows = await self.inner.fetch(sql, *args)
+        self.counter.record(sql, args, len(rows))
+        await _rtt(self.rtt)
+        return rows
+
+    def transaction(self):
+        return CountingTransaction(self.inner.transaction(), self.counter, self.rtt)
+
+
+class CountingPool:
+    def __init__(self, inner, counter, rtt):
+        self.inner = inner
+        self.counter = counter
+        self.rtt = rtt
+
+    async def acquire(self, timeout=None):
+        return CountingConnection(await self.inner.acquire(timeout=timeout), self.counter, self.rtt)
+
+    async def release(self, conn):
+        await self.inner.release(conn.inner)
+
+    def get_size(self):
+        return self.inner.get_size()
+
+    async def close(self):
+        await self.inner.close()
+
+
+async def _rtt(ms):
+    if ms > 0:
+        await asyncio.sleep(ms / 1000)
+
+
+# ---------- 内存替身 ----------
+
+class MemoryStore:
+    """user_track 各表的内存模拟：只保留唯一索引涉及的列，语义与 ON CONFLICT DO NOTHING 一致"""
+
+    def __init__(self):
+        self.projects = {}      # name -> (id, status)
+        self.events = {}        # (project_id, name) -> id
+        self.properties = {}    # (project_id, name) -> (id, data_type)
+        self.links = set()      # (event_id, property_id)
+        self.mappings = {}      # (project_name, distinct_id) -> (map_id, map_type, login_id)
+        self.next_id = 1
+
+    def _id(self):
+        self.next_id += 1
+        return self.next_id
+
+    def upsert_projects(self, names):
+        new = []
+        for name in names:
+            if name not in self.projects:
+                self.projects[name] = (self._id(), 1)
+                new.append(name)
+        return new
+
+    def upsert_events(self, pids, names):
+        new = []
+        for key in zip(pids, names):
+            if key not in self.events:
+                self.events[key] = self._id()
+                new.append(key)
+        return new
+
+    def upsert_properties(self, pids, names, dts):
+        new = []
+        for pid, name, dt in zip(pids, names, dts):
+            if (pid, name) not in self.properties:
+                self.properties[(pid, name)] = (self._id(), dt)
+                new.append((pid, name))
+        return new
+
+    def upsert_links(self, eids, pids):
+        before = len(self.links)
+        self.links.update(zip(eids, pids))
+        return len(self.links) - before
+
+    def upsert_mappings(self, *cols):
+        n = 0
+        for pn, did, map_id, map_type, login_id in zip(*cols):
+            if (pn, did) not in self.mappings:
+                self.mappings[(pn, did)] = (map_id, map_type, login_id)
+                n += 1
+        return n
+
+
+class MemoryTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class MemoryConnection:
+    """按 SQL 模板分派到 MemoryStore；遇到未知语句直接报错，提醒同步更新替身"""
+
+    def __init__(self, store: MemoryStore, m):
+        self.store = store
+        self.m = m
+
+    def transaction(self):
+        return MemoryTransaction()
+
+    async def execute(self, sql, *args):
+        m, st = self.m, self.store
+        if sql == m.SQL_BATCH_UPSERT_PROJECTS:
+            return "INSERT 0 %d" % len(st.upsert_projects(args[0]))
+        if sql == m.SQL_BATCH_UPSERT_EVENTS:
+            return "INSERT 0 %d" % len(st.upsert_events(*args))
+        if sql == m.SQL_BATCH_UPSERT_PROPERTIES:
+            return "INSERT 0 %d" % len(st.upsert_properties(*args))
+        if sql == m.SQL_BATCH_UPSERT_EVENT_PROPERTY:
+            return "INSERT 0 %d" % st.upsert_links(*args)
+        if sql == m.SQL_BATCH_UPSERT_USER_ID_MAPPING:
+            return "INSERT 0 %d" % st.upsert_mappings(*args)
+        raise AssertionError("内存替身不支持的语句: %s" % sql.strip().splitlines()[0])
+
+    async def fetch(self, sql, *args):
+        m, st = self.m, self.store
+        if sql == m.SQL_BATCH_GET_PROJECT_IDS:
+            return [{"id": st.projects[n][0], "name": n} for n in args[0]
+                    if n in st.projects and st.projects[n][1] == 1]
+        if sql == m.SQL_BATCH_GET_EVENT_IDS:
+            return [{"id": st.events[k], "project_id": k[0], "name": k[1]} for k in zip(*args) if k in st.events]
+        if sql == m.SQL_BATCH_GET_PROPERTY_IDS:
+            return [{"id": st.properties[k][0], "project_id": k[0], "name": k[1]}
+                    for k in zip(*args) if k in st.properties]
+        if sql == m.SQL_UPSERT_RETURNING_PROJECTS:
+            new = set(st.upsert_projects(args[0]))
+            return [{"id": st.projects[n][0], "name": n, "status": st.projects[n][1], "inserted": n in new}
+                    for n in args[0]]
+        if sql == m.SQL_UPSERT_RETURNING_EVENTS_PROPERTIES:
+            new_events = set(st.upsert_events(args[0], args[1]))
+            new_props = set(st.upsert_properties(args[2], args[3], args[4]))
+            rows = [{"kind": "e", "id": st.events[k], "project_id": k[0], "name": k[1], "inserted": k in new_events}
+                    for k in zip(args[0], args[1])]
+            rows += [{"kind": "p", "id": st.properties[k][0], "project_id": k[0], "name": k[1],
+                      "inserted": k in new_props} for k in zip(args[2], args[3])]
+            return rows
+        if sql == m.SQL_UPSERT_LINKS_AND_MAPPINGS:
+            return [{"links": st.upsert_links(args[0], args[1]), "mappings": st.upsert_mappings(*args[2:])}]
+        if sql in (m.SQL_WARM_PROJECTS, m.SQL_WARM_EVENTS, m.SQL_WARM_PROPERTIES, m.SQL_WARM_EVENT_PROPERTY,
+                   m.SQL_CATALOG_PROJECTS, m.SQL_CATALOG_EVENTS, m.SQL_CATALOG_PROPERTIES):
+            return []
+        raise AssertionError("内存替身不支持的语句: %s" % sql.strip().splitlines()[0])
+
+
+class MemoryPool:
+    def __init__(self, m):
+        self.store = MemoryStore()
+        self.m = m
+
+    async def acquire(self, timeout=None):
+        return MemoryConnection(self.store, self.m)
+
+    async def release(self, conn):
+        pass
+
+    def get_size(self):
+        return 1
+
+    async def close(self):
+        pass
+
+
+# ---------- 一次性 PostgreSQL ----------
+
+async def create_scratch_db(admin_dsn) -> str:
+    """新建临时数据库并执行 user_track 初始化脚本，返回其 DSN"""
+    import asyncpg
+    name = "meta_bench_%d_%d" % (os.getpid(), random.randrange(1 << 30))
+    admin = await asyncpg.connect(admin_dsn)
+    try:
+        await admin.execute('CREATE DATABASE "%s"' % name)
+    finally:
+        await admin.close()
+    dsn = _with_database(admin_dsn, name)
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(INIT_SQL.read_text(encoding="utf-8"))
+    finally:
+        await conn.close()
+    return dsn
+
+
+async def drop_scratch_db(admin_dsn, dsn):
+    import asyncpg
+    admin = await asyncpg.connect(admin_dsn)
+    try:
+        await admin.execute('DROP DATABASE IF EXISTS "%s" WITH (FORCE)' % _database_of(dsn))
+    finally:
+        await admin.close()
+
+
+def _with_database(dsn, name):
+    base, sep, query = dsn.partition("?")
+    return base.rsplit("/", 1)[0] + "/" + name + sep + query
+
+
+def _database_of(dsn):
+    return dsn.partition("?")[0].rsplit("/", 1)[1]
+
+
+# ---------- 驱动 ----------
+
+async def call_register(app, body: bytes, encoding=None) -> int:
+    """直接以 ASGI 调用 POST /register，返回状态码"""
+    headers = [(b"content-type", b"application/x-ndjson"), (b"content-length", str(len(body)).encode())]
+    if encoding:
+        headers.append((b"content-encoding", encoding.encode()))
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+             "scheme": "http", "path": "/register", "raw_path": b"/register", "root_path": "",
+             "query_string": b"", "headers": headers, "client": ("127.0.0.1", 0), "server": ("bench", 80)}
+    sent = False
+    status = 0
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def _percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+async def run_scenario(m, name, workload, args) -> dict:
+    counter = TripCounter({getattr(m, k): k for k in dir(m) if k.startswith("SQL_")})
+    for cache in (m.project_cache, m.event_cache, m.property_cache, m.link_cache, m.mapping_cache):
+        cache.clear()
+
+    dsn = None
+    if args.backend == "pg":
+        dsn = await create_scratch_db(args.dsn)
+        m.PG_DSN = dsn
+    real_create_pool = m.asyncpg.create_pool
+
+    async def create_pool(*a, **kw):
+        inner = MemoryPool(m) if args.backend == "memory" else await real_create_pool(*a, **kw)
+        return CountingPool(inner, counter, args.rtt_ms)
+
+    gen = BatchGenerator(args.seed, **workload)
+    bodies = [gen.batch() for _ in range(args.warmup + args.batches)]
+    if args.gzip:
+        bodies = [gzip.compress(b, compresslevel=1) for b in bodies]
+    encoding = "gzip" if args.gzip else None
+
+    m.asyncpg.create_pool = create_pool
+    try:
+        async with m.lifespan(m.app):
+            for body in bodies[:args.warmup]:
+                await call_register(m.app, body, encoding)
+            counter.reset()
+            latencies = []
+            statuses = {}
+            queue = iter(bodies[args.warmup:])
+
+            async def worker():
+                for body in queue:
+                    t0 = time.perf_counter()
+                    status = await call_register(m.app, body, encoding)
+                    latencies.append(time.perf_counter() - t0)
+                    statuses[status] = statuses.get(status, 0) + 1
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+            elapsed = time.perf_counter() - start
+    finally:
+        m.asyncpg.create_pool = real_create_pool
+        if dsn is not None:
+            await drop_scratch_db(args.dsn, dsn)
+
+    latencies.sort()
+    events = args.batches * workload["batch_size"]
+    return {
+        "scenario": name, "backend": args.backend, "sql_mode": m.SQL_MODE, "coalesce": m.COALESCE_ENABLED,
+        "concurrency": args.concurrency, "gzip": args.gzip, "rtt_ms": args.rtt_ms, "workload": workload,
+        "batches": args.batches, "events": events, "elapsed_s": round(elapsed, 4),
+        "events_per_s": round(events / elapsed, 1) if elapsed > 0 else 0,
+        "batches_per_s": round(args.batches / elapsed, 1) if elapsed > 0 else 0,
+        "latency_ms": {"p50": round(_percentile(latencies, 50) * 1000, 3),
+                       "p99": round(_percentile(latencies, 99) * 1000, 3),
+                       "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+                       "mean": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0},
+        "status": {str(k): v for k, v in sorted(statuses.items())},
+        "sql": counter.snapshot(args.batches),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="meta-api /register 基准测试")
+    parser.add_argument("--backend", choices=("memory", "pg"), default="memory", help="SQL 后端 (默认 memory)")
+    parser.add_argument("--dsn", type=str, default=None, help="pg 后端的管理 DSN（用于新建/删除临时数据库）")
+    parser.add_argument("--scenario", choices=("all", *SCENARIOS), default="all", help="预置场景 (默认 all)")
+    parser.add_argument("--batches", type=int, default=200, help="每个场景计时的批次数 (默认 200)")
+    parser.add_argument("--warmup", type=int, default=20, help="计时前的预热批次数 (默认 20)")
+    parser.add_argument("--concurrency", type=int, default=1, help="并发请求数 (默认 1)")
+    parser.add_argument("--gzip", action="store_true", help="请求体 gzip 压缩（与 Vector sink 一致）")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="每次 SQL 往返附加的模拟延迟毫秒 (默认 0)")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子 (默认 1)")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="导入 meta_api 前设置的环境变量，如 META_SQL_MODE=returning，可重复")
+    parser.add_argument("--output", type=str, default=None, help="结果 JSON 数组写入文件（默认逐行打印到标准输出）")
+    for key, value in WORKLOAD_DEFAULTS.items():
+        parser.add_argument("--" + key.replace("_", "-"), type=type(value), default=None,
+                            help=f"负载参数，覆盖场景取值 (默认 {value})")
+    args = parser.parse_args()
+    if args.backend == "pg" and not args.dsn:
+        parser.error("--backend pg 需要 --dsn")
+
+    # meta_api 在导入时读取配置；基准只测 /register，默认关闭快照刷新与请求体卸载
+    os.environ.setdefault("META_SNAPSHOT_REFRESH_SECS", "0")
+    os.environ.setdefault("META_OFFLOAD_BYTES", "0")
+    for item in args.env:
+        key, _, value = item.partition("=")
+        os.environ[key] = value
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import logging
+    import meta_api as m
+    logging.getLogger("meta_api").setLevel(logging.WARNING)
+
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    results = []
+    for name in names:
+        workload = {**WORKLOAD_DEFAULTS, **SCENARIOS[name]}
+        workload.update({k: getattr(args, k) for k in WORKLOAD_DEFAULTS if getattr(args, k) is not None})
+        result = asyncio.run(run_scenario(m, name, workload, args))
+        results.append(result)
+        if not args.output:
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+        print(f"[bench] {name:9s} {result['events_per_s']:>12,.0f} events/s  "
+              f"p50 {result['latency_ms']['p50']:.2f}ms  p99 {result['latency_ms']['p99']:.2f}ms  "
+              f"{result['sql']['trips_per_batch']:.2f} trips/batch", file=sys.stderr)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,57 @@ v2 改进：
   - 连接池 max_size 3 → 20，支持多 Collection 节点并发
   - 批量 SQL：N 条事件只需 ~6 次 SQL（而非 N×M 次）
   - 使用 executemany 和 ANY() 数组查询
+  - 进程内 ID 缓存（LRU）：已注册的 project/event/property/关联直接命中，只对新 key 发 SQL
+  - 可选跨请求合并写（META_COALESCE=1）：并发批次的 key 合并去重后由单个后台任务统一写入
+  - 可选单往返模式（META_SQL_MODE=returning）：upsert 与取 ID 合并为一条语句，整批在一个事务内完成
+  - 按固定顺序写入各表的 key，避免并发批次互相等待唯一索引锁/死锁；死锁与序列化失败有限次退避重试
+  - /metrics 暴露 Prometheus 指标：解析/收集/各 SQL 阶段耗时、连接池等待与占用、新旧 key 数量
+  - /meta/snapshot/*.csv 导出带 ETag 的元数据快照，替代各 Collection 节点的 psql 全表导出
+  - 优先使用 orjson 解析；大请求体的解析与 Phase 1 收集放到线程/进程池，不阻塞事件循环
+  - 准入控制：限制在途批次数与请求体字节数、连接池获取超时，过载时快速返回 429/503 + Retry-After，
+    由 Vector 的重试与磁盘缓冲吸收积压
+  - 支持 Content-Encoding: gzip / deflate / zstd，流式解压并按块增量解析 NDJSON，不再整体缓冲请求体
+  - user_id_mapping 批内按 (project_name, distinct_id) 去重，已写入过的身份记入 LRU，重复绑定不再发 SQL
+  - 识别重放脚本注入的追踪标记事件（事件名以 META_MARKER_PREFIX 开头），记录发送 → 到达注册接口的延迟，
+    标记事件本身不注册
+  - 可选 LISTEN 元数据变更通知（META_CATALOG_CHANNEL）：各副本亚秒级增量更新快照并淘汰本地 ID 缓存，
+    /meta/changes 以 SSE 推送变更，/meta/snapshot?wait= 长轮询供 meta_sync.sh 使用
 """
 
 import os
+import io
+import csv
 import json
+import time
+import zlib
+import hashlib
+import random
+import asyncio
 import logging
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
 
 import asyncpg
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess,
+)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 logging.basicConfig(level=logging.INFO, format="[meta-api] %(asctime)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -31,19 +73,342 @@ PG_DSN = os.getenv(
     ),
 )
 
+# 每类 ID 缓存的最大条目数（0 = 关闭缓存）
+CACHE_SIZE = int(os.getenv("META_CACHE_SIZE", "50000"))
+# 已写入 user_id_mapping 的身份 (project_name, distinct_id) 缓存条目数（0 = 关闭）
+MAPPING_CACHE_SIZE = int(os.getenv("META_MAPPING_CACHE_SIZE", "500000"))
+# 项目 ID 缓存的有效期（秒，0 = 不过期）：命中缓存的项目跳过 status = 1 过滤，过期后重新查询，
+# 停用的项目最迟在该时间后停止自动注册（元数据视图刷新时还会立即淘汰已停用的项目）
+PROJECT_CACHE_TTL_SECS = float(os.getenv("META_PROJECT_CACHE_TTL_SECS", "60"))
+
+# SQL 模式：legacy = upsert 后再查询 ID；returning = 单条语句 upsert 并返回 ID，整批一个事务
+SQL_MODE = os.getenv("META_SQL_MODE", "legacy")
+
+# 死锁 / 序列化失败的重试次数与退避基数（指数退避 + 抖动）
+RETRY_MAX = int(os.getenv("META_RETRY_MAX", "3"))
+RETRY_BACKOFF_MS = int(os.getenv("META_RETRY_BACKOFF_MS", "50"))
+
+# 跨请求合并写：每 WINDOW_MS 毫秒或累计 MAX_KEYS 个 key 刷写一次
+COALESCE_ENABLED = os.getenv("META_COALESCE", "0") == "1"
+COALESCE_WINDOW_MS = int(os.getenv("META_COALESCE_WINDOW_MS", "20"))
+COALESCE_MAX_KEYS = int(os.getenv("META_COALESCE_MAX_KEYS", "5000"))
+
+# 元数据快照：增量刷新间隔（0 = 关闭）、全量重读间隔、update_time 水位回看窗口
+SNAPSHOT_REFRESH_SECS = float(os.getenv("META_SNAPSHOT_REFRESH_SECS", "5"))
+SNAPSHOT_FULL_SECS = float(os.getenv("META_SNAPSHOT_FULL_SECS", "600"))
+SNAPSHOT_OVERLAP_SECS = float(os.getenv("META_SNAPSHOT_OVERLAP_SECS", "60"))
+
+# 元数据变更通知：非空时 LISTEN 该频道（04-init-user-track.sql 中的触发器在提交时发布），增量更新快照视图并推送给订阅者，
+# 不再按 META_SNAPSHOT_REFRESH_SECS 轮询；连接断开后按 RECONNECT_SECS 重连并全量重读一次。
+# DEBOUNCE_MS 内到达的通知合并渲染一次，PING_SECS 无通知时探活一次监听连接
+CATALOG_CHANNEL = os.getenv("META_CATALOG_CHANNEL", "")
+CATALOG_RECONNECT_SECS = float(os.getenv("META_CATALOG_RECONNECT_SECS", "2"))
+CATALOG_DEBOUNCE_MS = int(os.getenv("META_CATALOG_DEBOUNCE_MS", "50"))
+CATALOG_PING_SECS = float(os.getenv("META_CATALOG_PING_SECS", "30"))
+CATALOG_SUBSCRIBER_QUEUE = int(os.getenv("META_CATALOG_SUBSCRIBER_QUEUE", "256"))
+
+# 请求体 >= OFFLOAD_BYTES 时在线程/进程池中解析（0 = 始终在事件循环内解析）
+OFFLOAD_BYTES = int(os.getenv("META_OFFLOAD_BYTES", "262144"))
+# process 可绕开 GIL，对小批次尾延迟最友好；thread 无需跨进程传递数据但仍与事件循环争抢 GIL
+OFFLOAD_EXECUTOR = os.getenv("META_OFFLOAD_EXECUTOR", "process")  # process | thread
+OFFLOAD_WORKERS = int(os.getenv("META_OFFLOAD_WORKERS", "1"))
+
+# 准入控制：在途批次上限、在途请求体字节上限（0 = 不限制）、连接池获取超时（秒）、过载时建议的重试间隔
+MAX_INFLIGHT = int(os.getenv("META_MAX_INFLIGHT", "64"))
+MAX_INFLIGHT_BYTES = int(os.getenv("META_MAX_INFLIGHT_BYTES", str(64 * 1024 * 1024)))
+POOL_ACQUIRE_TIMEOUT = float(os.getenv("META_POOL_ACQUIRE_TIMEOUT", "5"))
+RETRY_AFTER_SECS = int(os.getenv("META_RETRY_AFTER_SECS", "2"))
+
+# 流式解析：每攒满 STREAM_BLOCK_BYTES 解压后的数据解析一次；解压后请求体上限（防解压炸弹）
+STREAM_BLOCK_BYTES = int(os.getenv("META_STREAM_BLOCK_BYTES", "262144"))
+MAX_BODY_BYTES = int(os.getenv("META_MAX_BODY_BYTES", str(64 * 1024 * 1024)))
+
+# 追踪标记：replay_logs.py --marker-interval 注入的事件，事件名唯一以保证每个标记都被 Vector 判为新事件
+MARKER_PREFIX = os.getenv("META_MARKER_PREFIX", "replay_marker_")
+MARKER_SENT_PROP = "tracer_sent_ms"
+MARKER_RECENT = int(os.getenv("META_MARKER_RECENT", "10000"))   # /stats 计算分位数保留的最近样本数
+
 pool: asyncpg.Pool = None
+coalescer = None
+catalog = None
+offload_executor = None
+
+
+# ---------- Prometheus 指标 ----------
+# uvicorn 多 worker 部署时设置 PROMETHEUS_MULTIPROC_DIR，/metrics 汇总所有 worker 的数据
+
+_LATENCY_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+
+PARSE_SECONDS = Histogram(
+    "meta_api_parse_seconds", "NDJSON 请求体解析耗时", buckets=_LATENCY_BUCKETS)
+COLLECT_SECONDS = Histogram(
+    "meta_api_collect_seconds", "Phase 1 收集唯一 key 耗时", buckets=_LATENCY_BUCKETS)
+SQL_PHASE_SECONDS = Histogram(
+    "meta_api_sql_phase_seconds", "Phase 2 各 SQL 阶段耗时", ["phase"], buckets=_LATENCY_BUCKETS)
+POOL_ACQUIRE_SECONDS = Histogram(
+    "meta_api_pool_acquire_seconds", "等待连接池分配连接的耗时", buckets=_LATENCY_BUCKETS)
+POOL_SIZE = Gauge(
+    "meta_api_pool_size", "连接池当前连接数", multiprocess_mode="livesum")
+POOL_IN_USE = Gauge(
+    "meta_api_pool_in_use", "连接池中正在使用的连接数", multiprocess_mode="livesum")
+BATCH_EVENTS = Histogram(
+    "meta_api_batch_events", "每个 /register 批次的事件数",
+    buckets=(1, 10, 25, 50, 100, 200, 500, 1000, 5000))
+KEYS_TOTAL = Counter(
+    "meta_api_keys_total",
+    "各阶段的 key 数量 (cached = 命中 ID 缓存, inserted = 写入新行, existing = 已存在被 ON CONFLICT 跳过)",
+    ["table", "state"])
+DROPPED_LINES = Counter(
+    "meta_api_dropped_lines_total", "无法解析而丢弃的 JSON 行数")
+CACHE_LOOKUPS = Counter(
+    "meta_api_cache_lookups_total", "ID 缓存查询次数", ["cache", "result"])
+WRITE_CONFLICTS = Counter(
+    "meta_api_write_conflicts_total", "死锁 / 序列化失败次数", ["kind"])
+WRITE_RETRIES = Counter(
+    "meta_api_write_retries_total", "因写入冲突进行的重试次数", ["outcome"])
+COALESCE_REQUESTS = Counter(
+    "meta_api_coalesce_requests_total", "进入合并写的请求数")
+COALESCE_FLUSHES = Counter(
+    "meta_api_coalesce_flushes_total", "合并写的刷写次数")
+COALESCE_KEYS = Counter(
+    "meta_api_coalesce_keys_total", "合并写的 key 数量 (submitted = 合并前, written = 合并去重后)", ["stage"])
+INFLIGHT_BATCHES = Gauge(
+    "meta_api_inflight_batches", "在途 /register 批次数", multiprocess_mode="livesum")
+INFLIGHT_BYTES = Gauge(
+    "meta_api_inflight_bytes", "在途 /register 请求体字节数", multiprocess_mode="livesum")
+REJECTED = Counter(
+    "meta_api_rejected_total", "因过载被拒绝的请求数", ["reason"])
+BODY_BYTES = Counter(
+    "meta_api_body_bytes_total", "/register 请求体字节数 (wire = 压缩后, decoded = 解压后)", ["stage"])
+SNAPSHOT_REQUESTS = Counter(
+    "meta_api_snapshot_requests_total", "元数据快照请求数", ["file", "status"])
+SNAPSHOT_REFRESH_SECONDS = Histogram(
+    "meta_api_snapshot_refresh_seconds", "元数据快照刷新耗时", ["mode"], buckets=_LATENCY_BUCKETS)
+CATALOG_CHANGES = Counter(
+    "meta_api_catalog_changes_total", "LISTEN 收到的元数据变更行数", ["table", "op"])
+CATALOG_RESYNCS = Counter(
+    "meta_api_catalog_resyncs_total", "监听连接（重新）建立后的全量重读次数")
+MARKER_LAG_SECONDS = Histogram(
+    "meta_api_marker_lag_seconds", "追踪标记从重放端发送到到达 /register 的延迟",
+    buckets=(.5, 1, 2, 5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 300, 600))
+
+
+class PoolExhausted(Exception):
+    """在 POOL_ACQUIRE_TIMEOUT 内未能从连接池获取连接"""
+
+
+@asynccontextmanager
+async def acquire():
+    """从连接池获取连接（超时抛出 PoolExhausted），记录等待耗时与池占用"""
+    t0 = time.perf_counter()
+    try:
+        conn = await pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT or None)
+    except asyncio.TimeoutError:
+        POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - t0)
+        raise PoolExhausted("连接池获取超时 (%.1fs)" % POOL_ACQUIRE_TIMEOUT) from None
+    POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - t0)
+    POOL_IN_USE.inc()
+    POOL_SIZE.set(pool.get_size())
+    try:
+        yield conn
+    finally:
+        POOL_IN_USE.dec()
+        await pool.release(conn)
+
+
+class AdmissionControl:
+    """限制在途批次数与请求体字节数；超限的请求直接拒绝，而不是排队等待连接池"""
+
+    def __init__(self, max_inflight: int, max_bytes: int):
+        self.max_inflight = max_inflight
+        self.max_bytes = max_bytes
+        self.inflight = 0
+        self.inflight_bytes = 0
+
+    def try_admit(self, nbytes: int):
+        """准入成功返回 None，否则返回拒绝原因"""
+        if self.max_inflight > 0 and self.inflight >= self.max_inflight:
+            return "inflight"
+        # 至少放行一个批次，避免单个超大请求永远无法被处理
+        if self.max_bytes > 0 and self.inflight > 0 and self.inflight_bytes + nbytes > self.max_bytes:
+            return "bytes"
+        self.inflight += 1
+        self.inflight_bytes += nbytes
+        INFLIGHT_BATCHES.inc()
+        INFLIGHT_BYTES.inc(nbytes)
+        return None
+
+    def try_grow(self, nbytes: int) -> bool:
+        """为已准入的请求追加占用 nbytes 字节；还有其他在途批次且追加后超出字节上限时返回 False"""
+        if self.max_bytes > 0 and self.inflight > 1 and self.inflight_bytes + nbytes > self.max_bytes:
+            return False
+        self.inflight_bytes += nbytes
+        INFLIGHT_BYTES.inc(nbytes)
+        return True
+
+    def release(self, nbytes: int):
+        self.inflight -= 1
+        self.inflight_bytes -= nbytes
+        INFLIGHT_BATCHES.dec()
+        INFLIGHT_BYTES.dec(nbytes)
+
+
+class AdmissionTicket:
+    """单个请求在 AdmissionControl 中占用的字节数：准入时按 Content-Length 计入，
+    读取请求体时按实际收到 / 解压出的字节数追加（chunked、无 Content-Length 或压缩的请求体）"""
+
+    def __init__(self, control: AdmissionControl, nbytes: int):
+        self.control = control
+        self.nbytes = nbytes
+
+    def cover(self, total: int) -> bool:
+        """确保占用不少于 total 字节；追加会超出字节上限时返回 False"""
+        if total <= self.nbytes:
+            return True
+        if not self.control.try_grow(total - self.nbytes):
+            return False
+        self.nbytes = total
+        return True
+
+
+admission = AdmissionControl(MAX_INFLIGHT, MAX_INFLIGHT_BYTES)
+
+
+def overloaded(status_code: int, reason: str) -> JSONResponse:
+    REJECTED.labels(reason).inc()
+    return JSONResponse({"ok": False, "error": reason}, status_code=status_code,
+                        headers={"Retry-After": str(RETRY_AFTER_SECS)})
+
+
+# ---------- 进程内 ID 缓存 ----------
+
+class LRUCache:
+    """有界 LRU 缓存，超出 maxsize 时淘汰最久未访问的条目；ttl > 0 时条目写入 ttl 秒后过期"""
+
+    def __init__(self, maxsize: int, name: str, ttl: float = 0.0):
+        self.maxsize = maxsize
+        self.name = name
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._hit_counter = CACHE_LOOKUPS.labels(name, "hit")
+        self._miss_counter = CACHE_LOOKUPS.labels(name, "miss")
+
+    def get(self, key):
+        if self.maxsize <= 0:
+            return None
+        value = self._data.get(key)
+        if value is not None and self.ttl > 0:
+            value, expires = value
+            if time.monotonic() >= expires:
+                del self._data[key]
+                value = None
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def record(self, hits: int, misses: int):
+        """把一批查找的命中/未命中数一次性计入 Prometheus（多进程模式下每次 inc 都是一次 mmap 写入）"""
+        if self.maxsize <= 0:
+            return
+        if hits:
+            self._hit_counter.inc(hits)
+        if misses:
+            self._miss_counter.inc(misses)
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (value, time.monotonic() + self.ttl) if self.ttl > 0 else value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key):
+        self._data.pop(key, None)
+
+    def prune(self, keep):
+        """淘汰 keep(key, value) 为假的条目，返回淘汰数"""
+        stale = [k for k, v in self._data.items() if not keep(k, v[0] if self.ttl > 0 else v)]
+        for k in stale:
+            del self._data[k]
+        return len(stale)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+project_cache = LRUCache(CACHE_SIZE, "project", PROJECT_CACHE_TTL_SECS)  # project_name -> project_id
+event_cache = LRUCache(CACHE_SIZE, "event")              # (project_id, event_name) -> event_id
+property_cache = LRUCache(CACHE_SIZE, "property")        # (project_id, property_name) -> property_id
+link_cache = LRUCache(CACHE_SIZE, "event_property")      # (event_id, property_id) -> True
+mapping_cache = LRUCache(MAPPING_CACHE_SIZE, "user_id_mapping")  # (project_name, distinct_id) -> True
+
+
+async def warm_caches(conn):
+    """启动时从 user_track.* 预热 ID 缓存（优先加载最新的定义）"""
+    if CACHE_SIZE <= 0:
+        return
+    for r in await conn.fetch(SQL_WARM_PROJECTS):
+        project_cache.put(r["name"], r["id"])
+    for r in reversed(await conn.fetch(SQL_WARM_EVENTS, CACHE_SIZE)):
+        event_cache.put((r["project_id"], r["name"]), r["id"])
+    for r in reversed(await conn.fetch(SQL_WARM_PROPERTIES, CACHE_SIZE)):
+        property_cache.put((r["project_id"], r["name"]), r["id"])
+    for r in reversed(await conn.fetch(SQL_WARM_EVENT_PROPERTY, CACHE_SIZE)):
+        link_cache.put((r["event_id"], r["property_id"]), True)
+    logger.info("ID 缓存已预热: %d 项目, %d 事件, %d 属性, %d 关联",
+                len(project_cache), len(event_cache), len(property_cache), len(link_cache))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global pool
+    global pool, coalescer, catalog, offload_executor
     pool = await asyncpg.create_pool(
         PG_DSN,
         min_size=2,
         max_size=int(os.getenv("PG_POOL_MAX", "20")),
+        # 每个连接缓存的服务端预编译语句数（SQL 模板均为常量，首次 Parse 后复用）
+        statement_cache_size=int(os.getenv("PG_STMT_CACHE_SIZE", "100")),
     )
-    logger.info("连接池已创建 (max=%s): %s", os.getenv("PG_POOL_MAX", "20"), PG_DSN.split("@")[-1])
+    logger.info("连接池已创建 (max=%s, sql_mode=%s): %s",
+                os.getenv("PG_POOL_MAX", "20"), SQL_MODE, PG_DSN.split("@")[-1])
+    try:
+        async with acquire() as conn:
+            await warm_caches(conn)
+    except Exception as e:
+        # 预热失败不影响服务启动，缓存会在请求中逐步填充
+        logger.warning("ID 缓存预热失败: %s", e)
+    if COALESCE_ENABLED:
+        coalescer = WriteCoalescer(COALESCE_WINDOW_MS, COALESCE_MAX_KEYS)
+        coalescer.start()
+        logger.info("合并写已开启 (window=%dms, max_keys=%d)", COALESCE_WINDOW_MS, COALESCE_MAX_KEYS)
+    if OFFLOAD_BYTES > 0:
+        executor_cls = ProcessPoolExecutor if OFFLOAD_EXECUTOR == "process" else ThreadPoolExecutor
+        offload_executor = executor_cls(max_workers=OFFLOAD_WORKERS)
+    refresh_task = None
+    if CATALOG_CHANNEL:
+        catalog = CatalogView()
+        refresh_task = asyncio.create_task(catalog.listen(CATALOG_CHANNEL))
+    elif SNAPSHOT_REFRESH_SECS > 0:
+        catalog = CatalogView()
+        refresh_task = asyncio.create_task(catalog.run(SNAPSHOT_REFRESH_SECS))
     yield
+    if refresh_task is not None:
+        refresh_task.cancel()
+    if coalescer is not None:
+        await coalescer.stop()
+    if offload_executor is not None:
+        offload_executor.shutdown(wait=False, cancel_futures=True)
     await pool.close()
 
 
@@ -101,6 +466,100 @@ SELECT unnest($1::text[]), unnest($2::text[]), unnest($3::text[]), unnest($4::te
 ON CONFLICT (project_name, distinct_id) DO NOTHING;
 """
 
+# ---------- 单往返 SQL 模板（META_SQL_MODE=returning）----------
+# 新插入的行取自 RETURNING，已存在的行取自同一语句内对原表的关联查询（语句快照看不到本语句插入的行，两部分不重复）
+
+# 2a) upsert 项目并返回 ID（含 status，供调用方过滤已停用项目）
+SQL_UPSERT_RETURNING_PROJECTS = """
+WITH input AS (
+    SELECT unnest($1::text[]) AS name
+), ins AS (
+    INSERT INTO user_track.project (name, is_auto_create, status, create_time)
+    SELECT name, 1, 1, NOW() FROM input
+    ON CONFLICT (name) DO NOTHING
+    RETURNING id, name, status
+)
+SELECT id, name, status, true AS inserted FROM ins
+UNION ALL
+SELECT p.id, p.name, p.status, false FROM user_track.project p JOIN input i ON p.name = i.name;
+"""
+
+# 2b + 2c) 同时 upsert 事件和属性并返回 ID，kind: 'e' = 事件, 'p' = 属性，inserted 标记本语句新插入的行
+SQL_UPSERT_RETURNING_EVENTS_PROPERTIES = """
+WITH ev_input AS (
+    SELECT * FROM unnest($1::int[], $2::text[]) AS t(project_id, name)
+), ev_ins AS (
+    INSERT INTO user_track.event_define (project_id, name, accepted, create_time, update_time)
+    SELECT project_id, name, 1, NOW(), NOW() FROM ev_input
+    ON CONFLICT (project_id, name) DO NOTHING
+    RETURNING id, project_id, name
+), pr_input AS (
+    SELECT * FROM unnest($3::int[], $4::text[], $5::int[]) AS t(project_id, name, data_type)
+), pr_ins AS (
+    INSERT INTO user_track.property_define (project_id, name, data_type, is_in_use, is_load, create_time, update_time)
+    SELECT project_id, name, data_type, 1, 1, NOW(), NOW() FROM pr_input
+    ON CONFLICT (name, project_id) DO NOTHING
+    RETURNING id, project_id, name
+)
+SELECT 'e' AS kind, id, project_id, name, true AS inserted FROM ev_ins
+UNION ALL
+SELECT 'e', e.id, e.project_id, e.name, false FROM user_track.event_define e
+JOIN ev_input i ON e.project_id = i.project_id AND e.name = i.name
+UNION ALL
+SELECT 'p', id, project_id, name, true FROM pr_ins
+UNION ALL
+SELECT 'p', d.id, d.project_id, d.name, false FROM user_track.property_define d
+JOIN pr_input i ON d.project_id = i.project_id AND d.name = i.name;
+"""
+
+# 2d + 2e) 事件-属性关联与 user_id_mapping 无需返回 ID，合并为一条语句，只返回各自新插入的行数
+SQL_UPSERT_LINKS_AND_MAPPINGS = """
+WITH ep AS (
+    INSERT INTO user_track.event_property (event_id, property_id, update_time)
+    SELECT unnest($1::int[]), unnest($2::int[]), NOW()
+    ON CONFLICT (event_id, property_id) DO NOTHING
+    RETURNING 1
+), um AS (
+    INSERT INTO user_track.user_id_mapping (project_name, distinct_id, map_id, map_type, login_id, load_time)
+    SELECT unnest($3::text[]), unnest($4::text[]), unnest($5::text[]), unnest($6::text[]), unnest($7::text[]), NOW()
+    ON CONFLICT (project_name, distinct_id) DO NOTHING
+    RETURNING 1
+)
+SELECT (SELECT count(*) FROM ep) AS links, (SELECT count(*) FROM um) AS mappings;
+"""
+
+# 元数据快照：项目全量读取（表很小），事件/属性按 update_time 水位增量读取（$1 为 NULL 时全量）
+SQL_CATALOG_PROJECTS = """
+SELECT id, name, is_auto_create, status FROM user_track.project;
+"""
+
+SQL_CATALOG_EVENTS = """
+SELECT id, project_id, name, accepted, update_time FROM user_track.event_define
+WHERE $1::timestamp IS NULL OR update_time > $1::timestamp;
+"""
+
+SQL_CATALOG_PROPERTIES = """
+SELECT id, project_id, name, data_type, is_in_use, update_time FROM user_track.property_define
+WHERE $1::timestamp IS NULL OR update_time > $1::timestamp;
+"""
+
+# 缓存预热
+SQL_WARM_PROJECTS = """
+SELECT id, name FROM user_track.project WHERE status = 1;
+"""
+
+SQL_WARM_EVENTS = """
+SELECT id, project_id, name FROM user_track.event_define ORDER BY id DESC LIMIT $1;
+"""
+
+SQL_WARM_PROPERTIES = """
+SELECT id, project_id, name FROM user_track.property_define ORDER BY id DESC LIMIT $1;
+"""
+
+SQL_WARM_EVENT_PROPERTY = """
+SELECT event_id, property_id FROM user_track.event_property ORDER BY id DESC LIMIT $1;
+"""
+
 
 def infer_data_type(value) -> int:
     """推断属性数据类型
@@ -129,29 +588,26 @@ def infer_data_type(value) -> int:
     return 2
 
 
-@app.post("/register")
-async def register_metadata(request: Request):
-    """接收 Vector HTTP Sink 的 NDJSON 批次 — 批量注册"""
-    body = await request.body()
-    events = []
-    for line in body.decode("utf-8", errors="replace").strip().split("\n"):
-        line = line.strip()
-        if line:
-            try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
+@dataclass
+class BatchKeys:
+    """Phase 1 的收集结果：一个批次中所有唯一的 project / event / property / 关联 / ID 映射"""
+    unique_projects: set = field(default_factory=set)
+    event_tuples: set = field(default_factory=set)        # (project_name, event_name)
+    prop_tuples: list = field(default_factory=list)       # (project_name, prop_key, data_type)
+    event_prop_links: list = field(default_factory=list)  # (project_name, event_name, prop_key)
+    user_mappings: list = field(default_factory=list)     # (project_name, distinct_id, map_id, map_type, login_id)
+    markers: list = field(default_factory=list)           # (tracer_id, sent_ms)，不参与注册
 
-    if not events:
-        return {"ok": True, "registered": 0}
+    def key_count(self) -> int:
+        return (len(self.unique_projects) + len(self.event_tuples) + len(self.prop_tuples)
+                + len(self.event_prop_links) + len(self.user_mappings))
 
-    # ---- Phase 1: 收集所有唯一的 project / event / property ----
-    unique_projects = set()
-    event_tuples = set()          # (project_name, event_name)
-    prop_tuples = []              # (project_name, prop_key, data_type)
+
+def collect_keys(events) -> BatchKeys:
+    """Phase 1: 收集所有唯一的 project / event / property"""
+    keys = BatchKeys()
     prop_tuples_dedup = set()
-    user_mappings = []            # (project_name, distinct_id, map_id, map_type, login_id)
-    event_prop_links = []         # (project_name, event_name, prop_key)
+    mapping_dedup = set()
 
     for evt in events:
         project_name = evt.get("project", "")
@@ -163,17 +619,21 @@ async def register_metadata(request: Request):
         if not project_name:
             continue
 
-        unique_projects.add(project_name)
+        if isinstance(event_name, str) and event_name.startswith(MARKER_PREFIX):
+            _collect_marker(keys, evt)
+            continue
+
+        keys.unique_projects.add(project_name)
 
         if event_name:
-            event_tuples.add((project_name, event_name))
+            keys.event_tuples.add((project_name, event_name))
 
         # 解析 properties
         props_dict = {}
         if isinstance(properties_raw, str):
             try:
-                props_dict = json.loads(properties_raw)
-            except (json.JSONDecodeError, TypeError):
+                props_dict = _json_loads(properties_raw)
+            except (ValueError, TypeError):
                 pass
         elif isinstance(properties_raw, dict):
             props_dict = properties_raw
@@ -185,108 +645,1114 @@ async def register_metadata(request: Request):
             if dedup_key not in prop_tuples_dedup:
                 prop_tuples_dedup.add(dedup_key)
                 value = props_dict.get(key)
-                prop_tuples.append((project_name, key, infer_data_type(value)))
+                keys.prop_tuples.append((project_name, key, infer_data_type(value)))
             if event_name:
-                event_prop_links.append((project_name, event_name, key))
+                keys.event_prop_links.append((project_name, event_name, key))
 
         # user_id_mapping
         if event_type in ("track_signup", "track_id_bind"):
             distinct_id = evt.get("distinct_id", "")
             login_id = evt.get("login_id", "")
             original_id = evt.get("original_id", "")
+            mapping = None
             if distinct_id:
                 if event_type == "track_signup" and original_id:
                     map_id = distinct_id if login_id else distinct_id
                     map_type = "login_id" if login_id and distinct_id == login_id else "anonymous_id"
-                    user_mappings.append((project_name, original_id, map_id, map_type, login_id or ""))
+                    mapping = (project_name, original_id, map_id, map_type, login_id or "")
                 elif login_id and login_id != "-1":
-                    user_mappings.append((project_name, distinct_id, login_id, "login_id", login_id))
-
-    # ---- Phase 2: 批量 SQL ----
-    async with pool.acquire() as conn:
-        # 2a) 批量 upsert + 获取 project IDs
-        project_names = list(unique_projects)
-        if project_names:
-            await conn.execute(SQL_BATCH_UPSERT_PROJECTS, project_names)
-            rows = await conn.fetch(SQL_BATCH_GET_PROJECT_IDS, project_names)
-            pid_map = {r["name"]: r["id"] for r in rows}
+                    mapping = (project_name, distinct_id, login_id, "login_id", login_id)
+            # 主键冲突时 DO NOTHING，同一批内只有首次出现的映射会生效
+            if mapping is not None and (mapping[0], mapping[1]) not in mapping_dedup:
+                mapping_dedup.add((mapping[0], mapping[1]))
+                keys.user_mappings.append(mapping)
+
+    return keys
+
+
+def _collect_marker(keys: BatchKeys, evt):
+    props = evt.get("properties")
+    if isinstance(props, str):
+        try:
+            props = _json_loads(props)
+        except (ValueError, TypeError):
+            props = None
+    sent = props.get(MARKER_SENT_PROP) if isinstance(props, dict) else None
+    if isinstance(sent, (int, float)):
+        keys.markers.append((evt["event"][len(MARKER_PREFIX):], sent))
+
+
+class MarkerTracker:
+    """记录追踪标记的到达延迟：Prometheus 直方图（多 worker 汇总）+ 本 worker 最近样本（/stats 分位数）"""
+
+    def __init__(self, recent: int):
+        self.seen = 0
+        self.recent = deque(maxlen=recent)      # (tracer_id, 延迟秒数)
+
+    def observe(self, markers):
+        now_ms = time.time() * 1000
+        for tracer_id, sent_ms in markers:
+            lag = max(0.0, (now_ms - sent_ms) / 1000)
+            MARKER_LAG_SECONDS.observe(lag)
+            self.recent.append((tracer_id, lag))
+            self.seen += 1
+
+    def stats(self) -> dict:
+        lags = sorted(lag for _, lag in self.recent)
+        if not lags:
+            return {"seen": self.seen}
+        pick = lambda p: round(lags[min(len(lags) - 1, int(len(lags) * p / 100))], 3)
+        return {"seen": self.seen, "lag_seconds": {"p50": pick(50), "p90": pick(90), "p99": pick(99),
+                                                   "max": round(lags[-1], 3)},
+                "last": [{"id": i, "lag_seconds": round(lag, 3)} for i, lag in list(self.recent)[-10:]]}
+
+
+markers = MarkerTracker(MARKER_RECENT)
+
+
+def _split_cached(cache: LRUCache, items, key_of):
+    """按 ID 缓存拆分：返回 (已命中的 {key: id}, 未命中的条目列表)"""
+    known = {}
+    missing = []
+    for item in items:
+        k = key_of(item)
+        cached = cache.get(k)
+        if cached is None:
+            missing.append(item)
         else:
-            pid_map = {}
-
-        # 2b) 批量 upsert + 获取 event IDs
-        if event_tuples:
-            e_pids = [pid_map.get(pn) for pn, en in event_tuples]
-            e_names = [en for pn, en in event_tuples]
-            # 过滤掉 project 未找到的
-            valid = [(p, n) for p, n in zip(e_pids, e_names) if p is not None]
-            if valid:
-                await conn.execute(SQL_BATCH_UPSERT_EVENTS,
-                                   [p for p, n in valid],
-                                   [n for p, n in valid])
-                rows = await conn.fetch(SQL_BATCH_GET_EVENT_IDS,
-                                        [p for p, n in valid],
-                                        [n for p, n in valid])
-                eid_map = {(r["project_id"], r["name"]): r["id"] for r in rows}
+            known[k] = cached
+    cache.record(len(known), len(missing))
+    KEYS_TOTAL.labels(cache.name, "cached").inc(len(known))
+    return known, missing
+
+
+def _inserted(status: str) -> int:
+    """execute 返回的命令标签 "INSERT 0 N" 中的新插入行数 N"""
+    return int(status.rsplit(" ", 1)[-1])
+
+
+def _count_written(tally: list):
+    """tally 为 [(缓存名, 发往 PostgreSQL 的 key 数, 实际新插入的行数), ...]"""
+    for name, sent, inserted in tally:
+        KEYS_TOTAL.labels(name, "inserted").inc(inserted)
+        KEYS_TOTAL.labels(name, "existing").inc(sent - inserted)
+
+
+# 锁冲突统计：死锁、序列化失败、重试次数、重试耗尽次数
+contention_stats = {"deadlocks": 0, "serialization_failures": 0, "retries": 0, "exhausted": 0}
+
+
+async def write_keys(conn, keys: BatchKeys):
+    """Phase 2: 批量 SQL — 先查 ID 缓存，只对未命中的 key 执行写入
+
+    returning 模式下整批在一个事务内完成；ID 缓存在写入成功后才更新，避免缓存已回滚的 ID。
+    所有写入均为 ON CONFLICT DO NOTHING，遇到死锁/序列化失败时整批重试是幂等的。
+    新插入 / 已存在的 key 数在语句生效后计入 KEYS_TOTAL：legacy 模式每条语句自动提交，失败前已执行的语句照常计数；
+    returning 模式只计已提交的事务。
+    """
+    attempt = 0
+    while True:
+        tally = []
+        try:
+            if SQL_MODE == "returning":
+                async with conn.transaction():
+                    learned = await _write_keys_returning(conn, keys, tally)
             else:
-                eid_map = {}
-        else:
-            eid_map = {}
-
-        # 2c) 批量 upsert + 获取 property IDs
-        if prop_tuples:
-            p_pids = [pid_map.get(pn) for pn, key, dt in prop_tuples]
-            p_names = [key for pn, key, dt in prop_tuples]
-            p_types = [dt for pn, key, dt in prop_tuples]
-            valid_idx = [i for i, p in enumerate(p_pids) if p is not None]
-            if valid_idx:
-                await conn.execute(SQL_BATCH_UPSERT_PROPERTIES,
-                                   [p_pids[i] for i in valid_idx],
-                                   [p_names[i] for i in valid_idx],
-                                   [p_types[i] for i in valid_idx])
-                rows = await conn.fetch(SQL_BATCH_GET_PROPERTY_IDS,
-                                        [p_pids[i] for i in valid_idx],
-                                        [p_names[i] for i in valid_idx])
-                propid_map = {(r["project_id"], r["name"]): r["id"] for r in rows}
+                learned = await _write_keys_legacy(conn, keys, tally)
+            _count_written(tally)
+            break
+        except (asyncpg.exceptions.DeadlockDetectedError, asyncpg.exceptions.SerializationError) as e:
+            if SQL_MODE != "returning":
+                _count_written(tally)
+            if isinstance(e, asyncpg.exceptions.DeadlockDetectedError):
+                contention_stats["deadlocks"] += 1
+                WRITE_CONFLICTS.labels("deadlock").inc()
+            else:
+                contention_stats["serialization_failures"] += 1
+                WRITE_CONFLICTS.labels("serialization").inc()
+            if attempt >= RETRY_MAX:
+                contention_stats["exhausted"] += 1
+                WRITE_RETRIES.labels("exhausted").inc()
+                raise
+            contention_stats["retries"] += 1
+            WRITE_RETRIES.labels("retried").inc()
+            delay = RETRY_BACKOFF_MS / 1000 * (2 ** attempt)
+            attempt += 1
+            logger.warning("写入冲突 (%s)，%.0fms 后第 %d 次重试", type(e).__name__, delay * 1000, attempt)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+        except Exception:
+            if SQL_MODE != "returning":
+                _count_written(tally)
+            raise
+    for cache, entries in learned:
+        for k, v in entries.items():
+            cache.put(k, v)
+
+
+# 待写入的 key 均按各表唯一索引的列顺序排序，使并发批次以相同顺序获取唯一索引上的行锁：
+#   project(name) / event_define(project_id, name) / property_define(name, project_id)
+#   event_property(event_id, property_id) / user_id_mapping(project_name, distinct_id)
+
+def _prop_lock_key(t):
+    return t[1], t[0]
+
+
+def _mapping_key(m):
+    return m[0], m[1]
+
+
+def _split_mappings(keys: BatchKeys) -> list:
+    """过滤掉已写入过的身份，剩余 user_id_mapping 按主键 (project_name, distinct_id) 排序
+
+    写入为 ON CONFLICT DO NOTHING，主键一旦存在后续同 key 的写入都不会生效，因此命中缓存即可跳过。
+    """
+    _, mappings = _split_cached(mapping_cache, keys.user_mappings, _mapping_key)
+    mappings.sort(key=_mapping_key)
+    return mappings
+
+
+def _resolve_links(keys: BatchKeys, pid_map: dict, eid_map: dict, propid_map: dict) -> list:
+    """将 (project_name, event_name, prop_key) 关联转换为未缓存的 (event_id, property_id)，按索引顺序排序"""
+    new_links = []
+    seen = set()
+    cached = 0
+    for pn, en, key in keys.event_prop_links:
+        pid = pid_map.get(pn)
+        if pid is None:
+            continue
+        eid = eid_map.get((pid, en))
+        prop_id = propid_map.get((pid, key))
+        if eid is not None and prop_id is not None:
+            pair = (eid, prop_id)
+            if pair not in seen:
+                seen.add(pair)
+                if link_cache.get(pair) is None:
+                    new_links.append(pair)
+                else:
+                    cached += 1
+    link_cache.record(cached, len(new_links))
+    KEYS_TOTAL.labels(link_cache.name, "cached").inc(cached)
+    new_links.sort()
+    return new_links
+
+
+async def _write_keys_legacy(conn, keys: BatchKeys, tally: list) -> list:
+    """每个阶段 upsert 后再查询 ID（每阶段两次往返，无事务）；每条写入语句执行后把插入行数记入 tally"""
+    # 2a) 批量 upsert + 获取 project IDs
+    pid_map, new_projects = _split_cached(project_cache, keys.unique_projects, lambda pn: pn)
+    new_projects.sort()
+    learned_projects = {}
+    if new_projects:
+        t0 = time.perf_counter()
+        status = await conn.execute(SQL_BATCH_UPSERT_PROJECTS, new_projects)
+        tally.append((project_cache.name, len(new_projects), _inserted(status)))
+        rows = await conn.fetch(SQL_BATCH_GET_PROJECT_IDS, new_projects)
+        learned_projects = {r["name"]: r["id"] for r in rows}
+        pid_map.update(learned_projects)
+        SQL_PHASE_SECONDS.labels("2a").observe(time.perf_counter() - t0)
+
+    # 2b) 批量 upsert + 获取 event IDs（过滤掉 project 未找到的）
+    valid_events = [(pid_map[pn], en) for pn, en in keys.event_tuples if pn in pid_map]
+    eid_map, new_events = _split_cached(event_cache, valid_events, lambda e: e)
+    new_events.sort()
+    learned_events = {}
+    if new_events:
+        t0 = time.perf_counter()
+        status = await conn.execute(SQL_BATCH_UPSERT_EVENTS,
+                                    [p for p, n in new_events],
+                                    [n for p, n in new_events])
+        tally.append((event_cache.name, len(new_events), _inserted(status)))
+        rows = await conn.fetch(SQL_BATCH_GET_EVENT_IDS,
+                                [p for p, n in new_events],
+                                [n for p, n in new_events])
+        learned_events = {(r["project_id"], r["name"]): r["id"] for r in rows}
+        eid_map.update(learned_events)
+        SQL_PHASE_SECONDS.labels("2b").observe(time.perf_counter() - t0)
+
+    # 2c) 批量 upsert + 获取 property IDs
+    valid_props = [(pid_map[pn], key, dt) for pn, key, dt in keys.prop_tuples if pn in pid_map]
+    propid_map, new_props = _split_cached(property_cache, valid_props, lambda t: (t[0], t[1]))
+    new_props.sort(key=_prop_lock_key)
+    learned_props = {}
+    if new_props:
+        t0 = time.perf_counter()
+        status = await conn.execute(SQL_BATCH_UPSERT_PROPERTIES,
+                                    [p for p, k, dt in new_props],
+                                    [k for p, k, dt in new_props],
+                                    [dt for p, k, dt in new_props])
+        tally.append((property_cache.name, len(new_props), _inserted(status)))
+        rows = await conn.fetch(SQL_BATCH_GET_PROPERTY_IDS,
+                                [p for p, k, dt in new_props],
+                                [k for p, k, dt in new_props])
+        learned_props = {(r["project_id"], r["name"]): r["id"] for r in rows}
+        propid_map.update(learned_props)
+        SQL_PHASE_SECONDS.labels("2c").observe(time.perf_counter() - t0)
+
+    # 2d) 批量 upsert 事件-属性关联
+    new_links = _resolve_links(keys, pid_map, eid_map, propid_map)
+    if new_links:
+        t0 = time.perf_counter()
+        status = await conn.execute(SQL_BATCH_UPSERT_EVENT_PROPERTY,
+                                    [e for e, p in new_links],
+                                    [p for e, p in new_links])
+        tally.append((link_cache.name, len(new_links), _inserted(status)))
+        SQL_PHASE_SECONDS.labels("2d").observe(time.perf_counter() - t0)
+
+    # 2e) 批量 upsert user_id_mapping
+    mappings = _split_mappings(keys)
+    if mappings:
+        t0 = time.perf_counter()
+        status = await conn.execute(SQL_BATCH_UPSERT_USER_ID_MAPPING,
+                                    [m[0] for m in mappings],
+                                    [m[1] for m in mappings],
+                                    [m[2] for m in mappings],
+                                    [m[3] for m in mappings],
+                                    [m[4] for m in mappings])
+        tally.append((mapping_cache.name, len(mappings), _inserted(status)))
+        SQL_PHASE_SECONDS.labels("2e").observe(time.perf_counter() - t0)
+
+    return [(project_cache, learned_projects), (event_cache, learned_events),
+            (property_cache, learned_props), (link_cache, dict.fromkeys(new_links, True)),
+            (mapping_cache, dict.fromkeys(map(_mapping_key, mappings), True))]
+
+
+async def _write_keys_returning(conn, keys: BatchKeys, tally: list) -> list:
+    """upsert 与取 ID 合并为单条语句：2a / 2b+2c / 2d+2e 各一次往返；插入行数取自语句的 inserted 标记 / 计数，记入 tally
+
+    极少数情况下并发事务在本语句快照之后提交了相同 key（DO NOTHING 跳过且快照不可见），
+    此时对缺失的 key 用 SQL_BATCH_GET_* 补查一次。
+    """
+    # 2a) 项目
+    pid_map, new_projects = _split_cached(project_cache, keys.unique_projects, lambda pn: pn)
+    new_projects.sort()
+    learned_projects = {}
+    if new_projects:
+        t0 = time.perf_counter()
+        rows = await conn.fetch(SQL_UPSERT_RETURNING_PROJECTS, new_projects)
+        tally.append((project_cache.name, len(new_projects), sum(1 for r in rows if r["inserted"])))
+        found = {r["name"] for r in rows}
+        learned_projects = {r["name"]: r["id"] for r in rows if r["status"] == 1}
+        missing = [pn for pn in new_projects if pn not in found]
+        if missing:
+            rows = await conn.fetch(SQL_BATCH_GET_PROJECT_IDS, missing)
+            learned_projects.update({r["name"]: r["id"] for r in rows})
+        pid_map.update(learned_projects)
+        SQL_PHASE_SECONDS.labels("2a").observe(time.perf_counter() - t0)
+
+    # 2b + 2c) 事件与属性
+    valid_events = [(pid_map[pn], en) for pn, en in keys.event_tuples if pn in pid_map]
+    eid_map, new_events = _split_cached(event_cache, valid_events, lambda e: e)
+    valid_props = [(pid_map[pn], key, dt) for pn, key, dt in keys.prop_tuples if pn in pid_map]
+    propid_map, new_props = _split_cached(property_cache, valid_props, lambda t: (t[0], t[1]))
+    new_events.sort()
+    new_props.sort(key=_prop_lock_key)
+    learned_events = {}
+    learned_props = {}
+    if new_events or new_props:
+        t0 = time.perf_counter()
+        rows = await conn.fetch(SQL_UPSERT_RETURNING_EVENTS_PROPERTIES,
+                                [p for p, n in new_events],
+                                [n for p, n in new_events],
+                                [p for p, k, dt in new_props],
+                                [k for p, k, dt in new_props],
+                                [dt for p, k, dt in new_props])
+        inserted = {"e": 0, "p": 0}
+        for r in rows:
+            target = learned_events if r["kind"] == "e" else learned_props
+            target[(r["project_id"], r["name"])] = r["id"]
+            inserted[r["kind"]] += r["inserted"]
+        tally.append((event_cache.name, len(new_events), inserted["e"]))
+        tally.append((property_cache.name, len(new_props), inserted["p"]))
+        missing_events = [e for e in new_events if e not in learned_events]
+        if missing_events:
+            rows = await conn.fetch(SQL_BATCH_GET_EVENT_IDS,
+                                    [p for p, n in missing_events],
+                                    [n for p, n in missing_events])
+            learned_events.update({(r["project_id"], r["name"]): r["id"] for r in rows})
+        missing_props = [(p, k) for p, k, dt in new_props if (p, k) not in learned_props]
+        if missing_props:
+            rows = await conn.fetch(SQL_BATCH_GET_PROPERTY_IDS,
+                                    [p for p, k in missing_props],
+                                    [k for p, k in missing_props])
+            learned_props.update({(r["project_id"], r["name"]): r["id"] for r in rows})
+        eid_map.update(learned_events)
+        propid_map.update(learned_props)
+        SQL_PHASE_SECONDS.labels("2b+2c").observe(time.perf_counter() - t0)
+
+    # 2d + 2e) 关联与 user_id_mapping
+    new_links = _resolve_links(keys, pid_map, eid_map, propid_map)
+    mappings = _split_mappings(keys)
+    if new_links or mappings:
+        t0 = time.perf_counter()
+        counts = (await conn.fetch(SQL_UPSERT_LINKS_AND_MAPPINGS,
+                                   [e for e, p in new_links],
+                                   [p for e, p in new_links],
+                                   [m[0] for m in mappings],
+                                   [m[1] for m in mappings],
+                                   [m[2] for m in mappings],
+                                   [m[3] for m in mappings],
+                                   [m[4] for m in mappings]))[0]
+        tally.append((link_cache.name, len(new_links), counts["links"]))
+        tally.append((mapping_cache.name, len(mappings), counts["mappings"]))
+        SQL_PHASE_SECONDS.labels("2d+2e").observe(time.perf_counter() - t0)
+
+    return [(project_cache, learned_projects), (event_cache, learned_events),
+            (property_cache, learned_props), (link_cache, dict.fromkeys(new_links, True)),
+            (mapping_cache, dict.fromkeys(map(_mapping_key, mappings), True))]
+
+
+class KeyMerger:
+    """将多个 BatchKeys 合并去重（属性按 (project, key)、user_id_mapping 按主键保留首次出现的值）"""
+
+    def __init__(self):
+        self.keys = BatchKeys()
+        self._prop_seen = set()
+        self._link_seen = set()
+        self._mapping_seen = set()
+
+    def absorb(self, keys: BatchKeys):
+        merged = self.keys
+        merged.unique_projects |= keys.unique_projects
+        merged.event_tuples |= keys.event_tuples
+        for t in keys.prop_tuples:
+            if (t[0], t[1]) not in self._prop_seen:
+                self._prop_seen.add((t[0], t[1]))
+                merged.prop_tuples.append(t)
+        for link in keys.event_prop_links:
+            if link not in self._link_seen:
+                self._link_seen.add(link)
+                merged.event_prop_links.append(link)
+        for m in keys.user_mappings:
+            if _mapping_key(m) not in self._mapping_seen:
+                self._mapping_seen.add(_mapping_key(m))
+                merged.user_mappings.append(m)
+        merged.markers.extend(keys.markers)
+
+
+@dataclass
+class ParsedBatch:
+    """NDJSON 解析 + Phase 1 收集的结果（可跨进程传递）"""
+    events: int
+    dropped: int
+    keys: BatchKeys
+    parse_seconds: float
+    collect_seconds: float
+
+
+def parse_ndjson(body: bytes):
+    """逐行解析 NDJSON，返回 (事件列表, 丢弃的行数)"""
+    events = []
+    dropped = 0
+    for line in body.decode("utf-8", errors="replace").strip().split("\n"):
+        line = line.strip()
+        if line:
+            try:
+                events.append(_json_loads(line))
+            except ValueError:
+                dropped += 1
+                continue
+    return events, dropped
+
+
+def parse_and_collect(body: bytes) -> ParsedBatch:
+    """解析请求体并收集唯一 key；纯 CPU 计算，可直接放到线程/进程池执行"""
+    t0 = time.perf_counter()
+    events, dropped = parse_ndjson(body)
+    t1 = time.perf_counter()
+    keys = collect_keys(events)
+    return ParsedBatch(len(events), dropped, keys, t1 - t0, time.perf_counter() - t1)
+
+
+# ---------- 跨请求合并写 ----------
+
+class WriteCoalescer:
+    """将并发请求的 Phase 1 结果合并去重，由单个后台任务按时间窗口/key 数量批量写入
+
+    每个请求在 submit() 中等待，直到包含其 key 的那次刷写完成（写入已提交）才返回。
+    合并写入失败时逐个请求单独重写，只有包含问题 key（超长名称、类型错误等）的请求失败。
+    """
+
+    def __init__(self, window_ms: int, max_keys: int):
+        self.window = window_ms / 1000
+        self.max_keys = max_keys
+        self._task = None
+        self._flushing = None   # 正在进行的刷写；stop() 取消 _run 后等待其完成
+        self._has_work = asyncio.Event()
+        self._full = asyncio.Event()
+        self._reset()
+        # 统计：合并前/后的 key 数量，用于衡量合并节省了多少写入
+        self.requests = 0
+        self.flushes = 0
+        self.keys_submitted = 0
+        self.keys_written = 0
+        self.fallbacks = 0
+
+    def _reset(self):
+        self._merger = KeyMerger()
+        self._pending = self._merger.keys
+        self._waiters = []      # (future, 该请求自己的 BatchKeys)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        # 取消 _run 不会中断进行中的刷写（已从 _waiters 摘出），等待其为各请求给出结果
+        if self._flushing is not None and not self._flushing.done():
+            await self._flushing
+        # 刷写剩余的 key，避免关闭时丢弃已接收的请求
+        if self._waiters:
+            await self._flush()
+
+    async def submit(self, keys: BatchKeys):
+        fut = asyncio.get_running_loop().create_future()
+        self._merger.absorb(keys)
+        self._waiters.append((fut, keys))
+        self.requests += 1
+        self.keys_submitted += keys.key_count()
+        COALESCE_REQUESTS.inc()
+        COALESCE_KEYS.labels("submitted").inc(keys.key_count())
+        self._has_work.set()
+        if self._pending.key_count() >= self.max_keys:
+            self._full.set()
+        await fut
+
+    async def _run(self):
+        while True:
+            await self._has_work.wait()
+            try:
+                await asyncio.wait_for(self._full.wait(), self.window)
+            except asyncio.TimeoutError:
+                pass
+            self._flushing = asyncio.ensure_future(self._flush())
+            await asyncio.shield(self._flushing)
+
+    async def _flush(self):
+        batch, waiters = self._pending, self._waiters
+        self._reset()
+        self._has_work.clear()
+        self._full.clear()
+        self.flushes += 1
+        self.keys_written += batch.key_count()
+        COALESCE_FLUSHES.inc()
+        COALESCE_KEYS.labels("written").inc(batch.key_count())
+        try:
+            async with acquire() as conn:
+                await write_keys(conn, batch)
+        except Exception as e:
+            if isinstance(e, PoolExhausted) or len(waiters) == 1:
+                logger.error("合并写入失败 (%d 个请求): %s", len(waiters), e)
+                for fut, _ in waiters:
+                    if not fut.done():
+                        fut.set_exception(e)
+                return
+            logger.warning("合并写入失败 (%d 个请求)，逐个请求单独写入: %s", len(waiters), e)
+            self.fallbacks += 1
+            await self._write_each(waiters)
+            return
+        for fut, _ in waiters:
+            if not fut.done():
+                fut.set_result(None)
+
+    async def _write_each(self, waiters):
+        for fut, keys in waiters:
+            if fut.done():
+                continue
+            try:
+                async with acquire() as conn:
+                    await write_keys(conn, keys)
+            except Exception as e:
+                logger.error("单独写入失败: %s", e)
+                fut.set_exception(e)
             else:
-                propid_map = {}
+                fut.set_result(None)
+
+    def stats(self) -> dict:
+        saved = self.keys_submitted - self.keys_written
+        return {
+            "requests": self.requests,
+            "flushes": self.flushes,
+            "keys_submitted": self.keys_submitted,
+            "keys_written": self.keys_written,
+            "keys_saved": saved,
+            "requests_per_flush": round(self.requests / self.flushes, 2) if self.flushes else 0,
+            "fallbacks": self.fallbacks,
+        }
+
+
+# ---------- 元数据快照导出 ----------
+
+class CatalogView:
+    """内存中的元数据视图，渲染为 Vector enrichment_tables 使用的三个 CSV 快照
+
+    轮询模式（run）：事件/属性按 update_time 水位增量刷新（回看 SNAPSHOT_OVERLAP_SECS 以覆盖晚提交的事务），
+    每 SNAPSHOT_FULL_SECS 全量重读一次以反映删除。
+    监听模式（listen）：LISTEN 触发器发布的变更通知，按行增量更新；先 LISTEN 再全量重读，
+    重读期间到达的通知随后按提交顺序应用（行状态幂等覆盖），断线重连后同样全量重读一次补齐缺口。
+    ETag 取 CSV 内容哈希，因此内容相同的副本 / worker 返回相同 ETag，节点在副本间切换也不会重复下载。
+    CSV 在后台任务中交给线程池渲染，渲染期间到达的多批变更合并为一次重新渲染。
+    """
+
+    FILES = ("projects.csv", "valid_events.csv", "valid_properties.csv")
+
+    def __init__(self):
+        self.projects = {}     # id -> (name, is_auto_create, status)
+        self.events = {}       # id -> (project_id, name, accepted)
+        self.properties = {}   # id -> (project_id, name, data_type, is_in_use)
+        self.watermark = None
+        self.full_loaded_at = 0.0
+        self.version = 0
+        self.snapshots = {}    # file -> (etag, body)
+        self.etag = None       # 三个文件 ETag 的组合，供 /meta/snapshot 长轮询比较
+        self.listening = False
+        self.subscribers = set()
+        self._pending = []
+        self._wake = asyncio.Event()
+        self._changed = asyncio.Event()
+        self._dirty = False
+        self._dirty_changes = None
+        self._render_task = None
+
+    async def listen(self, channel: str):
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(PG_DSN)
+                conn.add_termination_listener(self._on_terminate)
+                self._pending.clear()
+                await conn.add_listener(channel, self._on_notify)
+                await self.refresh(conn, full=True)
+                CATALOG_RESYNCS.inc()
+                self.listening = True
+                logger.info("元数据变更监听已建立: channel=%s", channel)
+                await self._consume(conn)
+                logger.warning("元数据变更监听连接已断开，%gs 后重连", CATALOG_RECONNECT_SECS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("元数据变更监听中断: %s", e)
+            finally:
+                self.listening = False
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+            await asyncio.sleep(CATALOG_RECONNECT_SECS)
+
+    def _on_notify(self, conn, pid, channel, payload):
+        self._pending.append(json.loads(payload))
+        self._wake.set()
+
+    def _on_terminate(self, conn):
+        self._wake.set()
+
+    async def _consume(self, conn):
+        """应用通知直到监听连接断开；无通知时定期探活，及时发现静默断开的连接"""
+        while not conn.is_closed():
+            try:
+                await asyncio.wait_for(self._wake.wait(), CATALOG_PING_SECS)
+            except asyncio.TimeoutError:
+                await conn.fetchval("SELECT 1", timeout=CATALOG_PING_SECS)
+                continue
+            if conn.is_closed():
+                break
+            await asyncio.sleep(CATALOG_DEBOUNCE_MS / 1000)
+            self._wake.clear()
+            changes, self._pending = self._pending, []
+            if changes:
+                self.apply(changes)
+
+    def apply(self, changes: list):
+        """按通知增量更新视图：{t: 表名, op: INSERT/UPDATE/DELETE, rows: [[id, 列...], ...]}；
+        项目停用/删除、事件/属性删除时同步淘汰本 worker 的 ID 缓存"""
+        targets = {"project": self.projects, "event_define": self.events, "property_define": self.properties}
+        caches = {"event_define": event_cache, "property_define": property_cache}
+        for change in changes:
+            table, op, rows = change["t"], change["op"], change["rows"]
+            target = targets.get(table)
+            if target is None:
+                continue
+            CATALOG_CHANGES.labels(table, op).inc(len(rows))
+            for row in rows:
+                if op == "DELETE":
+                    target.pop(row[0], None)
+                else:
+                    target[row[0]] = tuple(row[1:])
+                if table == "project":
+                    if op == "DELETE" or row[3] != 1:
+                        project_cache.discard(row[1])
+                elif op == "DELETE":
+                    caches[table].discard((row[1], row[2]))
+        self._mark_dirty(changes)
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=CATALOG_SUBSCRIBER_QUEUE)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    def _publish(self, message: dict):
+        """推送给所有订阅者；跟不上的订阅者丢弃最旧一条并放入 None，由其断开后按快照重新同步"""
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.subscribers.discard(queue)
+                queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def wait_changed(self, etag: str, timeout: float):
+        """等待组合 ETag 变为与 etag 不同，最长 timeout 秒"""
+        deadline = time.monotonic() + timeout
+        while self.etag == etag:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    async def run(self, interval: float):
+        while True:
+            try:
+                async with acquire() as conn:
+                    await self.refresh(conn)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("元数据快照刷新失败: %s", e)
+            await asyncio.sleep(interval)
+
+    async def refresh(self, conn, full: bool = False):
+        full = full or not self.snapshots or time.monotonic() - self.full_loaded_at >= SNAPSHOT_FULL_SECS
+        since = None
+        if not full and self.watermark is not None:
+            since = self.watermark - timedelta(seconds=SNAPSHOT_OVERLAP_SECS)
+        t0 = time.perf_counter()
+        projects = {r["id"]: (r["name"], r["is_auto_create"], r["status"])
+                    for r in await conn.fetch(SQL_CATALOG_PROJECTS)}
+        # 命中 ID 缓存的项目不再经过 status = 1 过滤，停用 / 删除 / 重建（ID 变化）的项目在此淘汰
+        active = {p[0]: pid for pid, p in projects.items() if p[2] == 1}
+        evicted = project_cache.prune(lambda name, pid: active.get(name) == pid)
+        if evicted:
+            logger.info("已从 ID 缓存淘汰 %d 个停用的项目", evicted)
+        ev_rows = await conn.fetch(SQL_CATALOG_EVENTS, since)
+        pr_rows = await conn.fetch(SQL_CATALOG_PROPERTIES, since)
+        SNAPSHOT_REFRESH_SECONDS.labels("full" if full else "delta").observe(time.perf_counter() - t0)
+
+        events = {} if full else dict(self.events)
+        properties = {} if full else dict(self.properties)
+        for r in ev_rows:
+            events[r["id"]] = (r["project_id"], r["name"], r["accepted"])
+        for r in pr_rows:
+            properties[r["id"]] = (r["project_id"], r["name"], r["data_type"], r["is_in_use"])
+        stamps = [r["update_time"] for r in (*ev_rows, *pr_rows) if r["update_time"] is not None]
+        if full:
+            self.watermark = max(stamps, default=None)
+            self.full_loaded_at = time.monotonic()
+        elif stamps:
+            self.watermark = max(stamps) if self.watermark is None else max(self.watermark, *stamps)
+
+        if (projects, events, properties) != (self.projects, self.events, self.properties) or not self.snapshots:
+            self.projects, self.events, self.properties = projects, events, properties
+            self._mark_dirty()
+
+    def _mark_dirty(self, changes: list = None):
+        """标记视图待渲染并确保后台渲染任务在运行；渲染期间到达的变更合并到下一轮，changes 为 None 表示全量重读"""
+        if not self._dirty:
+            self._dirty, self._dirty_changes = True, changes
+        elif self._dirty_changes is not None:
+            self._dirty_changes = None if changes is None else self._dirty_changes + changes
+        if self._render_task is None or self._render_task.done():
+            self._render_task = asyncio.create_task(self._render_loop())
+
+    async def _render_loop(self):
+        """在线程池中排序、生成 CSV 并计算哈希，避免变更高峰时阻塞事件循环上的 /register"""
+        loop = asyncio.get_running_loop()
+        while self._dirty:
+            changes = self._dirty_changes
+            self._dirty, self._dirty_changes = False, None
+            state = (dict(self.projects), dict(self.events), dict(self.properties))
+            try:
+                snapshots, counts = await loop.run_in_executor(None, self._build_snapshots, *state)
+            except Exception as e:
+                logger.warning("元数据快照渲染失败: %s", e)
+                continue
+            if snapshots != self.snapshots:
+                self.snapshots = snapshots
+                self.version += 1
+                self.etag = '"%s"' % hashlib.sha1("".join(e for e, _ in snapshots.values()).encode()).hexdigest()[:16]
+                self._changed.set()
+                self._changed = asyncio.Event()
+                self._publish({"version": self.version, "etag": self.etag, "changes": changes})
+                logger.info("元数据快照已更新 v%d (projects=%d events=%d props=%d)", self.version, *counts)
+
+    @staticmethod
+    def _build_snapshots(projects: dict, events: dict, properties: dict):
+        """渲染三个 CSV，返回 ({文件: (etag, body)}, (项目数, 事件数, 属性数))；在线程池中执行，只读取传入的副本"""
+        active = {pid: p[0] for pid, p in projects.items() if p[2] == 1}
+        tables = {
+            "projects.csv": (("project_name", "is_auto_create"),
+                             sorted((p[0], p[1]) for p in projects.values() if p[2] == 1)),
+            "valid_events.csv": (("project_name", "event_name", "accepted"),
+                                 sorted((active[e[0]], e[1], e[2]) for e in events.values()
+                                        if e[0] in active)),
+            "valid_properties.csv": (("project_name", "property_name", "data_type"),
+                                     sorted((active[p[0]], p[1], p[2]) for p in properties.values()
+                                            if p[0] in active and p[3] == 1)),
+        }
+        snapshots = {}
+        for name, (header, rows) in tables.items():
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator="\n")
+            writer.writerow(header)
+            writer.writerows(rows)
+            body = buf.getvalue().encode("utf-8")
+            snapshots[name] = ('"%s"' % hashlib.sha1(body).hexdigest()[:16], body)
+        return snapshots, tuple(len(rows) for _, rows in tables.values())
+
+
+# ---------- 请求体流式解码 ----------
+
+class UnsupportedEncoding(Exception):
+    """不支持的 Content-Encoding"""
+
+
+class BodyTooLarge(Exception):
+    """解压后的请求体超过 MAX_BODY_BYTES"""
+
+
+class BodyOverBudget(Exception):
+    """读取请求体的过程中在途字节数超过 MAX_INFLIGHT_BYTES"""
+
+
+class CorruptBody(Exception):
+    """压缩的请求体损坏或被截断"""
+
+
+_DECODE_ERRORS = (zlib.error,) if zstandard is None else (zlib.error, zstandard.ZstdError)
+
+
+def make_decoder(encoding: str):
+    """按 Content-Encoding 创建解压器（zlib 为增量解压对象，zstd 为 ZstdDecompressor），identity 返回 None"""
+    enc = (encoding or "identity").strip().lower()
+    if enc in ("", "identity"):
+        return None
+    if enc in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if enc == "deflate":
+        return zlib.decompressobj()
+    if enc == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor()
+    raise UnsupportedEncoding(enc)
+
+
+def _inflate(decoder, chunk: bytes) -> list:
+    """解压一个网络块；每次输出不超过 STREAM_BLOCK_BYTES，避免高压缩比数据瞬间放大"""
+    pieces = []
+    data = chunk
+    while data:
+        out = decoder.decompress(data, STREAM_BLOCK_BYTES)
+        if not out:
+            break
+        pieces.append(out)
+        data = decoder.unconsumed_tail
+    return pieces
+
+
+def _zstd_complete(buf) -> bool:
+    """按帧头与块头遍历 zstd 帧（不解压），判断请求体是否由完整的帧组成；stream_reader 遇到截断的输入不会报错"""
+    pos, n = 0, len(buf)
+    while pos < n:
+        if n - pos < 8:
+            return False
+        if int.from_bytes(buf[pos:pos + 4], "little") & 0xFFFFFFF0 == 0x184D2A50:   # 可跳过帧
+            pos += 8 + int.from_bytes(buf[pos + 4:pos + 8], "little")
+            continue
+        header = bytes(buf[pos:pos + 18])
+        checksum = zstandard.get_frame_parameters(header).has_checksum
+        pos += zstandard.frame_header_size(header)
+        while True:
+            if pos + 3 > n:
+                return False
+            block = int.from_bytes(buf[pos:pos + 3], "little")
+            pos += 3 + (1 if (block >> 1) & 3 == 1 else block >> 3)    # RLE 块只有 1 字节内容
+            if block & 1:
+                break
+        pos += 4 if checksum else 0
+    return pos == n
+
+
+async def _decoded_pieces(decoder, stream):
+    """产出解压后的数据块，每块不超过 STREAM_BLOCK_BYTES（identity 时为原始网络块）
+
+    zstd 的 stream_reader 无法在输入不足时挂起等待，因此先缓冲压缩后的请求体（同样受 MAX_BODY_BYTES 限制），
+    再按 STREAM_BLOCK_BYTES 分块读出解压结果。
+    """
+    if decoder is None:
+        async for chunk in stream:
+            if chunk:
+                BODY_BYTES.labels("wire").inc(len(chunk))
+                yield chunk
+    elif zstandard is not None and isinstance(decoder, zstandard.ZstdDecompressor):
+        buf = bytearray()
+        async for chunk in stream:
+            BODY_BYTES.labels("wire").inc(len(chunk))
+            buf += chunk
+            if len(buf) > MAX_BODY_BYTES:
+                raise BodyTooLarge(len(buf))
+        if not _zstd_complete(buf):
+            raise CorruptBody("truncated stream")
+        with decoder.stream_reader(io.BytesIO(buf), read_across_frames=True) as reader:
+            while True:
+                piece = reader.read(STREAM_BLOCK_BYTES)
+                if not piece:
+                    break
+                yield piece
+    else:
+        async for chunk in stream:
+            if chunk:
+                BODY_BYTES.labels("wire").inc(len(chunk))
+                for piece in _inflate(decoder, chunk):
+                    yield piece
+        tail = decoder.flush()
+        if tail:
+            yield tail
+        if not decoder.eof:
+            raise CorruptBody("truncated stream")
+
+
+async def iter_body(request: Request, ticket: AdmissionTicket = None):
+    """逐块读取并解压请求体；收到或解压后累计超过 MAX_BODY_BYTES 时抛出 BodyTooLarge，数据损坏或被截断时抛出 CorruptBody
+
+    传入 ticket 时按收到与解压出的字节数中的较大者追加准入占用，超出在途字节上限时抛出 BodyOverBudget。
+    """
+    decoder = make_decoder(request.headers.get("content-encoding"))
+    wire = 0
+    total = 0
+
+    async def received():
+        nonlocal wire
+        async for chunk in request.stream():
+            wire += len(chunk)
+            if wire > MAX_BODY_BYTES:
+                raise BodyTooLarge(wire)
+            if ticket is not None and not ticket.cover(wire):
+                raise BodyOverBudget(wire)
+            yield chunk
+
+    try:
+        async for piece in _decoded_pieces(decoder, received()):
+            total += len(piece)
+            if total > MAX_BODY_BYTES:
+                raise BodyTooLarge(total)
+            if ticket is not None and not ticket.cover(total):
+                raise BodyOverBudget(total)
+            BODY_BYTES.labels("decoded").inc(len(piece))
+            yield piece
+    except _DECODE_ERRORS as e:
+        raise CorruptBody(str(e)) from None
+
+
+async def parse_body(request: Request, ticket: AdmissionTicket = None) -> ParsedBatch:
+    """流式解析 NDJSON：按换行切块增量解析并合并 key
+
+    解压后累计超过 OFFLOAD_BYTES 的请求，其后续块交给执行器解析，小请求仍在事件循环内完成。
+    """
+    merger = KeyMerger()
+    result = ParsedBatch(0, 0, merger.keys, 0.0, 0.0)
+    loop = asyncio.get_running_loop()
+    pending = b""
+    received = 0
+
+    async def consume(block: bytes):
+        if offload_executor is not None and received >= OFFLOAD_BYTES:
+            parsed = await loop.run_in_executor(offload_executor, parse_and_collect, block)
         else:
-            propid_map = {}
-
-        # 2d) 批量 upsert 事件-属性关联
-        if event_prop_links:
-            ep_eids = []
-            ep_pids = []
-            seen = set()
-            for pn, en, key in event_prop_links:
-                pid = pid_map.get(pn)
-                if pid is None:
-                    continue
-                eid = eid_map.get((pid, en))
-                prop_id = propid_map.get((pid, key))
-                if eid is not None and prop_id is not None:
-                    pair = (eid, prop_id)
-                    if pair not in seen:
-                        seen.add(pair)
-                        ep_eids.append(eid)
-                        ep_pids.append(prop_id)
-            if ep_eids:
-                await conn.execute(SQL_BATCH_UPSERT_EVENT_PROPERTY, ep_eids, ep_pids)
-
-        # 2e) 批量 upsert user_id_mapping
-        if user_mappings:
-            await conn.execute(SQL_BATCH_UPSERT_USER_ID_MAPPING,
-                               [m[0] for m in user_mappings],
-                               [m[1] for m in user_mappings],
-                               [m[2] for m in user_mappings],
-                               [m[3] for m in user_mappings],
-                               [m[4] for m in user_mappings])
-
-    registered = len(events)
+            parsed = parse_and_collect(block)
+        result.events += parsed.events
+        result.dropped += parsed.dropped
+        result.parse_seconds += parsed.parse_seconds
+        result.collect_seconds += parsed.collect_seconds
+        merger.absorb(parsed.keys)
+
+    async for piece in iter_body(request, ticket):
+        received += len(piece)
+        pending += piece
+        if len(pending) < STREAM_BLOCK_BYTES:
+            continue
+        cut = pending.rfind(b"\n")
+        if cut < 0:
+            continue
+        block, pending = pending[:cut], pending[cut + 1:]
+        await consume(block)
+    if pending:
+        await consume(pending)
+    return result
+
+
+@app.post("/register")
+async def register_metadata(request: Request):
+    """接收 Vector HTTP Sink 的 NDJSON 批次 — 批量注册
+
+    过载时返回 429（在途批次/字节超限）或 503（连接池获取超时），均带 Retry-After。
+    """
+    try:
+        declared = max(0, int(request.headers.get("content-length") or 0))
+    except ValueError:
+        return JSONResponse({"ok": False, "error": "invalid content-length"}, status_code=400)
+    reason = admission.try_admit(declared)
+    if reason is not None:
+        return overloaded(429, reason)
+    ticket = AdmissionTicket(admission, declared)
+    try:
+        return await _register(request, ticket)
+    except PoolExhausted:
+        return overloaded(503, "pool_timeout")
+    except BodyOverBudget:
+        return overloaded(429, "bytes")
+    except UnsupportedEncoding as e:
+        return JSONResponse({"ok": False, "error": "unsupported encoding: %s" % e}, status_code=415)
+    except BodyTooLarge:
+        return JSONResponse({"ok": False, "error": "body too large"}, status_code=413)
+    except CorruptBody as e:
+        return JSONResponse({"ok": False, "error": "corrupt body: %s" % e}, status_code=400)
+    finally:
+        admission.release(ticket.nbytes)
+
+
+async def _register(request: Request, ticket: AdmissionTicket):
+    # ---- 解析 + Phase 1: 收集所有唯一的 project / event / property ----
+    parsed = await parse_body(request, ticket)
+    PARSE_SECONDS.observe(parsed.parse_seconds)
+    if parsed.dropped:
+        DROPPED_LINES.inc(parsed.dropped)
+
+    if not parsed.events:
+        return {"ok": True, "registered": 0}
+    BATCH_EVENTS.observe(parsed.events)
+    COLLECT_SECONDS.observe(parsed.collect_seconds)
+    keys = parsed.keys
+    if keys.markers:
+        markers.observe(keys.markers)
+        keys.markers = []
+
+    # ---- Phase 2: 批量 SQL（仅未命中缓存的 key；只含追踪标记的批次无需写入）----
+    if keys.key_count():
+        if coalescer is not None:
+            await coalescer.submit(keys)
+        else:
+            async with acquire() as conn:
+                await write_keys(conn, keys)
+
+    registered = parsed.events
     logger.info("批量注册完成: %d 条事件, %d 项目, %d 事件定义, %d 属性",
-                registered, len(unique_projects), len(event_tuples), len(prop_tuples))
+                registered, len(keys.unique_projects), len(keys.event_tuples), len(keys.prop_tuples))
     return {"ok": True, "registered": registered}
 
 
 @app.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+@app.get("/meta/snapshot")
+async def snapshot_index(request: Request, wait: float = 0):
+    """快照版本与各文件 ETag；If-None-Match 与组合 ETag 相同时返回 304，
+    同时带 ?wait=秒 时长轮询：内容变化立即返回 200，超时仍未变化返回 304"""
+    if catalog is None or not catalog.snapshots:
+        return Response(status_code=503)
+    known = request.headers.get("if-none-match")
+    if known and wait > 0:
+        await catalog.wait_changed(known, min(wait, 300))
+    headers = {"ETag": catalog.etag, "X-Meta-Version": str(catalog.version)}
+    if known == catalog.etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse({"version": catalog.version, "etag": catalog.etag,
+                         "files": {name: etag for name, (etag, _) in catalog.snapshots.items()}},
+                        headers=headers)
+
+
+@app.get("/meta/changes")
+async def catalog_changes():
+    """以 SSE 推送元数据变更：先发送当前版本，之后每次快照内容变化推送一条 {version, etag, changes}
+    （changes 为 None 表示全量重读，客户端应重新拉取快照）；订阅者积压过多时断开，重连后按快照重新同步"""
+    if catalog is None:
+        return Response(status_code=503)
+    queue = catalog.subscribe()
+
+    async def stream():
+        try:
+            yield _sse({"version": catalog.version, "etag": catalog.etag, "changes": None})
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), 15)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"   # 防止代理因空闲断开
+                    continue
+                if message is None:
+                    return
+                yield _sse(message)
+        finally:
+            catalog.unsubscribe(queue)
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+def _sse(message: dict) -> str:
+    return "data: %s\n\n" % json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+
+@app.get("/meta/snapshot/{name}")
+async def snapshot_file(name: str, request: Request, since: str = None):
+    """下载单个 CSV 快照；If-None-Match 或 ?since= 与当前 ETag 相同时返回 304"""
+    if catalog is None or not catalog.snapshots:
+        return Response(status_code=503)
+    snap = catalog.snapshots.get(name)
+    if snap is None:
+        return Response(status_code=404)
+    etag, body = snap
+    headers = {"ETag": etag, "X-Meta-Version": str(catalog.version)}
+    known = request.headers.get("if-none-match") or (since and '"%s"' % since.strip('"'))
+    if known == etag:
+        SNAPSHOT_REQUESTS.labels(name, "304").inc()
+        return Response(status_code=304, headers=headers)
+    SNAPSHOT_REQUESTS.labels(name, "200").inc()
+    return Response(body, media_type="text/csv", headers=headers)
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 指标"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/stats")
+async def stats():
+    """ID 缓存命中率、合并写与锁冲突统计、本 worker 的追踪标记延迟与元数据视图状态"""
+    caches = {}
+    for name, cache in (("project", project_cache), ("event", event_cache),
+                        ("property", property_cache), ("event_property", link_cache),
+                        ("user_id_mapping", mapping_cache)):
+        caches[name] = {"size": len(cache), "hits": cache.hits, "misses": cache.misses}
+    return {
+        "cache": caches,
+        "coalesce": coalescer.stats() if coalescer is not None else None,
+        "contention": contention_stats,
+        "admission": {"inflight": admission.inflight, "inflight_bytes": admission.inflight_bytes},
+        "markers": markers.stats(),
+        "catalog": None if catalog is None else {
+            "mode": "listen" if CATALOG_CHANNEL else "poll", "listening": catalog.listening,
+            "version": catalog.version, "subscribers": len(catalog.subscribers)},
+    }
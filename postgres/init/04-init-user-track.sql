@@ -43,6 +43,10 @@ CREATE TABLE user_track.event_define (
 CREATE UNIQUE INDEX IF NOT EXISTS idx_event_define_project_name
   ON user_track.event_define(project_id, name);
 
+-- meta-api 元数据快照按 update_time 水位增量读取
+CREATE INDEX IF NOT EXISTS idx_event_define_update_time
+  ON user_track.event_define(update_time);
+
 CREATE TABLE user_track.property_define (
   id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
   project_id INTEGER NOT NULL DEFAULT 1,
@@ -68,6 +72,9 @@ CREATE TABLE user_track.property_define (
 CREATE UNIQUE INDEX IF NOT EXISTS idx_property_define_project_name
   ON user_track.property_define(name, project_id);
 
+CREATE INDEX IF NOT EXISTS idx_property_define_update_time
+  ON user_track.property_define(update_time);
+
 CREATE TABLE user_track.event_property (
   id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
   event_id INTEGER NOT NULL,
@@ -100,3 +107,73 @@ SELECT setval(pg_get_serial_sequence('user_track.event_define', 'id'), COALESCE(
 INSERT INTO user_track.property_define (id,project_id,name,cname,unit,data_type,comment,is_common,is_dimension,is_measure,is_in_use,is_load,has_dict,default_value,type_flexible,track_info,view_column_name,update_time,create_time) VALUES (1, 1, '$app_crashed_reason', '崩溃原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_crashed_reason', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(2, 1, '$app_id', '应用唯一标识', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(3, 1, '$app_name', '应用名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_name', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(4, 1, '$app_remote_config', '远程控制配置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_remote_config', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(5, 1, '$app_state', 'App 状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_state', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(6, 1, '$app_type_info', '应用/公众号类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_type_info', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(7, 1, '$app_version', '应用版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_version', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(8, 1, '$bot_name', '爬虫名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__bot_name', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(9, 1, '$brand', '设备品牌', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__brand', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(10, 1, '$browser', '浏览器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(11, 1, '$browser_language', '用户浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_language', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(12, 1, '$browser_version', '浏览器版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_version', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(13, 1, '$carrier', '运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__carrier', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(14, 1, '$channel_active_period_day', '有效激活窗口期（天）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_period_day', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(15, 1, '$channel_active_result', '渠道有效激活标识', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_result', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(16, 1, '$channel_attribute_period_hour', '激活归因窗口期（小时）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_attribute_period_hour', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(17, 1, '$channel_extra_information', '渠道额外信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_extra_information', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(18, 1, '$channel_name', '渠道名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_name', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(19, 1, '$city', '城市', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__city', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(20, 1, '$country', '国家', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__country', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(21, 1, '$create_time', '创建时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__create_time', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(22, 1, '$device_id', '设备 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(23, 1, '$device_id_list', '关联设备 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id_list', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(24, 1, '$device_type', '关联设备类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(25, 1, '$element_class_name', '元素样式名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_class_name', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(26, 1, '$element_content', '元素内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_content', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(27, 1, '$element_id', '元素 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(28, 1, '$element_name', '元素名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_name', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(29, 1, '$element_path', '元素路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_path', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(30, 1, '$element_position', '元素位置', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_position', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(31, 1, '$element_selector', '元素选择器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_selector', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(32, 1, '$element_target_url', '元素链接地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_target_url', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(33, 1, '$element_type', '元素类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(34, 1, '$event_duration', '事件时长', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__event_duration', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(35, 1, '$first_browser_charset', '首次浏览器字符类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_charset', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(36, 1, '$first_browser_language', '浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_language', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(37, 1, '$first_referrer', '首次前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(38, 1, '$first_referrer_host', '首次前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer_host', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(39, 1, '$first_search_keyword', '首次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_search_keyword', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(40, 1, '$first_traffic_source_type', '首次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_traffic_source_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(41, 1, '$first_visit_time', '首次访问时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_visit_time', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(42, 1, '$idmap_reason', 'ID 关联原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__idmap_reason', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(43, 1, '$ios_install_disable_callback', '是否不进行追踪回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_disable_callback', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(44, 1, '$ios_install_source', 'App 渠道匹配所需要的设备指纹信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_source', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(45, 1, '$ip', 'IP', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(46, 1, '$ip_isp', 'IP 运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip_isp', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(47, 1, '$is_channel_callback_event', '是否进行渠道匹配回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_channel_callback_event', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(48, 1, '$is_deleted', '是否删除', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_deleted', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(49, 1, '$is_first_day', '是否首日访问', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_day', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(50, 1, '$is_first_time', '是否首次触发事件', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_time', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(51, 1, '$is_login_id', '是否登录 ID', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_login_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(52, 1, '$is_valid', '是否封禁', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_valid', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(53, 1, '$kafka_offset', '$kafka_offset', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__kafka_offset', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(54, 1, '$latest_landing_page', '最近一次落地页', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_landing_page', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(55, 1, '$latest_referrer', '最近一次站外地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(56, 1, '$latest_referrer_host', '最近一次站外域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer_host', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(57, 1, '$latest_sa_utm', '最近一次渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_sa_utm', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(58, 1, '$latest_scene', '最近一次启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_scene', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(59, 1, '$latest_search_keyword', '最近一次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_search_keyword', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(60, 1, '$latest_share_depth', '最近一次分享深度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_depth', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(61, 1, '$latest_share_distinct_id', '最近一次分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_distinct_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(62, 1, '$latest_share_method', '最近一次分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_method', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(63, 1, '$latest_share_url_path', '最近一次分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_url_path', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(64, 1, '$latest_traffic_source_type', '最近一次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_traffic_source_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(65, 1, '$latest_utm_campaign', '最近一次广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_campaign', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(66, 1, '$latest_utm_content', '最近一次广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_content', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(67, 1, '$latest_utm_medium', '最近一次广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_medium', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(68, 1, '$latest_utm_source', '最近一次广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_source', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(69, 1, '$latest_utm_term', '最近一次广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_term', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(70, 1, '$latitude', '纬度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latitude', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(71, 1, '$lib', 'SDK 类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(72, 1, '$lib_detail', '埋点细节', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_detail', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(73, 1, '$lib_method', '埋点方式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_method', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(74, 1, '$lib_plugin_version', 'SDK 插件版本号', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_plugin_version', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(75, 1, '$lib_version', 'SDK 版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_version', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(76, 1, '$location_info', '地理位置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_info', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(77, 1, '$location_precision', '地理位置精度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_precision', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(78, 1, '$longitude', '经度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__longitude', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(79, 1, '$manufacturer', '设备制造商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__manufacturer', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(80, 1, '$map_scale', '地图缩放大小', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__map_scale', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(81, 1, '$matched_key', '渠道匹配关键字', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matched_key', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(82, 1, '$matching_key_list', '渠道匹配关键字列表', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matching_key_list', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(83, 1, '$model', '设备型号', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__model', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(84, 1, '$mp_bizmsgmenu_id', '公众号菜单会话选项', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_bizmsgmenu_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(85, 1, '$mp_card_id', '公众号消息卡券 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_card_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(86, 1, '$mp_click_menu_type', '公众号菜单事件类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_click_menu_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(87, 1, '$mp_content', '公众号消息文本内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_content', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(88, 1, '$mp_description', '公众号消息描述', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_description', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(89, 1, '$mp_event_key', '公众号事件 KEY', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_event_key', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(90, 1, '$mp_head_content', '公众号消息开头语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_head_content', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(91, 1, '$mp_media_id', '公众号消息媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_media_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(92, 1, '$mp_menu_id', '公众号菜单 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_menu_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(93, 1, '$mp_msg_group_type', '公众号消息组消息类型', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_group_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(94, 1, '$mp_msg_id', '公众号用户发送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(95, 1, '$mp_option_list', '公众号消息选项 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_option_list', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(96, 1, '$mp_pic_url', '公众号消息图片链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_pic_url', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(97, 1, '$mp_receive_msg_type', '公众号用户发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_receive_msg_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(98, 1, '$mp_reply_appid', '回复的小程序 App ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_reply_appid', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(99, 1, '$mp_send_msg_type', '公众号发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_send_msg_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(100, 1, '$mp_tail_content', '公众号消息结束语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_tail_content', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(101, 1, '$mp_thumb_media_id', '公众号消息缩略图媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_thumb_media_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(102, 1, '$mp_title', '公众号消息标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_title', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(103, 1, '$mp_url', '公众号消息链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_url', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(104, 1, '$mp_voice_format', '公众号语音格式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_format', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(105, 1, '$mp_voice_recognition', '公众号消息语音识别结果', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_recognition', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(106, 1, '$network_type', '网络类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__network_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(107, 1, '$os', '操作系统', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(108, 1, '$os_version', '操作系统版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os_version', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(109, 1, '$page_height', '页面高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_height', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(110, 1, '$page_resource_size', '页面资源大小', 'KB', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_resource_size', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(111, 1, '$page_x', '页面 X 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_x', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(112, 1, '$page_y', '页面 Y 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_y', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(113, 1, '$province', '省份', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__province', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(114, 1, '$receive_time', '$receive_time', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__receive_time', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(115, 1, '$referrer', '前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(116, 1, '$referrer_host', '前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_host', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(117, 1, '$referrer_title', '前向页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_title', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(118, 1, '$resume_from_background', '是否从后台唤醒', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__resume_from_background', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(119, 1, '$sa_utm', '渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sa_utm', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(120, 1, '$scene', '启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__scene', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(121, 1, '$screen_height', '屏幕高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_height', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(122, 1, '$screen_name', '页面名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_name', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(123, 1, '$screen_orientation', '屏幕方向', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_orientation', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(124, 1, '$screen_width', '屏幕宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_width', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(125, 1, '$sf_audience_id', '运营受众 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_audience_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(126, 1, '$sf_channel_category', '消息通道类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_category', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(127, 1, '$sf_channel_id', '运营计划推送通道 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(128, 1, '$sf_channel_service_name', '消息发送服务商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_service_name', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(129, 1, '$sf_convert_id', '目标 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_convert_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(130, 1, '$sf_enter_plan_time', '进入计划时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_enter_plan_time', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(131, 1, '$sf_fail_reason', '消息发送失败原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_fail_reason', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(132, 1, '$sf_keyword', '回复消息命中的关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(133, 1, '$sf_keyword_rule_id', '关键词规则名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword_rule_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(134, 1, '$sf_msg_errcode', '消息终态错误代码', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_errcode', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(135, 1, '$sf_msg_group_id', '消息组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(136, 1, '$sf_msg_group_type', '消息组消息类型枚举值', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(137, 1, '$sf_msg_id', '推送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(138, 1, '$sf_msg_status', '消息最终状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_status', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(139, 1, '$sf_plan_id', '运营计划名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(140, 1, '$sf_plan_strategy_id', '实验组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_strategy_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(141, 1, '$sf_plan_type', '计划类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(142, 1, '$sf_reply_contain_qr', '是否回复二维码', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_reply_contain_qr', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(143, 1, '$sf_strategy_unit_id', '策略器名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_strategy_unit_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(144, 1, '$sf_succeed', '消息发送成功', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_succeed', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(145, 1, '$sf_total_msgs', '配置的回复条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(146, 1, '$sf_total_msgs_success', '回复消息条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs_success', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(147, 1, '$share_depth', '分享次数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_depth', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(148, 1, '$share_distinct_id', '分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_distinct_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(149, 1, '$share_method', '分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_method', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(150, 1, '$share_url_path', '分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_url_path', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(151, 1, '$short_url_key', '短链 Key', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_key', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(152, 1, '$short_url_target', '短链目标地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_target', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(153, 1, '$source_package_name', '来源应用包名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__source_package_name', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(154, 1, '$timezone_offset', '时区偏移量', '秒', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__timezone_offset', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(155, 1, '$title', '页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__title', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(156, 1, '$track_signup_original_id', '关联原始 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__track_signup_original_id', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(157, 1, '$update_time', '更新时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__update_time', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(158, 1, '$url', '页面地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(159, 1, '$url_host', '页面地址域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_host', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(160, 1, '$url_path', '页面路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_path', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(161, 1, '$url_query', '页面参数', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_query', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(162, 1, '$user_agent', 'UserAgent', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__user_agent', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(163, 1, '$utm_campaign', '广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_campaign', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(164, 1, '$utm_content', '广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_content', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(165, 1, '$utm_matching_type', '渠道追踪匹配模式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_matching_type', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(166, 1, '$utm_medium', '广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_medium', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(167, 1, '$utm_source', '广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_source', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(168, 1, '$utm_term', '广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_term', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(169, 1, '$viewport_height', '视区高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_height', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(170, 1, '$viewport_position', '视区距顶部的位置', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_position', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(171, 1, '$viewport_width', '视区宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_width', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(172, 1, '$wifi', '是否 WIFI', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__wifi', '2025-05-28 10:49:46.213236', '2025-05-28 10:49:46.213236'),(173, 5, '$app_crashed_reason', '崩溃原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_crashed_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(174, 4, '$app_crashed_reason', '崩溃原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_crashed_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(175, 3, '$app_crashed_reason', '崩溃原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_crashed_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(176, 2, '$app_crashed_reason', '崩溃原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_crashed_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(177, 5, '$app_id', '应用唯一标识', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(178, 4, '$app_id', '应用唯一标识', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(179, 3, '$app_id', '应用唯一标识', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(180, 2, '$app_id', '应用唯一标识', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(181, 5, '$app_name', '应用名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(182, 4, '$app_name', '应用名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(183, 3, '$app_name', '应用名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(184, 2, '$app_name', '应用名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(185, 5, '$app_remote_config', '远程控制配置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_remote_config', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(186, 4, '$app_remote_config', '远程控制配置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_remote_config', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(187, 3, '$app_remote_config', '远程控制配置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_remote_config', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(188, 2, '$app_remote_config', '远程控制配置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_remote_config', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(189, 5, '$app_state', 'App 状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_state', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(190, 4, '$app_state', 'App 状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_state', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(191, 3, '$app_state', 'App 状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_state', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(192, 2, '$app_state', 'App 状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_state', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(193, 5, '$app_type_info', '应用/公众号类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_type_info', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(194, 4, '$app_type_info', '应用/公众号类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_type_info', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(195, 3, '$app_type_info', '应用/公众号类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_type_info', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(196, 2, '$app_type_info', '应用/公众号类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_type_info', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(197, 5, '$app_version', '应用版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(198, 4, '$app_version', '应用版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(199, 3, '$app_version', '应用版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(200, 2, '$app_version', '应用版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__app_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(201, 5, '$bot_name', '爬虫名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__bot_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(202, 4, '$bot_name', '爬虫名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__bot_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(203, 3, '$bot_name', '爬虫名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__bot_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(204, 2, '$bot_name', '爬虫名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__bot_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(205, 5, '$brand', '设备品牌', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__brand', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(206, 4, '$brand', '设备品牌', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__brand', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(207, 3, '$brand', '设备品牌', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__brand', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(208, 2, '$brand', '设备品牌', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__brand', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(209, 5, '$browser', '浏览器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(210, 4, '$browser', '浏览器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(211, 3, '$browser', '浏览器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(212, 2, '$browser', '浏览器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(213, 5, '$browser_language', '用户浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_language', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(214, 4, '$browser_language', '用户浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_language', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(215, 3, '$browser_language', '用户浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_language', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(216, 2, '$browser_language', '用户浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_language', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(217, 5, '$browser_version', '浏览器版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(218, 4, '$browser_version', '浏览器版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(219, 3, '$browser_version', '浏览器版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(220, 2, '$browser_version', '浏览器版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__browser_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(221, 5, '$carrier', '运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__carrier', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(222, 4, '$carrier', '运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__carrier', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(223, 3, '$carrier', '运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__carrier', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(224, 2, '$carrier', '运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__carrier', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(225, 5, '$channel_active_period_day', '有效激活窗口期（天）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_period_day', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(226, 4, '$channel_active_period_day', '有效激活窗口期（天）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_period_day', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(227, 3, '$channel_active_period_day', '有效激活窗口期（天）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_period_day', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(228, 2, '$channel_active_period_day', '有效激活窗口期（天）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_period_day', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(229, 5, '$channel_active_result', '渠道有效激活标识', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_result', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(230, 4, '$channel_active_result', '渠道有效激活标识', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_result', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(231, 3, '$channel_active_result', '渠道有效激活标识', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_result', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(232, 2, '$channel_active_result', '渠道有效激活标识', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_active_result', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(233, 5, '$channel_attribute_period_hour', '激活归因窗口期（小时）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_attribute_period_hour', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(234, 4, '$channel_attribute_period_hour', '激活归因窗口期（小时）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_attribute_period_hour', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(235, 3, '$channel_attribute_period_hour', '激活归因窗口期（小时）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_attribute_period_hour', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(236, 2, '$channel_attribute_period_hour', '激活归因窗口期（小时）', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_attribute_period_hour', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(237, 5, '$channel_extra_information', '渠道额外信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_extra_information', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(238, 4, '$channel_extra_information', '渠道额外信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_extra_information', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(239, 3, '$channel_extra_information', '渠道额外信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_extra_information', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(240, 2, '$channel_extra_information', '渠道额外信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_extra_information', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(241, 5, '$channel_name', '渠道名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(242, 4, '$channel_name', '渠道名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(243, 3, '$channel_name', '渠道名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(244, 2, '$channel_name', '渠道名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__channel_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(245, 5, '$city', '城市', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__city', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(246, 4, '$city', '城市', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__city', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(247, 3, '$city', '城市', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__city', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(248, 2, '$city', '城市', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__city', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(249, 5, '$country', '国家', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__country', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(250, 4, '$country', '国家', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__country', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(251, 3, '$country', '国家', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__country', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(252, 2, '$country', '国家', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__country', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(253, 5, '$create_time', '创建时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__create_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(254, 4, '$create_time', '创建时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__create_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(255, 3, '$create_time', '创建时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__create_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(256, 2, '$create_time', '创建时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__create_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(257, 5, '$device_id', '设备 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(258, 4, '$device_id', '设备 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(259, 3, '$device_id', '设备 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(260, 2, '$device_id', '设备 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(261, 5, '$device_id_list', '关联设备 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(262, 4, '$device_id_list', '关联设备 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(263, 3, '$device_id_list', '关联设备 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(264, 2, '$device_id_list', '关联设备 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_id_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(265, 5, '$device_type', '关联设备类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(266, 4, '$device_type', '关联设备类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(267, 3, '$device_type', '关联设备类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(268, 2, '$device_type', '关联设备类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__device_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(269, 5, '$element_class_name', '元素样式名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_class_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(270, 4, '$element_class_name', '元素样式名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_class_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(271, 3, '$element_class_name', '元素样式名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_class_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(272, 2, '$element_class_name', '元素样式名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_class_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(273, 5, '$element_content', '元素内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(274, 4, '$element_content', '元素内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(275, 3, '$element_content', '元素内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(276, 2, '$element_content', '元素内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(277, 5, '$element_id', '元素 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(278, 4, '$element_id', '元素 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(279, 3, '$element_id', '元素 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(280, 2, '$element_id', '元素 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(281, 5, '$element_name', '元素名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(282, 4, '$element_name', '元素名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(283, 3, '$element_name', '元素名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(284, 2, '$element_name', '元素名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(285, 5, '$element_path', '元素路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(286, 4, '$element_path', '元素路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(287, 3, '$element_path', '元素路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(288, 2, '$element_path', '元素路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(289, 5, '$element_position', '元素位置', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_position', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(290, 4, '$element_position', '元素位置', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_position', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(291, 3, '$element_position', '元素位置', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_position', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(292, 2, '$element_position', '元素位置', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_position', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(293, 5, '$element_selector', '元素选择器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_selector', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(294, 4, '$element_selector', '元素选择器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_selector', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(295, 3, '$element_selector', '元素选择器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_selector', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(296, 2, '$element_selector', '元素选择器', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_selector', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(297, 5, '$element_target_url', '元素链接地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_target_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(298, 4, '$element_target_url', '元素链接地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_target_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(299, 3, '$element_target_url', '元素链接地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_target_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(300, 2, '$element_target_url', '元素链接地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_target_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(301, 5, '$element_type', '元素类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(302, 4, '$element_type', '元素类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(303, 3, '$element_type', '元素类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(304, 2, '$element_type', '元素类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__element_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(305, 5, '$event_duration', '事件时长', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__event_duration', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(306, 4, '$event_duration', '事件时长', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__event_duration', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(307, 3, '$event_duration', '事件时长', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__event_duration', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(308, 2, '$event_duration', '事件时长', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__event_duration', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(309, 5, '$first_browser_charset', '首次浏览器字符类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_charset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(310, 4, '$first_browser_charset', '首次浏览器字符类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_charset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(311, 3, '$first_browser_charset', '首次浏览器字符类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_charset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(312, 2, '$first_browser_charset', '首次浏览器字符类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_charset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(313, 5, '$first_browser_language', '浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_language', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(314, 4, '$first_browser_language', '浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_language', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(315, 3, '$first_browser_language', '浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_language', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(316, 2, '$first_browser_language', '浏览器语言', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_browser_language', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(317, 5, '$first_referrer', '首次前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(318, 4, '$first_referrer', '首次前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(319, 3, '$first_referrer', '首次前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(320, 2, '$first_referrer', '首次前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(321, 5, '$first_referrer_host', '首次前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(322, 4, '$first_referrer_host', '首次前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(323, 3, '$first_referrer_host', '首次前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(324, 2, '$first_referrer_host', '首次前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(325, 5, '$first_search_keyword', '首次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_search_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(326, 4, '$first_search_keyword', '首次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_search_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(327, 3, '$first_search_keyword', '首次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_search_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(328, 2, '$first_search_keyword', '首次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_search_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(329, 5, '$first_traffic_source_type', '首次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_traffic_source_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(330, 4, '$first_traffic_source_type', '首次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_traffic_source_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(331, 3, '$first_traffic_source_type', '首次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_traffic_source_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(332, 2, '$first_traffic_source_type', '首次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_traffic_source_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(333, 5, '$first_visit_time', '首次访问时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_visit_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(334, 4, '$first_visit_time', '首次访问时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_visit_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(335, 3, '$first_visit_time', '首次访问时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_visit_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(336, 2, '$first_visit_time', '首次访问时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__first_visit_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(337, 5, '$idmap_reason', 'ID 关联原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__idmap_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(338, 4, '$idmap_reason', 'ID 关联原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__idmap_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(339, 3, '$idmap_reason', 'ID 关联原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__idmap_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(340, 2, '$idmap_reason', 'ID 关联原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__idmap_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(341, 5, '$ios_install_disable_callback', '是否不进行追踪回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_disable_callback', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(342, 4, '$ios_install_disable_callback', '是否不进行追踪回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_disable_callback', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(343, 3, '$ios_install_disable_callback', '是否不进行追踪回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_disable_callback', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(344, 2, '$ios_install_disable_callback', '是否不进行追踪回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_disable_callback', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(345, 5, '$ios_install_source', 'App 渠道匹配所需要的设备指纹信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(346, 4, '$ios_install_source', 'App 渠道匹配所需要的设备指纹信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(347, 3, '$ios_install_source', 'App 渠道匹配所需要的设备指纹信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(348, 2, '$ios_install_source', 'App 渠道匹配所需要的设备指纹信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ios_install_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(349, 5, '$ip', 'IP', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(350, 4, '$ip', 'IP', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(351, 3, '$ip', 'IP', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(352, 2, '$ip', 'IP', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(353, 5, '$ip_isp', 'IP 运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip_isp', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(354, 4, '$ip_isp', 'IP 运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip_isp', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(355, 3, '$ip_isp', 'IP 运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip_isp', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(356, 2, '$ip_isp', 'IP 运营商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__ip_isp', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(357, 5, '$is_channel_callback_event', '是否进行渠道匹配回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_channel_callback_event', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(358, 4, '$is_channel_callback_event', '是否进行渠道匹配回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_channel_callback_event', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(359, 3, '$is_channel_callback_event', '是否进行渠道匹配回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_channel_callback_event', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(360, 2, '$is_channel_callback_event', '是否进行渠道匹配回调', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_channel_callback_event', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(361, 5, '$is_deleted', '是否删除', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_deleted', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(362, 4, '$is_deleted', '是否删除', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_deleted', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(363, 3, '$is_deleted', '是否删除', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_deleted', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(364, 2, '$is_deleted', '是否删除', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_deleted', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(365, 5, '$is_first_day', '是否首日访问', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_day', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(366, 4, '$is_first_day', '是否首日访问', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_day', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(367, 3, '$is_first_day', '是否首日访问', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_day', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(368, 2, '$is_first_day', '是否首日访问', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_day', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(369, 5, '$is_first_time', '是否首次触发事件', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(370, 4, '$is_first_time', '是否首次触发事件', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(371, 3, '$is_first_time', '是否首次触发事件', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(372, 2, '$is_first_time', '是否首次触发事件', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_first_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(373, 5, '$is_login_id', '是否登录 ID', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_login_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(374, 4, '$is_login_id', '是否登录 ID', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_login_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(375, 3, '$is_login_id', '是否登录 ID', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_login_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(376, 2, '$is_login_id', '是否登录 ID', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_login_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(377, 5, '$is_valid', '是否封禁', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_valid', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(378, 4, '$is_valid', '是否封禁', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_valid', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(379, 3, '$is_valid', '是否封禁', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_valid', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(380, 2, '$is_valid', '是否封禁', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__is_valid', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(381, 5, '$kafka_offset', '$kafka_offset', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__kafka_offset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(382, 4, '$kafka_offset', '$kafka_offset', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__kafka_offset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(383, 3, '$kafka_offset', '$kafka_offset', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__kafka_offset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(384, 2, '$kafka_offset', '$kafka_offset', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__kafka_offset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(385, 5, '$latest_landing_page', '最近一次落地页', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_landing_page', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(386, 4, '$latest_landing_page', '最近一次落地页', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_landing_page', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(387, 3, '$latest_landing_page', '最近一次落地页', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_landing_page', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(388, 2, '$latest_landing_page', '最近一次落地页', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_landing_page', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(389, 5, '$latest_referrer', '最近一次站外地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(390, 4, '$latest_referrer', '最近一次站外地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(391, 3, '$latest_referrer', '最近一次站外地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(392, 2, '$latest_referrer', '最近一次站外地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(393, 5, '$latest_referrer_host', '最近一次站外域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(394, 4, '$latest_referrer_host', '最近一次站外域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(395, 3, '$latest_referrer_host', '最近一次站外域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(396, 2, '$latest_referrer_host', '最近一次站外域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(397, 5, '$latest_sa_utm', '最近一次渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_sa_utm', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(398, 4, '$latest_sa_utm', '最近一次渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_sa_utm', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(399, 3, '$latest_sa_utm', '最近一次渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_sa_utm', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(400, 2, '$latest_sa_utm', '最近一次渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_sa_utm', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(401, 5, '$latest_scene', '最近一次启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_scene', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(402, 4, '$latest_scene', '最近一次启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_scene', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(403, 3, '$latest_scene', '最近一次启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_scene', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(404, 2, '$latest_scene', '最近一次启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_scene', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(405, 5, '$latest_search_keyword', '最近一次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_search_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(406, 4, '$latest_search_keyword', '最近一次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_search_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(407, 3, '$latest_search_keyword', '最近一次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_search_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(408, 2, '$latest_search_keyword', '最近一次搜索引擎关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_search_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(409, 5, '$latest_share_depth', '最近一次分享深度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_depth', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(410, 4, '$latest_share_depth', '最近一次分享深度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_depth', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(411, 3, '$latest_share_depth', '最近一次分享深度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_depth', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(412, 2, '$latest_share_depth', '最近一次分享深度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_depth', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(413, 5, '$latest_share_distinct_id', '最近一次分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_distinct_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(414, 4, '$latest_share_distinct_id', '最近一次分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_distinct_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(415, 3, '$latest_share_distinct_id', '最近一次分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_distinct_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(416, 2, '$latest_share_distinct_id', '最近一次分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_distinct_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(417, 5, '$latest_share_method', '最近一次分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(418, 4, '$latest_share_method', '最近一次分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(419, 3, '$latest_share_method', '最近一次分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(420, 2, '$latest_share_method', '最近一次分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(421, 5, '$latest_share_url_path', '最近一次分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(422, 4, '$latest_share_url_path', '最近一次分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(423, 3, '$latest_share_url_path', '最近一次分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(424, 2, '$latest_share_url_path', '最近一次分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_share_url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(425, 5, '$latest_traffic_source_type', '最近一次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_traffic_source_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(426, 4, '$latest_traffic_source_type', '最近一次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_traffic_source_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(427, 3, '$latest_traffic_source_type', '最近一次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_traffic_source_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(428, 2, '$latest_traffic_source_type', '最近一次流量来源类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_traffic_source_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(429, 5, '$latest_utm_campaign', '最近一次广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_campaign', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(430, 4, '$latest_utm_campaign', '最近一次广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_campaign', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(431, 3, '$latest_utm_campaign', '最近一次广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_campaign', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(432, 2, '$latest_utm_campaign', '最近一次广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_campaign', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(433, 5, '$latest_utm_content', '最近一次广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(434, 4, '$latest_utm_content', '最近一次广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(435, 3, '$latest_utm_content', '最近一次广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(436, 2, '$latest_utm_content', '最近一次广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(437, 5, '$latest_utm_medium', '最近一次广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_medium', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(438, 4, '$latest_utm_medium', '最近一次广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_medium', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(439, 3, '$latest_utm_medium', '最近一次广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_medium', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(440, 2, '$latest_utm_medium', '最近一次广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_medium', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(441, 5, '$latest_utm_source', '最近一次广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(442, 4, '$latest_utm_source', '最近一次广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(443, 3, '$latest_utm_source', '最近一次广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(444, 2, '$latest_utm_source', '最近一次广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(445, 5, '$latest_utm_term', '最近一次广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_term', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(446, 4, '$latest_utm_term', '最近一次广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_term', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(447, 3, '$latest_utm_term', '最近一次广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_term', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(448, 2, '$latest_utm_term', '最近一次广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latest_utm_term', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(449, 5, '$latitude', '纬度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latitude', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(450, 4, '$latitude', '纬度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latitude', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(451, 3, '$latitude', '纬度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latitude', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(452, 2, '$latitude', '纬度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__latitude', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(453, 5, '$lib', 'SDK 类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(454, 4, '$lib', 'SDK 类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(455, 3, '$lib', 'SDK 类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(456, 2, '$lib', 'SDK 类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(457, 5, '$lib_detail', '埋点细节', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_detail', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(458, 4, '$lib_detail', '埋点细节', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_detail', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(459, 3, '$lib_detail', '埋点细节', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_detail', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(460, 2, '$lib_detail', '埋点细节', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_detail', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(461, 5, '$lib_method', '埋点方式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(462, 4, '$lib_method', '埋点方式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(463, 3, '$lib_method', '埋点方式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(464, 2, '$lib_method', '埋点方式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(465, 5, '$lib_plugin_version', 'SDK 插件版本号', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_plugin_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(466, 4, '$lib_plugin_version', 'SDK 插件版本号', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_plugin_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(467, 3, '$lib_plugin_version', 'SDK 插件版本号', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_plugin_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(468, 2, '$lib_plugin_version', 'SDK 插件版本号', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_plugin_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(469, 5, '$lib_version', 'SDK 版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(470, 4, '$lib_version', 'SDK 版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(471, 3, '$lib_version', 'SDK 版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(472, 2, '$lib_version', 'SDK 版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__lib_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(473, 5, '$location_info', '地理位置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_info', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(474, 4, '$location_info', '地理位置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_info', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(475, 3, '$location_info', '地理位置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_info', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(476, 2, '$location_info', '地理位置信息', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_info', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(477, 5, '$location_precision', '地理位置精度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_precision', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(478, 4, '$location_precision', '地理位置精度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_precision', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(479, 3, '$location_precision', '地理位置精度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_precision', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(480, 2, '$location_precision', '地理位置精度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__location_precision', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(481, 5, '$longitude', '经度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__longitude', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(482, 4, '$longitude', '经度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__longitude', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(483, 3, '$longitude', '经度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__longitude', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(484, 2, '$longitude', '经度', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__longitude', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(485, 5, '$manufacturer', '设备制造商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__manufacturer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(486, 4, '$manufacturer', '设备制造商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__manufacturer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(487, 3, '$manufacturer', '设备制造商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__manufacturer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(488, 2, '$manufacturer', '设备制造商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__manufacturer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(489, 5, '$map_scale', '地图缩放大小', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__map_scale', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(490, 4, '$map_scale', '地图缩放大小', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__map_scale', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(491, 3, '$map_scale', '地图缩放大小', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__map_scale', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(492, 2, '$map_scale', '地图缩放大小', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__map_scale', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(493, 5, '$matched_key', '渠道匹配关键字', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matched_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(494, 4, '$matched_key', '渠道匹配关键字', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matched_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(495, 3, '$matched_key', '渠道匹配关键字', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matched_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(496, 2, '$matched_key', '渠道匹配关键字', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matched_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(497, 5, '$matching_key_list', '渠道匹配关键字列表', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matching_key_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(498, 4, '$matching_key_list', '渠道匹配关键字列表', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matching_key_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(499, 3, '$matching_key_list', '渠道匹配关键字列表', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matching_key_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(500, 2, '$matching_key_list', '渠道匹配关键字列表', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__matching_key_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(501, 5, '$model', '设备型号', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__model', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(502, 4, '$model', '设备型号', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__model', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(503, 3, '$model', '设备型号', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__model', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(504, 2, '$model', '设备型号', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__model', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(505, 5, '$mp_bizmsgmenu_id', '公众号菜单会话选项', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_bizmsgmenu_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(506, 4, '$mp_bizmsgmenu_id', '公众号菜单会话选项', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_bizmsgmenu_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(507, 3, '$mp_bizmsgmenu_id', '公众号菜单会话选项', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_bizmsgmenu_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(508, 2, '$mp_bizmsgmenu_id', '公众号菜单会话选项', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_bizmsgmenu_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(509, 5, '$mp_card_id', '公众号消息卡券 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_card_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(510, 4, '$mp_card_id', '公众号消息卡券 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_card_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(511, 3, '$mp_card_id', '公众号消息卡券 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_card_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(512, 2, '$mp_card_id', '公众号消息卡券 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_card_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(513, 5, '$mp_click_menu_type', '公众号菜单事件类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_click_menu_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(514, 4, '$mp_click_menu_type', '公众号菜单事件类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_click_menu_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(515, 3, '$mp_click_menu_type', '公众号菜单事件类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_click_menu_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(516, 2, '$mp_click_menu_type', '公众号菜单事件类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_click_menu_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(517, 5, '$mp_content', '公众号消息文本内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(518, 4, '$mp_content', '公众号消息文本内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(519, 3, '$mp_content', '公众号消息文本内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(520, 2, '$mp_content', '公众号消息文本内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(521, 5, '$mp_description', '公众号消息描述', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_description', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(522, 4, '$mp_description', '公众号消息描述', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_description', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(523, 3, '$mp_description', '公众号消息描述', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_description', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(524, 2, '$mp_description', '公众号消息描述', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_description', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(525, 5, '$mp_event_key', '公众号事件 KEY', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_event_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(526, 4, '$mp_event_key', '公众号事件 KEY', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_event_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(527, 3, '$mp_event_key', '公众号事件 KEY', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_event_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(528, 2, '$mp_event_key', '公众号事件 KEY', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_event_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(529, 5, '$mp_head_content', '公众号消息开头语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_head_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(530, 4, '$mp_head_content', '公众号消息开头语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_head_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(531, 3, '$mp_head_content', '公众号消息开头语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_head_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(532, 2, '$mp_head_content', '公众号消息开头语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_head_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(533, 5, '$mp_media_id', '公众号消息媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_media_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(534, 4, '$mp_media_id', '公众号消息媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_media_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(535, 3, '$mp_media_id', '公众号消息媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_media_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(536, 2, '$mp_media_id', '公众号消息媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_media_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(537, 5, '$mp_menu_id', '公众号菜单 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_menu_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(538, 4, '$mp_menu_id', '公众号菜单 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_menu_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(539, 3, '$mp_menu_id', '公众号菜单 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_menu_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(540, 2, '$mp_menu_id', '公众号菜单 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_menu_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(541, 5, '$mp_msg_group_type', '公众号消息组消息类型', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_group_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(542, 4, '$mp_msg_group_type', '公众号消息组消息类型', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_group_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(543, 3, '$mp_msg_group_type', '公众号消息组消息类型', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_group_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(544, 2, '$mp_msg_group_type', '公众号消息组消息类型', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_group_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(545, 5, '$mp_msg_id', '公众号用户发送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(546, 4, '$mp_msg_id', '公众号用户发送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(547, 3, '$mp_msg_id', '公众号用户发送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(548, 2, '$mp_msg_id', '公众号用户发送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_msg_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(549, 5, '$mp_option_list', '公众号消息选项 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_option_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(550, 4, '$mp_option_list', '公众号消息选项 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_option_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(551, 3, '$mp_option_list', '公众号消息选项 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_option_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(552, 2, '$mp_option_list', '公众号消息选项 ID', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_option_list', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(553, 5, '$mp_pic_url', '公众号消息图片链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_pic_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(554, 4, '$mp_pic_url', '公众号消息图片链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_pic_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(555, 3, '$mp_pic_url', '公众号消息图片链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_pic_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(556, 2, '$mp_pic_url', '公众号消息图片链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_pic_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(557, 5, '$mp_receive_msg_type', '公众号用户发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_receive_msg_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(558, 4, '$mp_receive_msg_type', '公众号用户发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_receive_msg_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(559, 3, '$mp_receive_msg_type', '公众号用户发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_receive_msg_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(560, 2, '$mp_receive_msg_type', '公众号用户发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_receive_msg_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(561, 5, '$mp_reply_appid', '回复的小程序 App ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_reply_appid', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(562, 4, '$mp_reply_appid', '回复的小程序 App ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_reply_appid', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(563, 3, '$mp_reply_appid', '回复的小程序 App ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_reply_appid', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(564, 2, '$mp_reply_appid', '回复的小程序 App ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_reply_appid', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(565, 5, '$mp_send_msg_type', '公众号发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_send_msg_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(566, 4, '$mp_send_msg_type', '公众号发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_send_msg_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(567, 3, '$mp_send_msg_type', '公众号发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_send_msg_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(568, 2, '$mp_send_msg_type', '公众号发送消息类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_send_msg_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(569, 5, '$mp_tail_content', '公众号消息结束语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_tail_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(570, 4, '$mp_tail_content', '公众号消息结束语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_tail_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(571, 3, '$mp_tail_content', '公众号消息结束语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_tail_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(572, 2, '$mp_tail_content', '公众号消息结束语', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_tail_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(573, 5, '$mp_thumb_media_id', '公众号消息缩略图媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_thumb_media_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(574, 4, '$mp_thumb_media_id', '公众号消息缩略图媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_thumb_media_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(575, 3, '$mp_thumb_media_id', '公众号消息缩略图媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_thumb_media_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(576, 2, '$mp_thumb_media_id', '公众号消息缩略图媒体 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_thumb_media_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(577, 5, '$mp_title', '公众号消息标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(578, 4, '$mp_title', '公众号消息标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(579, 3, '$mp_title', '公众号消息标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(580, 2, '$mp_title', '公众号消息标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(581, 5, '$mp_url', '公众号消息链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(582, 4, '$mp_url', '公众号消息链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(583, 3, '$mp_url', '公众号消息链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(584, 2, '$mp_url', '公众号消息链接', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(585, 5, '$mp_voice_format', '公众号语音格式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_format', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(586, 4, '$mp_voice_format', '公众号语音格式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_format', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(587, 3, '$mp_voice_format', '公众号语音格式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_format', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(588, 2, '$mp_voice_format', '公众号语音格式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_format', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(589, 5, '$mp_voice_recognition', '公众号消息语音识别结果', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_recognition', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(590, 4, '$mp_voice_recognition', '公众号消息语音识别结果', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_recognition', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(591, 3, '$mp_voice_recognition', '公众号消息语音识别结果', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_recognition', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(592, 2, '$mp_voice_recognition', '公众号消息语音识别结果', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__mp_voice_recognition', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(593, 5, '$network_type', '网络类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__network_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(594, 4, '$network_type', '网络类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__network_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(595, 3, '$network_type', '网络类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__network_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(596, 2, '$network_type', '网络类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__network_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(597, 5, '$os', '操作系统', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(598, 4, '$os', '操作系统', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(599, 3, '$os', '操作系统', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(600, 2, '$os', '操作系统', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(601, 5, '$os_version', '操作系统版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(602, 4, '$os_version', '操作系统版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(603, 3, '$os_version', '操作系统版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(604, 2, '$os_version', '操作系统版本', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__os_version', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(605, 5, '$page_height', '页面高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(606, 4, '$page_height', '页面高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(607, 3, '$page_height', '页面高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(608, 2, '$page_height', '页面高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(609, 5, '$page_resource_size', '页面资源大小', 'KB', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_resource_size', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(610, 4, '$page_resource_size', '页面资源大小', 'KB', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_resource_size', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(611, 3, '$page_resource_size', '页面资源大小', 'KB', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_resource_size', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(612, 2, '$page_resource_size', '页面资源大小', 'KB', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_resource_size', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(613, 5, '$page_x', '页面 X 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_x', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(614, 4, '$page_x', '页面 X 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_x', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(615, 3, '$page_x', '页面 X 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_x', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(616, 2, '$page_x', '页面 X 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_x', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(617, 5, '$page_y', '页面 Y 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_y', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(618, 4, '$page_y', '页面 Y 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_y', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(619, 3, '$page_y', '页面 Y 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_y', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(620, 2, '$page_y', '页面 Y 坐标', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__page_y', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(621, 5, '$province', '省份', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__province', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(622, 4, '$province', '省份', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__province', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(623, 3, '$province', '省份', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__province', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(624, 2, '$province', '省份', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__province', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(625, 5, '$receive_time', '$receive_time', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__receive_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(626, 4, '$receive_time', '$receive_time', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__receive_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(627, 3, '$receive_time', '$receive_time', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__receive_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(628, 2, '$receive_time', '$receive_time', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__receive_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(629, 5, '$referrer', '前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(630, 4, '$referrer', '前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(631, 3, '$referrer', '前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(632, 2, '$referrer', '前向地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(633, 5, '$referrer_host', '前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(634, 4, '$referrer_host', '前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(635, 3, '$referrer_host', '前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(636, 2, '$referrer_host', '前向域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(637, 5, '$referrer_title', '前向页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(638, 4, '$referrer_title', '前向页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(639, 3, '$referrer_title', '前向页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(640, 2, '$referrer_title', '前向页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__referrer_title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(641, 5, '$resume_from_background', '是否从后台唤醒', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__resume_from_background', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(642, 4, '$resume_from_background', '是否从后台唤醒', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__resume_from_background', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(643, 3, '$resume_from_background', '是否从后台唤醒', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__resume_from_background', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(644, 2, '$resume_from_background', '是否从后台唤醒', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__resume_from_background', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(645, 5, '$sa_utm', '渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sa_utm', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(646, 4, '$sa_utm', '渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sa_utm', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(647, 3, '$sa_utm', '渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sa_utm', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(648, 2, '$sa_utm', '渠道来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sa_utm', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(649, 5, '$scene', '启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__scene', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(650, 4, '$scene', '启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__scene', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(651, 3, '$scene', '启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__scene', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(652, 2, '$scene', '启动场景', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__scene', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(653, 5, '$screen_height', '屏幕高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(654, 4, '$screen_height', '屏幕高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(655, 3, '$screen_height', '屏幕高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(656, 2, '$screen_height', '屏幕高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(657, 5, '$screen_name', '页面名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(658, 4, '$screen_name', '页面名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(659, 3, '$screen_name', '页面名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(660, 2, '$screen_name', '页面名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(661, 5, '$screen_orientation', '屏幕方向', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_orientation', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(662, 4, '$screen_orientation', '屏幕方向', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_orientation', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(663, 3, '$screen_orientation', '屏幕方向', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_orientation', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(664, 2, '$screen_orientation', '屏幕方向', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_orientation', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(665, 5, '$screen_width', '屏幕宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_width', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(666, 4, '$screen_width', '屏幕宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_width', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(667, 3, '$screen_width', '屏幕宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_width', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(668, 2, '$screen_width', '屏幕宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__screen_width', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(669, 5, '$sf_audience_id', '运营受众 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_audience_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(670, 4, '$sf_audience_id', '运营受众 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_audience_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(671, 3, '$sf_audience_id', '运营受众 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_audience_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(672, 2, '$sf_audience_id', '运营受众 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_audience_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(673, 5, '$sf_channel_category', '消息通道类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_category', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(674, 4, '$sf_channel_category', '消息通道类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_category', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(675, 3, '$sf_channel_category', '消息通道类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_category', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(676, 2, '$sf_channel_category', '消息通道类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_category', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(677, 5, '$sf_channel_id', '运营计划推送通道 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(678, 4, '$sf_channel_id', '运营计划推送通道 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(679, 3, '$sf_channel_id', '运营计划推送通道 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(680, 2, '$sf_channel_id', '运营计划推送通道 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(681, 5, '$sf_channel_service_name', '消息发送服务商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_service_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(682, 4, '$sf_channel_service_name', '消息发送服务商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_service_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(683, 3, '$sf_channel_service_name', '消息发送服务商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_service_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(684, 2, '$sf_channel_service_name', '消息发送服务商', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_channel_service_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(685, 5, '$sf_convert_id', '目标 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_convert_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(686, 4, '$sf_convert_id', '目标 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_convert_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(687, 3, '$sf_convert_id', '目标 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_convert_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(688, 2, '$sf_convert_id', '目标 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_convert_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(689, 5, '$sf_enter_plan_time', '进入计划时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_enter_plan_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(690, 4, '$sf_enter_plan_time', '进入计划时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_enter_plan_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(691, 3, '$sf_enter_plan_time', '进入计划时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_enter_plan_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(692, 2, '$sf_enter_plan_time', '进入计划时间', NULL, 5, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_enter_plan_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(693, 5, '$sf_fail_reason', '消息发送失败原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_fail_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(694, 4, '$sf_fail_reason', '消息发送失败原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_fail_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(695, 3, '$sf_fail_reason', '消息发送失败原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_fail_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(696, 2, '$sf_fail_reason', '消息发送失败原因', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_fail_reason', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(697, 5, '$sf_keyword', '回复消息命中的关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(698, 4, '$sf_keyword', '回复消息命中的关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(699, 3, '$sf_keyword', '回复消息命中的关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(700, 2, '$sf_keyword', '回复消息命中的关键词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(701, 5, '$sf_keyword_rule_id', '关键词规则名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword_rule_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(702, 4, '$sf_keyword_rule_id', '关键词规则名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword_rule_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(703, 3, '$sf_keyword_rule_id', '关键词规则名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword_rule_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(704, 2, '$sf_keyword_rule_id', '关键词规则名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_keyword_rule_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(705, 5, '$sf_msg_errcode', '消息终态错误代码', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_errcode', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(706, 4, '$sf_msg_errcode', '消息终态错误代码', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_errcode', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(707, 3, '$sf_msg_errcode', '消息终态错误代码', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_errcode', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(708, 2, '$sf_msg_errcode', '消息终态错误代码', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_errcode', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(709, 5, '$sf_msg_group_id', '消息组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(710, 4, '$sf_msg_group_id', '消息组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(711, 3, '$sf_msg_group_id', '消息组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(712, 2, '$sf_msg_group_id', '消息组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(713, 5, '$sf_msg_group_type', '消息组消息类型枚举值', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(714, 4, '$sf_msg_group_type', '消息组消息类型枚举值', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(715, 3, '$sf_msg_group_type', '消息组消息类型枚举值', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(716, 2, '$sf_msg_group_type', '消息组消息类型枚举值', NULL, 3, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_group_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(717, 5, '$sf_msg_id', '推送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(718, 4, '$sf_msg_id', '推送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(719, 3, '$sf_msg_id', '推送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(720, 2, '$sf_msg_id', '推送消息 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(721, 5, '$sf_msg_status', '消息最终状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_status', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(722, 4, '$sf_msg_status', '消息最终状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_status', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(723, 3, '$sf_msg_status', '消息最终状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_status', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(724, 2, '$sf_msg_status', '消息最终状态', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_msg_status', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(725, 5, '$sf_plan_id', '运营计划名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(726, 4, '$sf_plan_id', '运营计划名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(727, 3, '$sf_plan_id', '运营计划名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(728, 2, '$sf_plan_id', '运营计划名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(729, 5, '$sf_plan_strategy_id', '实验组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_strategy_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(730, 4, '$sf_plan_strategy_id', '实验组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_strategy_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(731, 3, '$sf_plan_strategy_id', '实验组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_strategy_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(732, 2, '$sf_plan_strategy_id', '实验组 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_strategy_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(733, 5, '$sf_plan_type', '计划类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(734, 4, '$sf_plan_type', '计划类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(735, 3, '$sf_plan_type', '计划类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(736, 2, '$sf_plan_type', '计划类型', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_plan_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(737, 5, '$sf_reply_contain_qr', '是否回复二维码', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_reply_contain_qr', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(738, 4, '$sf_reply_contain_qr', '是否回复二维码', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_reply_contain_qr', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(739, 3, '$sf_reply_contain_qr', '是否回复二维码', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_reply_contain_qr', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(740, 2, '$sf_reply_contain_qr', '是否回复二维码', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_reply_contain_qr', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(741, 5, '$sf_strategy_unit_id', '策略器名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_strategy_unit_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(742, 4, '$sf_strategy_unit_id', '策略器名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_strategy_unit_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(743, 3, '$sf_strategy_unit_id', '策略器名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_strategy_unit_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(744, 2, '$sf_strategy_unit_id', '策略器名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_strategy_unit_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(745, 5, '$sf_succeed', '消息发送成功', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_succeed', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(746, 4, '$sf_succeed', '消息发送成功', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_succeed', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(747, 3, '$sf_succeed', '消息发送成功', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_succeed', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(748, 2, '$sf_succeed', '消息发送成功', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_succeed', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(749, 5, '$sf_total_msgs', '配置的回复条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(750, 4, '$sf_total_msgs', '配置的回复条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(751, 3, '$sf_total_msgs', '配置的回复条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(752, 2, '$sf_total_msgs', '配置的回复条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(753, 5, '$sf_total_msgs_success', '回复消息条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs_success', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(754, 4, '$sf_total_msgs_success', '回复消息条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs_success', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(755, 3, '$sf_total_msgs_success', '回复消息条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs_success', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(756, 2, '$sf_total_msgs_success', '回复消息条数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__sf_total_msgs_success', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(757, 5, '$share_depth', '分享次数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_depth', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(758, 4, '$share_depth', '分享次数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_depth', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(759, 3, '$share_depth', '分享次数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_depth', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(760, 2, '$share_depth', '分享次数', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_depth', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(761, 5, '$share_distinct_id', '分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_distinct_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(762, 4, '$share_distinct_id', '分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_distinct_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(763, 3, '$share_distinct_id', '分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_distinct_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(764, 2, '$share_distinct_id', '分享者', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_distinct_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(765, 5, '$share_method', '分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(766, 4, '$share_method', '分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(767, 3, '$share_method', '分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(768, 2, '$share_method', '分享时途径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_method', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(769, 5, '$share_url_path', '分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(770, 4, '$share_url_path', '分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(771, 3, '$share_url_path', '分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(772, 2, '$share_url_path', '分享路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__share_url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(773, 5, '$short_url_key', '短链 Key', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(774, 4, '$short_url_key', '短链 Key', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(775, 3, '$short_url_key', '短链 Key', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(776, 2, '$short_url_key', '短链 Key', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_key', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(777, 5, '$short_url_target', '短链目标地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_target', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(778, 4, '$short_url_target', '短链目标地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_target', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(779, 3, '$short_url_target', '短链目标地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_target', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(780, 2, '$short_url_target', '短链目标地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__short_url_target', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(781, 5, '$source_package_name', '来源应用包名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__source_package_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(782, 4, '$source_package_name', '来源应用包名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__source_package_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(783, 3, '$source_package_name', '来源应用包名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__source_package_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(784, 2, '$source_package_name', '来源应用包名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__source_package_name', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(785, 5, '$timezone_offset', '时区偏移量', '秒', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__timezone_offset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(786, 4, '$timezone_offset', '时区偏移量', '秒', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__timezone_offset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(787, 3, '$timezone_offset', '时区偏移量', '秒', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__timezone_offset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(788, 2, '$timezone_offset', '时区偏移量', '秒', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__timezone_offset', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(789, 5, '$title', '页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(790, 4, '$title', '页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(791, 3, '$title', '页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(792, 2, '$title', '页面标题', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__title', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(793, 5, '$track_signup_original_id', '关联原始 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__track_signup_original_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(794, 4, '$track_signup_original_id', '关联原始 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__track_signup_original_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(795, 3, '$track_signup_original_id', '关联原始 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__track_signup_original_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(796, 2, '$track_signup_original_id', '关联原始 ID', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__track_signup_original_id', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(797, 5, '$update_time', '更新时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__update_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(798, 4, '$update_time', '更新时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__update_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(799, 3, '$update_time', '更新时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__update_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(800, 2, '$update_time', '更新时间', NULL, 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__update_time', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(801, 5, '$url', '页面地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(802, 4, '$url', '页面地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(803, 3, '$url', '页面地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(804, 2, '$url', '页面地址', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(805, 5, '$url_host', '页面地址域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(806, 4, '$url_host', '页面地址域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(807, 3, '$url_host', '页面地址域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(808, 2, '$url_host', '页面地址域名', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_host', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(809, 5, '$url_path', '页面路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(810, 4, '$url_path', '页面路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(811, 3, '$url_path', '页面路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(812, 2, '$url_path', '页面路径', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_path', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(813, 5, '$url_query', '页面参数', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_query', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(814, 4, '$url_query', '页面参数', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_query', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(815, 3, '$url_query', '页面参数', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_query', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(816, 2, '$url_query', '页面参数', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__url_query', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(817, 5, '$user_agent', 'UserAgent', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__user_agent', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(818, 4, '$user_agent', 'UserAgent', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__user_agent', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(819, 3, '$user_agent', 'UserAgent', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__user_agent', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(820, 2, '$user_agent', 'UserAgent', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__user_agent', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(821, 5, '$utm_campaign', '广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_campaign', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(822, 4, '$utm_campaign', '广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_campaign', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(823, 3, '$utm_campaign', '广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_campaign', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(824, 2, '$utm_campaign', '广告系列名称', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_campaign', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(825, 5, '$utm_content', '广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(826, 4, '$utm_content', '广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(827, 3, '$utm_content', '广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(828, 2, '$utm_content', '广告系列内容', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_content', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(829, 5, '$utm_matching_type', '渠道追踪匹配模式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_matching_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(830, 4, '$utm_matching_type', '渠道追踪匹配模式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_matching_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(831, 3, '$utm_matching_type', '渠道追踪匹配模式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_matching_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(832, 2, '$utm_matching_type', '渠道追踪匹配模式', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_matching_type', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(833, 5, '$utm_medium', '广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_medium', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(834, 4, '$utm_medium', '广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_medium', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(835, 3, '$utm_medium', '广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_medium', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(836, 2, '$utm_medium', '广告系列媒介', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_medium', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(837, 5, '$utm_source', '广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(838, 4, '$utm_source', '广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(839, 3, '$utm_source', '广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(840, 2, '$utm_source', '广告系列来源', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_source', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(841, 5, '$utm_term', '广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_term', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(842, 4, '$utm_term', '广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_term', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(843, 3, '$utm_term', '广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_term', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(844, 2, '$utm_term', '广告系列字词', NULL, 2, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__utm_term', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(845, 5, '$viewport_height', '视区高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(846, 4, '$viewport_height', '视区高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(847, 3, '$viewport_height', '视区高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(848, 2, '$viewport_height', '视区高度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_height', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(849, 5, '$viewport_position', '视区距顶部的位置', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_position', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(850, 4, '$viewport_position', '视区距顶部的位置', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_position', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(851, 3, '$viewport_position', '视区距顶部的位置', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_position', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(852, 2, '$viewport_position', '视区距顶部的位置', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_position', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(853, 5, '$viewport_width', '视区宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_width', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(854, 4, '$viewport_width', '视区宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_width', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(855, 3, '$viewport_width', '视区宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_width', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(856, 2, '$viewport_width', '视区宽度', '像素', 1, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__viewport_width', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(857, 5, '$wifi', '是否 WIFI', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__wifi', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(858, 4, '$wifi', '是否 WIFI', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__wifi', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(859, 3, '$wifi', '是否 WIFI', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__wifi', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251'),(860, 2, '$wifi', '是否 WIFI', NULL, 6, NULL, 0, NULL, NULL, 1, 1, 0, NULL, NULL, NULL, 'p__wifi', '2025-05-28 10:50:01.539251', '2025-05-28 10:50:01.539251')
 ;
 SELECT setval(pg_get_serial_sequence('user_track.property_define', 'id'), COALESCE((SELECT MAX(id) FROM user_track.property_define), 1));
+
+-- meta-api 元数据快照按 update_time 水位增量读取：后台直接 UPDATE accepted / is_in_use 等列时同步刷新 update_time，
+-- 语句显式设置了 update_time 时保持原值。以下语句可重复执行，用于已有库补建。
+CREATE OR REPLACE FUNCTION user_track.touch_update_time() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  IF NEW.update_time IS NOT DISTINCT FROM OLD.update_time THEN
+    NEW.update_time := now();
+  END IF;
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS event_define_touch_update_time ON user_track.event_define;
+CREATE TRIGGER event_define_touch_update_time BEFORE UPDATE ON user_track.event_define
+  FOR EACH ROW EXECUTE FUNCTION user_track.touch_update_time();
+DROP TRIGGER IF EXISTS property_define_touch_update_time ON user_track.property_define;
+CREATE TRIGGER property_define_touch_update_time BEFORE UPDATE ON user_track.property_define
+  FOR EACH ROW EXECUTE FUNCTION user_track.touch_update_time();
+
+-- 元数据变更通知：project / event_define / property_define 的增删改在事务提交时 NOTIFY meta_catalog，
+-- meta-api（META_CATALOG_CHANNEL=meta_catalog）各副本 LISTEN 后增量更新元数据快照。
+-- 语句级触发器按语句聚合变更行，payload 为 {"t": 表名, "op": 操作, "rows": [[id, 列...], ...]}，
+-- 按 7000 字节分片（NOTIFY 上限 8000）。以下语句可重复执行，用于给已有库补装
+CREATE OR REPLACE FUNCTION user_track.notify_catalog_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+  cols TEXT;
+  row_json TEXT;
+  buf TEXT := '';
+  head TEXT := format('{"t":"%s","op":"%s","rows":[', TG_TABLE_NAME, TG_OP);
+BEGIN
+  cols := CASE TG_TABLE_NAME
+    WHEN 'project' THEN 'id, name, is_auto_create, status'
+    WHEN 'event_define' THEN 'id, project_id, name, accepted'
+    ELSE 'id, project_id, name, data_type, is_in_use'
+  END;
+  FOR row_json IN EXECUTE format('SELECT json_build_array(%s)::text FROM %I', cols,
+                                 CASE TG_OP WHEN 'DELETE' THEN 'old_rows' ELSE 'new_rows' END)
+  LOOP
+    IF buf <> '' AND octet_length(head) + octet_length(buf) + octet_length(row_json) > 7000 THEN
+      PERFORM pg_notify('meta_catalog', head || buf || ']}');
+      buf := '';
+    END IF;
+    buf := CASE WHEN buf = '' THEN row_json ELSE buf || ',' || row_json END;
+  END LOOP;
+  IF buf <> '' THEN
+    PERFORM pg_notify('meta_catalog', head || buf || ']}');
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+  tbl TEXT;
+BEGIN
+  FOREACH tbl IN ARRAY ARRAY['project', 'event_define', 'property_define'] LOOP
+    EXECUTE format('DROP TRIGGER IF EXISTS %I ON user_track.%I', tbl || '_notify_insert', tbl);
+    EXECUTE format('DROP TRIGGER IF EXISTS %I ON user_track.%I', tbl || '_notify_update', tbl);
+    EXECUTE format('DROP TRIGGER IF EXISTS %I ON user_track.%I', tbl || '_notify_delete', tbl);
+    EXECUTE format('CREATE TRIGGER %I AFTER INSERT ON user_track.%I REFERENCING NEW TABLE AS new_rows '
+                   'FOR EACH STATEMENT EXECUTE FUNCTION user_track.notify_catalog_change()', tbl || '_notify_insert', tbl);
+    EXECUTE format('CREATE TRIGGER %I AFTER UPDATE ON user_track.%I REFERENCING NEW TABLE AS new_rows '
+                   'FOR EACH STATEMENT EXECUTE FUNCTION user_track.notify_catalog_change()', tbl || '_notify_update', tbl);
+    EXECUTE format('CREATE TRIGGER %I AFTER DELETE ON user_track.%I REFERENCING OLD TABLE AS old_rows '
+                   'FOR EACH STATEMENT EXECUTE FUNCTION user_track.notify_catalog_change()', tbl || '_notify_delete', tbl);
+  END LOOP;
+END;
+$$;
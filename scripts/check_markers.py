@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+追踪标记检查脚本
+对照 replay_logs.py --marker-interval 写下的发送记录，统计每个标记在各段的到达延迟：
+  - 注册段：从 meta-api /metrics 读取 meta_api_marker_lag_seconds 直方图（所有 worker 汇总）
+  - 落地段：扫描本地输出目录（替代 S3 的 file sink 输出，TSV，可 .gz），按文件修改时间计算落地延迟
+
+用法：
+  python3 scripts/check_markers.py --dir /tmp/lakehouse-out
+                                                    # 使用 test_data/.markers 下最新的发送记录
+  python3 scripts/check_markers.py --markers test_data/.markers/markers-20260214-100000.jsonl \\
+      --dir /tmp/lakehouse-out --meta-url http://localhost:3000 --slo 60
+                                                    # 同时读取 meta-api 直方图，p99 落地延迟超过 60 秒时退出码为 1
+
+发送后不足 --grace 秒（默认 60，覆盖 Vector S3 sink 的 30 秒批次超时）的标记仍可能在途，不计入缺失。
+"""
+
+import sys
+import gzip
+import json
+import time
+import argparse
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent))
+import replay_logs as replay  # noqa: E402
+
+# format_events_tsv 中事件名所在列
+TSV_EVENT_COLUMN = 5
+
+
+def load_markers(path) -> dict:
+    """发送记录：tracer_id -> 发送时刻（毫秒），只保留发送成功的标记"""
+    sent = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            if rec.get("status") == 200:
+                sent[rec["id"]] = rec["sent_ms"]
+    return sent
+
+
+def scan_dir(root) -> dict:
+    """扫描输出目录中的标记事件：tracer_id -> 所在文件的修改时刻（秒），同一标记取最早出现的文件"""
+    landed = {}
+    for path in Path(root).rglob("*"):
+        if not path.is_file() or path.name.startswith("."):
+            continue
+        opener = gzip.open if path.suffix == ".gz" else open
+        mtime = path.stat().st_mtime
+        try:
+            with opener(path, "rt", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if replay.MARKER_PREFIX not in line:
+                        continue
+                    cols = line.rstrip("\n").split("\t")
+                    if len(cols) > TSV_EVENT_COLUMN and cols[TSV_EVENT_COLUMN].startswith(replay.MARKER_PREFIX):
+                        tracer_id = cols[TSV_EVENT_COLUMN][len(replay.MARKER_PREFIX):]
+                        landed[tracer_id] = min(mtime, landed.get(tracer_id, mtime))
+        except (OSError, EOFError):
+            continue
+    return landed
+
+
+def meta_lag(meta_url) -> dict | None:
+    """读取 meta-api 的标记延迟直方图，返回 {count, sum, buckets: [(上界, 累计数)]}"""
+    try:
+        text = requests.get(meta_url.rstrip("/") + "/metrics", timeout=10).text
+    except requests.RequestException as e:
+        print(f"  meta-api 不可用: {e}")
+        return None
+    hist = {"count": 0, "sum": 0.0, "buckets": []}
+    for line in text.splitlines():
+        if not line.startswith("meta_api_marker_lag_seconds"):
+            continue
+        name, _, value = line.rpartition(" ")
+        if name.startswith("meta_api_marker_lag_seconds_bucket"):
+            le = name.split('le="', 1)[1].split('"', 1)[0]
+            hist["buckets"].append((float(le), float(value)))
+        elif name.startswith("meta_api_marker_lag_seconds_count"):
+            hist["count"] = float(value)
+        elif name.startswith("meta_api_marker_lag_seconds_sum"):
+            hist["sum"] = float(value)
+    return hist
+
+
+def bucket_percentile(buckets, count, p) -> float:
+    """按直方图桶上界估算分位数"""
+    rank = count * p / 100
+    for le, cum in sorted(buckets):
+        if cum >= rank:
+            return le
+    return float("inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="追踪标记端到端延迟检查")
+    parser.add_argument("--markers", type=str, default=None,
+                        help="发送记录 JSONL (默认 test_data/.markers 下最新的文件)")
+    parser.add_argument("--dir", type=str, default=None, help="本地输出目录（S3 替代），扫描其中的标记事件")
+    parser.add_argument("--meta-url", type=str, default=None, help="meta-api 地址，如 http://localhost:3000")
+    parser.add_argument("--grace", type=float, default=60, help="发送后多少秒内的标记视为在途 (默认 60)")
+    parser.add_argument("--slo", type=float, default=0, help="落地延迟 p99 上限秒数，超过时退出码为 1 (0=不检查)")
+    args = parser.parse_args()
+
+    marker_path = Path(args.markers) if args.markers else None
+    if marker_path is None:
+        candidates = sorted((Path(__file__).parent.parent / replay.TEST_DATA_DIR / replay.MARKER_DIR).glob("markers-*.jsonl"))
+        if not candidates:
+            print("错误: 未找到发送记录，请先用 replay_logs.py --marker-interval 重放或指定 --markers")
+            return 2
+        marker_path = candidates[-1]
+    sent = load_markers(marker_path)
+    print(f"{'=' * 60}")
+    print(f"  发送记录:   {marker_path} ({len(sent)} 个标记)")
+
+    failed = False
+    if args.meta_url:
+        hist = meta_lag(args.meta_url)
+        if hist is not None and hist["count"]:
+            n = hist["count"]
+            print(f"  注册段:     {n:,.0f} 个到达 meta-api, 平均 {hist['sum'] / n:.1f}s, "
+                  + "  ".join(f"p{p} ≤{bucket_percentile(hist['buckets'], n, p):g}s" for p in (50, 90, 99)))
+        elif hist is not None:
+            print("  注册段:     meta-api 尚未收到标记")
+
+    if args.dir:
+        landed = scan_dir(args.dir)
+        cutoff_ms = (time.time() - args.grace) * 1000
+        lag = replay.LatencyHistogram()
+        missing = []
+        for tracer_id, sent_ms in sorted(sent.items(), key=lambda kv: kv[1]):
+            if tracer_id in landed:
+                lag.record(max(0.0, landed[tracer_id] - sent_ms / 1000))
+            elif sent_ms < cutoff_ms:
+                missing.append(tracer_id)
+        in_flight = len(sent) - lag.count - len(missing)
+        print(f"  落地段:     {lag.count} 个已落地, {len(missing)} 个缺失, {in_flight} 个在途")
+        if lag.count:
+            print("  落地延迟:   " + "  ".join(f"p{p:g} {lag.percentile_ms(p) / 1000:.1f}s" for p in replay.PERCENTILES)
+                  + f"  max {lag.max_us / 1e6:.1f}s")
+        if missing:
+            print(f"  缺失标记:   {', '.join(missing[:10])}{' ...' if len(missing) > 10 else ''}")
+        if args.slo > 0:
+            p99 = lag.percentile_ms(99) / 1000
+            ok = lag.count > 0 and not missing and p99 <= args.slo
+            print(f"  SLO:        p99 {p99:.1f}s {'≤' if p99 <= args.slo else '>'} {args.slo:g}s"
+                  f"{'' if not missing else '，存在缺失标记'} → {'通过' if ok else '未通过'}")
+            failed = not ok
+    print(f"{'=' * 60}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
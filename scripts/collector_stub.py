@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地采集端替身
+接受与 Nginx /sa 相同的 GET / POST 协议并立即返回 200，可选按 vector.yaml 中 sa_decode / sa_unnest 的规则
+解码载荷（url-safe base64 → 百分号解码 → base64 → gzip=1 时解压 → JSON → 数组展开），统计请求数、事件数、
+解码错误与请求字节数。用于：
+  - replay_logs.py --calibrate：测量重放端自身在当前机器上的最大 req/s 与 events/s，作为每次真实压测的基线
+  - 没有 Docker 环境时开发调试重放脚本
+
+多进程通过 SO_REUSEPORT 共享同一端口，避免替身自身成为瓶颈；安装了 aiohttp 时使用 aiohttp，否则退化为 http.server。
+
+用法：
+  python3 scripts/collector_stub.py --port 8090                # 解码并计数，Ctrl+C 退出时打印汇总
+  python3 scripts/collector_stub.py --port 8090 --procs 4 --no-decode
+                                                    # 4 进程，只计请求数与字节数
+"""
+
+import sys
+import gzip
+import time
+import json
+import signal
+import socket
+import base64
+import asyncio
+import argparse
+import binascii
+import threading
+import contextlib
+import multiprocessing
+from urllib.parse import unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+# 每个进程一组共享计数，按下标写入
+FIELDS = ("requests", "events", "bytes", "cpu_s",
+          "no_payload", "base64_decode_error", "gzip_decode_error", "json_parse_error")
+_IDX = {name: i for i, name in enumerate(FIELDS)}
+
+
+# ---- 载荷解码 ----
+
+def _parse_kv(s: str) -> dict:
+    """与 VRL parse_key_value 一致：按 & 和 = 切分，不做 + → 空格的转换（base64 中的 + 原样保留）"""
+    out = {}
+    for part in s.split("&"):
+        if part:
+            key, _, value = part.partition("=")
+            out[key] = value
+    return out
+
+
+def decode_request(method: str, query: str, body: bytes) -> tuple:
+    """按 sa_decode / sa_unnest 的规则解码，返回 (事件数, 错误类型或 None)"""
+    args = _parse_kv(query)
+    is_gzip = args.get("gzip", "-")
+    raw = ""
+    if method == "POST":
+        form = _parse_kv(body.decode("utf-8", "replace")) if body else {}
+        raw = form.get("data_list", form.get("data", ""))
+        is_gzip = form.get("gzip", is_gzip)
+    elif method == "GET":
+        raw = args.get("data", "-")
+        if raw in ("", "-"):
+            raw = args.get("data_list", "")
+    if raw in ("", "-"):
+        return 0, "no_payload"
+
+    raw = unquote(raw.replace("-", "+").replace("_", "/"))
+    try:
+        decoded = base64.b64decode(raw + "=" * (-len(raw) % 4))
+    except (binascii.Error, ValueError):
+        return 0, "base64_decode_error"
+    if unquote(is_gzip) == "1":
+        try:
+            decoded = gzip.decompress(decoded)
+        except (OSError, EOFError):
+            return 0, "gzip_decode_error"
+    try:
+        payload = json.loads(decoded)
+    except ValueError:
+        return 0, "json_parse_error"
+    if isinstance(payload, list):
+        return sum(1 for p in payload if isinstance(p, dict)), None
+    return (1, None) if isinstance(payload, dict) else (0, None)
+
+
+class Counters:
+    """本进程的计数，直接写入共享内存，由父进程汇总；多线程服务时传入 lock"""
+
+    def __init__(self, shared, decode: bool, lock=None):
+        self.shared = shared
+        self.decode = decode
+        self.lock = lock or contextlib.nullcontext()
+
+    def record(self, method: str, query: str, body: bytes):
+        events, error = decode_request(method, query, body) if self.decode else (0, None)
+        shared = self.shared
+        with self.lock:
+            shared[0] += 1
+            shared[1] += events
+            shared[2] += len(query) + len(body)
+            if error is not None:
+                shared[_IDX[error]] += 1
+
+    def tick(self):
+        self.shared[3] = time.process_time()
+
+
+# ---- 服务进程 ----
+
+def _reuse_port_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(1024)
+    return sock
+
+
+async def _serve_aiohttp(host, port, counters):
+    async def handler(request):
+        body = await request.read() if request.method == "POST" else b""
+        counters.record(request.method, request.rel_url.raw_query_string, body)
+        return web.Response(status=200)
+
+    server = web.Server(handler, access_log=None)
+    loop = asyncio.get_running_loop()
+    await loop.create_server(server, sock=_reuse_port_socket(host, port), backlog=1024)
+    while True:
+        counters.tick()
+        await asyncio.sleep(0.5)
+
+
+def _serve_http_server(host, port, counters):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _handle(self):
+            path, _, query = self.path.partition("?")
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0)) if self.command == "POST" else b""
+            counters.record(self.command, query, body)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_GET = do_POST = _handle
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+
+        def server_bind(self):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            super().server_bind()
+
+    httpd = Server((host, port), Handler)
+
+    def _tick():
+        while True:
+            counters.tick()
+            time.sleep(0.5)
+
+    threading.Thread(target=_tick, daemon=True).start()
+    httpd.serve_forever()
+
+
+def _serve(host, port, shared, decode):
+    try:
+        if web is not None:
+            asyncio.run(_serve_aiohttp(host, port, Counters(shared, decode)))
+        else:
+            _serve_http_server(host, port, Counters(shared, decode, threading.Lock()))
+    except KeyboardInterrupt:
+        pass
+
+
+class CollectorStub:
+    """在 procs 个子进程中运行替身，共享 host:port（port 为 0 时自动选择空闲端口）"""
+
+    def __init__(self, host="127.0.0.1", port=0, procs=1, decode=True):
+        self.host = host
+        self.port = port or _free_port(host)
+        self.procs = max(1, procs)
+        self.decode = decode
+        self.shared = [multiprocessing.Array("d", len(FIELDS), lock=False) for _ in range(self.procs)]
+        self.workers = []
+        self.started = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/sa"
+
+    def start(self, timeout=10.0):
+        self.workers = [multiprocessing.Process(target=_serve, args=(self.host, self.port, s, self.decode),
+                                                daemon=True)
+                        for s in self.shared]
+        for w in self.workers:
+            w.start()
+        deadline = time.time() + timeout
+        while True:
+            try:
+                socket.create_connection((self.host, self.port), timeout=1).close()
+                break
+            except OSError:
+                if time.time() > deadline or not all(w.is_alive() for w in self.workers):
+                    self.stop()
+                    raise RuntimeError(f"采集端替身未能在 {self.host}:{self.port} 启动")
+                time.sleep(0.05)
+        self.started = time.time()
+        return self
+
+    def stop(self):
+        for w in self.workers:
+            w.terminate()
+        for w in self.workers:
+            w.join()
+
+    def totals(self) -> dict:
+        out = {name: sum(s[i] for s in self.shared) for i, name in enumerate(FIELDS)}
+        return {k: (round(v, 3) if k == "cpu_s" else int(v)) for k, v in out.items()}
+
+    def summary(self, elapsed: float) -> dict:
+        """汇总计数与速率；cpu_util 为替身进程的平均 CPU 利用率，接近 1 时说明替身本身已饱和"""
+        totals = self.totals()
+        totals["elapsed_s"] = round(elapsed, 3)
+        totals["req_per_s"] = round(totals["requests"] / elapsed, 1) if elapsed > 0 else 0
+        totals["events_per_s"] = round(totals["events"] / elapsed, 1) if elapsed > 0 else 0
+        totals["cpu_util"] = round(totals["cpu_s"] / (elapsed * self.procs), 3) if elapsed > 0 else 0
+        return totals
+
+
+def _free_port(host) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
+
+def format_summary(summary: dict, decode: bool) -> list:
+    lines = [f"  请求:       {summary['requests']:,} ({summary['req_per_s']:,.0f} req/s), "
+             f"{summary['bytes'] / 1e6:,.1f} MB"]
+    if decode:
+        errors = "  ".join(f"{k}={summary[k]:,}" for k in FIELDS[4:] if summary[k]) or "-"
+        lines.append(f"  事件:       {summary['events']:,} ({summary['events_per_s']:,.0f} events/s), 解码错误: {errors}")
+    lines.append(f"  替身 CPU:   {summary['cpu_util'] * 100:.0f}%")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地采集端替身（/sa 协议）")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="监听地址 (默认 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8090, help="监听端口 (默认 8090)")
+    parser.add_argument("--procs", type=int, default=1, help="服务进程数 (默认 1)，共享端口")
+    parser.add_argument("--no-decode", action="store_true", help="不解码载荷，只统计请求数与字节数")
+    parser.add_argument("--report", type=float, default=5, help="打印累计速率的间隔秒数 (默认 5，0=不打印)")
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    stub = CollectorStub(args.host, args.port, args.procs, not args.no_decode).start()
+    print(f"采集端替身已启动: {stub.url} ({stub.procs} 进程, {'aiohttp' if web is not None else 'http.server'}, "
+          f"{'解码' if stub.decode else '不解码'})")
+    last = stub.totals()
+    try:
+        while True:
+            time.sleep(args.report or 3600)
+            if args.report:
+                now = stub.totals()
+                print(f"  [{time.time() - stub.started:6.0f}s] {(now['requests'] - last['requests']) / args.report:,.0f} req/s"
+                      + (f", {(now['events'] - last['events']) / args.report:,.0f} events/s" if stub.decode else ""),
+                      flush=True)
+                last = now
+    except KeyboardInterrupt:
+        pass
+    # 退出阶段忽略重复到达的信号（如 timeout 会向整个进程组再发一次）
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    summary = stub.summary(time.time() - stub.started)
+    stub.stop()
+    print("\n".join(format_summary(summary, stub.decode)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vector 管道直写压测脚本
+不经过 Nginx / HTTP，把 test_data 下的原始日志按 log_extractor 格式（"..." ++_ "..."）直接追加到
+Vector 监听的日志文件，按 logrotate-nginx.conf 的方式轮转，同时盯住输出端统计端到端吞吐与延迟，
+用于在单机上单独测量 sa_decode → sa_unnest → sa_process 等 VRL 阶段的处理能力。
+
+输出端二选一（可同时使用）：
+  --tail-dir DIR    本地目录替代 S3：把 vector.yaml 中 to_s3 换成 file sink 写到 DIR，
+                    例如 type: "file", path: "DIR/events-%Y%m%d%H.tsv"（支持 .gz），统计新增行数
+  --meta-port PORT  本地 meta-api 替身：启动 Vector 时设置 META_API_URL=http://127.0.0.1:PORT/register，
+                    统计收到的元数据记录数（只包含新事件/新属性，不做 FIFO 延迟估算）
+
+用法：
+  python3 scripts/inject_logs.py --output /var/log/nginx/access.log --tail-dir /tmp/lakehouse-out
+                                                    # 尽快写入全部日志，统计输出行数与延迟
+  python3 scripts/inject_logs.py --rate 20000 --date 2026-02-14 --tail-dir /tmp/lakehouse-out
+                                                    # 按 20000 行/s 写入，事件时间映射到当天
+  python3 scripts/inject_logs.py --profile step --rate 5000 --step-rate 5000 --step-secs 30 --rotate-size 100M
+                                                    # 阶梯加压，每 100MB 轮转一次
+  python3 scripts/inject_logs.py --amplify 10 --new-prop-rate 0.01 --meta-port 3999
+                                                    # 10 倍身份放大 + 新属性注入，统计元数据注册请求
+
+延迟按 FIFO 估算：输出端第 n 条记录出现的时刻 − 第 n 个事件写入日志文件的时刻，
+sa_process 丢弃的无效事件会让估算略微偏小。
+"""
+
+import re
+import sys
+import gzip
+import json
+import time
+import zlib
+import shutil
+import bisect
+import argparse
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs, quote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, str(Path(__file__).parent))
+import replay_logs as replay  # noqa: E402
+
+LOG_FIELDS = tuple(replay.NGINX_LOG_PATTERN.groupindex)
+
+
+# ---- 日志行构造 ----
+
+def format_log_line(fields: dict) -> str:
+    """按 nginx.conf 的 log_extractor 格式拼接一行日志"""
+    return " ++_ ".join(f'"{fields[name]}"' for name in LOG_FIELDS)
+
+
+def _payload_of(fields: dict):
+    """与 sa_decode 相同的取数规则，返回 (原始载荷, 是否 gzip)"""
+    if fields["request_method"] == "POST":
+        body = parse_qs(fields["request_body"]) if fields["request_body"] != "-" else {}
+        raw = (body.get("data_list") or body.get("data") or [None])[0]
+        return raw, (body.get("gzip") or [fields["arg_gzip"]])[0] == "1"
+    raw = fields["arg_data"] if fields["arg_data"] != "-" else fields["arg_data_list"]
+    return (None if raw == "-" else raw), fields["arg_gzip"] == "1"
+
+
+def count_events(fields: dict) -> int:
+    """一行日志解码后的事件数（data_list 为数组长度），无法解码时为 0"""
+    raw, is_gzip = _payload_of(fields)
+    if not raw:
+        return 0
+    json_str = replay._decode_payload(raw, is_gzip)
+    if json_str is None:
+        return 0
+    try:
+        obj = json.loads(json_str)
+    except ValueError:
+        return 0
+    return len(obj) if isinstance(obj, list) else 1
+
+
+def _rewrite_fields(fields: dict) -> dict:
+    """按 replay_logs 的时间范围 / 放大副本改写载荷，载荷保持日志中的 URL 编码形式"""
+    fields = dict(fields)
+    time_range = replay.TIME_RANGE or (None, None)
+    if replay.AMPLIFY_COPY > 0 and replay.AMPLIFY_PROJECT:
+        project = fields["arg_project"] if fields["arg_project"] != "-" else "default"
+        fields["arg_project"] = project + replay._copy_suffix()
+    if fields["request_method"] == "POST":
+        if fields["request_body"] != "-":
+            fields["request_body"] = replay._rewrite_form_body(fields["request_body"], *time_range)
+    elif fields["arg_data"] != "-":
+        is_gzip = fields["arg_gzip"] not in ("", "-")
+        fields["arg_data"] = quote(replay._rewrite_payload(fields["arg_data"], is_gzip, *time_range), safe="")
+    elif fields["arg_data_list"] != "-":
+        fields["arg_data_list"] = quote(replay._rewrite_payload(fields["arg_data_list"], True, *time_range), safe="")
+    return fields
+
+
+def derive_lines(line: str, with_counts: bool):
+    """一行原始日志派生的全部副本，返回 (原始 msec, [(日志行, 事件数)])；无法解析时返回 None
+
+    msec 改为写入时刻（与 Nginx 实时写日志一致），原始 msec 供 original 负载曲线使用。
+    """
+    match = replay.NGINX_LOG_PATTERN.match(line.strip())
+    if not match:
+        return None
+    original = match.groupdict()
+    rewrite = replay.TIME_RANGE is not None or replay._amplifying()
+    out = []
+    try:
+        for copy in range(replay.AMPLIFY):
+            replay.AMPLIFY_COPY = copy
+            fields = _rewrite_fields(original) if rewrite or copy > 0 else dict(original)
+            fields["msec"] = f"{time.time():.3f}"
+            out.append((format_log_line(fields), count_events(fields) if with_counts else 0))
+    finally:
+        replay.AMPLIFY_COPY = 0
+    return replay._parse_msec(original["msec"]), out
+
+
+# ---- 日志轮转 ----
+
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(value: str) -> int:
+    """解析 logrotate 风格的大小：500M / 64K / 1G / 字节数"""
+    match = re.fullmatch(r"(\d+)([KMG]?)", value.strip().upper())
+    if not match:
+        raise argparse.ArgumentTypeError(f"无法解析大小: {value}，格式应为 数字[K|M|G]")
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2)]
+
+
+class RotatingLog:
+    """按 logrotate-nginx.conf（size / rotate N / create / compress / delaycompress）轮转的日志文件
+
+    超过 max_bytes 时 access.log → access.log.1，原 .1 压缩为 .2.gz，依次后移，只保留 keep 份。
+    .1 保持不压缩，Vector 的 file source 同时监听 access.log 与 access.log.1，轮转瞬间未读完的内容不丢。
+    """
+
+    def __init__(self, path, max_bytes, keep=2):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.keep = keep
+        self.rotations = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, "ab")
+        self.size = self.file.tell()
+
+    def _name(self, n):
+        return self.path.with_name(f"{self.path.name}.{n}" + (".gz" if n >= 2 else ""))
+
+    def write(self, data: bytes):
+        self.file.write(data)
+        self.size += len(data)
+
+    def flush(self):
+        self.file.flush()
+        if self.max_bytes and self.size >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self):
+        self.file.close()
+        if self.keep < 1:
+            self.path.unlink()
+        else:
+            if self._name(self.keep).exists():
+                self._name(self.keep).unlink()
+            for n in range(self.keep - 1, 1, -1):
+                if self._name(n).exists():
+                    self._name(n).rename(self._name(n + 1))
+            first = self._name(1)
+            if first.exists():
+                # delaycompress：上一轮的 .1 这时才压缩
+                with open(first, "rb") as fin, gzip.open(self._name(2), "wb") as fout:
+                    shutil.copyfileobj(fin, fout)
+                first.unlink()
+            self.path.rename(first)
+        self.file = open(self.path, "ab")
+        self.size = 0
+        self.rotations += 1
+
+    def close(self):
+        self.file.close()
+
+
+# ---- 输出端 ----
+
+class DirTail:
+    """递归统计目录下输出文件的新增行数；.gz 文件按 gzip 流增量解压（支持多 member 追加）"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.files = {}   # 路径 -> [已读偏移, 解压器或 None, 行数]
+        self.lock = threading.Lock()
+        self.baseline = 0
+        self.baseline = self.poll()
+
+    def _read(self, path, state):
+        with open(path, "rb") as f:
+            f.seek(state[0])
+            data = f.read()
+        state[0] += len(data)
+        if state[1] is None:
+            state[2] += data.count(b"\n")
+            return
+        while data:
+            out = state[1].decompress(data)
+            state[2] += out.count(b"\n")
+            if not state[1].eof:
+                break
+            data = state[1].unused_data
+            state[1] = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    def poll(self) -> int:
+        """扫描一遍目录，返回启动以来新增的行数"""
+        with self.lock:
+            for path in self.root.rglob("*"):
+                if not path.is_file() or path.name.startswith("."):
+                    continue
+                state = self.files.get(path)
+                if state is None:
+                    decoder = zlib.decompressobj(zlib.MAX_WBITS | 16) if path.suffix == ".gz" else None
+                    state = self.files[path] = [0, decoder, 0]
+                try:
+                    if path.stat().st_size > state[0]:
+                        self._read(path, state)
+                except (OSError, zlib.error):
+                    continue
+            return sum(state[2] for state in self.files.values()) - self.baseline
+
+
+class MetaSink:
+    """本地 meta-api 替身：接收 Vector to_meta_api 的 POST /register（可 gzip 的 NDJSON），只计数不入库"""
+
+    def __init__(self, port):
+        self.records = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                n = sum(1 for line in body.splitlines() if line.strip())
+                with sink.lock:
+                    sink.records += n
+                    sink.requests += 1
+                reply = json.dumps({"ok": True, "received": n}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(reply)))
+                self.end_headers()
+                self.wfile.write(reply)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def poll(self) -> int:
+        return self.records
+
+    def close(self):
+        self.server.shutdown()
+
+
+# ---- 注入 ----
+
+class Injector:
+    """写入端：按计划速率追加日志行，每次 flush 后记录 (时刻, 累计事件数) 检查点供 FIFO 延迟估算"""
+
+    def __init__(self, log: RotatingLog, schedule=None, with_counts=False, flush_lines=1000, flush_secs=0.05):
+        self.log = log
+        self.schedule = schedule
+        self.with_counts = with_counts
+        self.flush_lines = flush_lines
+        self.flush_secs = flush_secs
+        self.lines = 0
+        self.events = 0
+        self.skipped = 0
+        self.written_at = []
+        self.written_cum = []
+        self._pending = 0
+        self._last_flush = time.time()
+
+    def _flush(self):
+        self.log.flush()
+        self._last_flush = time.time()
+        self._pending = 0
+        self.written_at.append(self._last_flush)
+        self.written_cum.append(self.events)
+
+    def write_file(self, log_file):
+        for line in replay.iter_lines(log_file):
+            derived = derive_lines(line, self.with_counts)
+            if derived is None:
+                self.skipped += 1
+                continue
+            msec, copies = derived
+            for text, events in copies:
+                if self.schedule is not None:
+                    delay = self.schedule.next(msec) - time.time()
+                    if delay > 0:
+                        if self._pending:
+                            self._flush()
+                        time.sleep(delay)
+                self.log.write(text.encode("utf-8") + b"\n")
+                self.lines += 1
+                self.events += events
+                self._pending += 1
+            if self._pending >= self.flush_lines or time.time() - self._last_flush >= self.flush_secs:
+                self._flush()
+        self._flush()
+
+    def written_time_of(self, n):
+        """第 n 个事件写入（flush）的时刻，尚未写到时返回 None"""
+        idx = bisect.bisect_left(self.written_cum, n)
+        return self.written_at[idx] if idx < len(self.written_at) else None
+
+
+def _monitor(injector, tails, fifo_tail, lag_hist, stop, interval=1.0):
+    """每秒打印写入/输出速率与 FIFO 延迟，延迟样本记入 lag_hist；返回输出最后一次增长的时刻"""
+    last_lines = 0
+    last_out = {name: tail.poll() for name, tail in tails.items()}
+    last_growth = [time.time()]
+
+    def _loop():
+        nonlocal last_lines, last_out
+        while not stop.wait(interval):
+            now = time.time()
+            out = {name: tail.poll() for name, tail in tails.items()}
+            parts = [f"写入 {(injector.lines - last_lines) / interval:,.0f} 行/s (累计 {injector.lines:,})"]
+            for name, n in out.items():
+                parts.append(f"{name} {(n - last_out[name]) / interval:,.0f} 条/s (累计 {n:,})")
+                if n > last_out[name]:
+                    last_growth[0] = now
+            if fifo_tail is not None and out[fifo_tail] > last_out[fifo_tail]:
+                written = injector.written_time_of(out[fifo_tail])
+                if written is not None:
+                    lag = max(0.0, now - written)
+                    lag_hist.record(lag)
+                    parts.append(f"延迟 {lag:.1f}s")
+            print("  " + " | ".join(parts), flush=True)
+            last_lines = injector.lines
+            last_out = out
+
+    thread = threading.Thread(target=_loop, daemon=True)
+    thread.start()
+    return thread, last_growth
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector 管道直写压测（不经过 HTTP）")
+    parser.add_argument("--output", type=str, default="/var/log/nginx/access.log",
+                        help="写入的日志文件 (默认 /var/log/nginx/access.log，即 vector.yaml 的 nginx_logs 源)")
+    parser.add_argument("--rotate-size", type=parse_size, default=parse_size("500M"),
+                        help="轮转阈值，logrotate 风格大小 (默认 500M，0=不轮转)")
+    parser.add_argument("--rotate-keep", type=int, default=2, help="保留的轮转份数 (默认 2，与 logrotate 配置一致)")
+    parser.add_argument("--tail-dir", type=str, default=None, help="输出端目录（替代 S3 的 file sink 输出目录）")
+    parser.add_argument("--meta-port", type=int, default=0, help="启动本地 meta-api 替身的端口 (0=不启动)")
+    parser.add_argument("--drain-timeout", type=float, default=30,
+                        help="写完后输出端连续多少秒无增长即结束 (默认 30)")
+    parser.add_argument("--files", type=int, default=0, help="写入文件数量 (0=全部)")
+    parser.add_argument("--rate", type=float, default=0, help="写入速率 行/s (0=尽快写入；step 模式为起始速率)")
+    parser.add_argument("--profile", choices=("constant", "step", "original"), default=None,
+                        help="写入速率曲线：constant 固定速率；step 阶梯加压；original 按日志 msec 原始间隔 × --speed")
+    parser.add_argument("--step-rate", type=float, default=0, help="step 模式每段增加的速率 行/s")
+    parser.add_argument("--step-secs", type=float, default=60, help="step 模式每段持续秒数 (默认 60)")
+    parser.add_argument("--max-rate", type=float, default=0, help="step 模式速率上限 (0=不限)")
+    parser.add_argument("--speed", type=float, default=1.0, help="original 模式倍速 (默认 1.0)")
+    parser.add_argument("--rewrite", choices=("full", "fast"), default="full",
+                        help="时间改写方式，同 replay_logs.py")
+    parser.add_argument("--gzip-level", type=int, default=9, choices=range(0, 10), metavar="0-9",
+                        help="改写后重新 gzip 的压缩级别 (默认 9)")
+    parser.add_argument("--amplify", type=int, default=1, help="负载放大倍数，同 replay_logs.py")
+    parser.add_argument("--amplify-project", action="store_true", help="放大副本的项目名同样加 _a{k} 后缀")
+    parser.add_argument("--new-prop-rate", type=float, default=0.0, help="每个事件注入一个全新属性的概率 (0~1)")
+    parser.add_argument("--date", type=str, default=None, help="将事件时间映射到指定日期 (YYYY-MM-DD)")
+    parser.add_argument("--start-time", type=str, default=None, help="事件时间范围起始")
+    parser.add_argument("--end-time", type=str, default=None, help="事件时间范围结束")
+    args = parser.parse_args()
+
+    try:
+        replay.TIME_RANGE, time_label = replay.resolve_time_range(args)
+    except ValueError as e:
+        print(f"错误: {e}")
+        return
+    replay.REWRITE_MODE = args.rewrite
+    replay.GZIP_LEVEL = args.gzip_level
+    replay.AMPLIFY = max(1, args.amplify)
+    replay.AMPLIFY_PROJECT = args.amplify_project
+    replay.NEW_PROP_RATE = args.new_prop_rate
+
+    schedule = None
+    profile = args.profile or ("constant" if args.rate > 0 else None)
+    if profile is not None:
+        if profile != "original" and args.rate <= 0:
+            print(f"错误: --profile {profile} 需要指定 --rate")
+            return
+        if profile == "original" and args.speed <= 0:
+            print("错误: --speed 必须大于 0")
+            return
+        schedule = replay.Schedule(profile, args.rate, args.step_rate, args.step_secs, args.max_rate, args.speed)
+
+    log_files = replay.find_log_files(args.files)
+    if not log_files:
+        return
+
+    tails = {}
+    if args.tail_dir:
+        tails["输出目录"] = DirTail(args.tail_dir)
+    meta_sink = None
+    if args.meta_port:
+        meta_sink = MetaSink(args.meta_port)
+        tails["meta-api"] = meta_sink
+    fifo_tail = "输出目录" if args.tail_dir else None
+
+    log = RotatingLog(args.output, args.rotate_size, args.rotate_keep)
+    injector = Injector(log, schedule, with_counts=fifo_tail is not None)
+
+    print(f"{'=' * 60}")
+    print(f"  注入配置: {len(log_files)} 个文件 → {args.output} (轮转 {args.rotate_size // (1 << 20)}MB × {args.rotate_keep})")
+    print(f"  时间范围: {time_label}")
+    print(f"  写入速率: {schedule.describe().replace('req/s', '行/s') if schedule is not None else '尽快写入'}")
+    if replay.AMPLIFY > 1 or replay.NEW_PROP_RATE > 0:
+        print(f"  负载放大: {replay.AMPLIFY} 份副本{'（含项目名）' if replay.AMPLIFY_PROJECT else ''}, "
+              f"新属性注入率 {replay.NEW_PROP_RATE:g}")
+    print(f"  输出端:   {', '.join(tails) if tails else '无（只统计写入速率）'}"
+          f"{f'  (META_API_URL=http://127.0.0.1:{args.meta_port}/register)' if meta_sink else ''}")
+    print(f"{'=' * 60}")
+
+    lag_hist = replay.LatencyHistogram()
+    stop = threading.Event()
+    start = time.time()
+    if schedule is not None:
+        if schedule.profile == "original":
+            schedule.base_msec = replay._first_msec(log_files)
+        schedule.start = start
+    monitor, last_growth = _monitor(injector, tails, fifo_tail, lag_hist, stop)
+
+    try:
+        for log_file in log_files:
+            injector.write_file(log_file)
+        write_end = time.time()
+        # 等待输出端排空：连续 drain_timeout 秒没有新输出即认为处理完毕
+        if tails:
+            expected = injector.events if fifo_tail is not None else None
+            seen = {name: tail.poll() for name, tail in tails.items()}
+            while time.time() - max(last_growth[0], write_end) < args.drain_timeout:
+                time.sleep(0.5)
+                cur = {name: tail.poll() for name, tail in tails.items()}
+                if cur != seen:
+                    last_growth[0] = time.time()
+                    seen = cur
+                if expected is not None and cur[fifo_tail] >= expected:
+                    break
+    except KeyboardInterrupt:
+        write_end = time.time()
+        print("\n  已中断")
+    finally:
+        log.close()
+        stop.set()
+        monitor.join()
+
+    write_secs = write_end - start
+    print(f"\n{'=' * 60}")
+    print(f"  注入完成!")
+    print(f"  写入行数:   {injector.lines:,} (跳过 {injector.skipped:,} 行无法解析), 轮转 {log.rotations} 次")
+    print(f"  写入耗时:   {write_secs:.1f} 秒, {injector.lines / write_secs if write_secs > 0 else 0:,.0f} 行/s")
+    span = last_growth[0] - start
+    for name, tail in tails.items():
+        n = tail.poll()
+        print(f"  {name}:   {n:,} 条, 端到端 {n / span if span > 0 else 0:,.0f} 条/s")
+    if tails:
+        print(f"  排空耗时:   写完后 {max(0.0, last_growth[0] - write_end):.1f} 秒输出端停止增长")
+    if fifo_tail is not None:
+        print(f"  写入事件数: {injector.events:,}")
+        if lag_hist.count:
+            print("  延迟 (s):   " + "  ".join(f"p{p:g} {lag_hist.percentile_ms(p) / 1000:.1f}" for p in replay.PERCENTILES)
+                  + f"  max {lag_hist.max_us / 1e6:.1f}")
+    print(f"{'=' * 60}")
+    if meta_sink is not None:
+        meta_sink.close()
+
+
+if __name__ == "__main__":
+    main()
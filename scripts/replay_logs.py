@@ -12,36 +12,90 @@
   python3 scripts/replay_logs.py --start-time "2026-02-14 00:00:00" --end-time "2026-02-14 23:59:59"
                                                     # 将所有事件时间戳映射到指定时间段
   python3 scripts/replay_logs.py --date 2026-02-14  # 简写：映射到当天 00:00~23:59
+  python3 scripts/replay_logs.py --engine async --workers 500
+                                                    # asyncio 引擎：逐行流式读取，保持 500 个在途请求
+  python3 scripts/replay_logs.py --procs 8 --engine async --workers 200
+                                                    # 8 个进程按字节分片重放，每进程 200 个在途请求
+  python3 scripts/replay_logs.py --timeseries run1.csv
+                                                    # 额外输出按秒的请求数/失败数/延迟分位（.csv 或 .json）
+  python3 scripts/replay_logs.py --engine async --workers 2000 --rate 3000
+                                                    # 开环：按 3000 req/s 的计划时间发送，不随响应变慢而降速
+  python3 scripts/replay_logs.py --engine async --workers 2000 --profile step --rate 500 --step-rate 500 --step-secs 60
+                                                    # 阶梯加压：每 60 秒 +500 req/s
+  python3 scripts/replay_logs.py --engine async --workers 2000 --profile original --speed 10
+                                                    # 按日志 msec 原始间隔的 10 倍速重放
+  python3 scripts/replay_logs.py --compile --date 2026-02-14
+                                                    # 预编译语料：解析一次并记录 time 字段位置，写入 test_data/.corpus
+  python3 scripts/replay_logs.py --corpus --date 2026-02-14 --engine async --workers 500
+                                                    # 从预编译语料重放（缺失或源文件变化时自动重新编译）
+  python3 scripts/replay_logs.py --date 2026-02-14 --engine async --rewrite-procs 6 --rewrite fast --gzip-level 1
+                                                    # 读取 → 改写（6 进程）→ 发送 流水线，只替换 time 字段，gzip 1 级
+  python3 scripts/replay_logs.py --amplify 20 --amplify-project --new-prop-rate 0.01 --engine async
+                                                    # 每条日志派生 20 份不同身份的副本，副本改项目名，1% 事件注入新属性
+  python3 scripts/replay_logs.py --repack 50 --engine async
+                                                    # 按 project/token 把事件重新合并为每批 50 条的 gzip data_list POST
+  python3 scripts/replay_logs.py --repack 1 --engine async
+                                                    # 反向：把所有批量请求拆成单事件 data= GET
+  python3 scripts/replay_logs.py --marker-interval 5 --engine async
+                                                    # 每 5 秒注入一个追踪标记事件，之后用 check_markers.py 统计各段延迟
+  python3 scripts/replay_logs.py --calibrate --engine async --workers 500 --stub-procs 4
+                                                    # 校准：重放到本机替身（collector_stub.py），测量重放端自身的 req/s 与 events/s 上限
+  python3 scripts/replay_logs.py --target 10.0.0.5:8080 10.0.0.6:8080 10.0.0.7:8080 --balance sticky --engine async
+                                                    # 绕过 HAProxy 直接压 3 个采集节点，按 distinct_id 固定节点，报告按节点拆分
 """
 
+import os
 import re
 import sys
+import csv
 import time
 import json
+import asyncio
 import gzip
+import mmap
+import queue
 import base64
+import struct
 import random
+import zlib
+import hashlib
 import argparse
+import threading
+import contextlib
+import multiprocessing
 import requests
 from pathlib import Path
 from datetime import datetime, timedelta
-from urllib.parse import unquote
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple
+from urllib.parse import parse_qsl, quote, unquote, urlencode
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = None
 
 # 配置
 NGINX_URL = "http://localhost/sa"
 TEST_DATA_DIR = "test_data"
 
-# 禁用系统代理
-SESSION = requests.Session()
-SESSION.trust_env = False
-# 连接池优化：适配高并发
-adapter = requests.adapters.HTTPAdapter(
-    pool_connections=100,
-    pool_maxsize=100,
-    max_retries=2,
-)
-SESSION.mount("http://", adapter)
+
+def _make_session(pool=100):
+    # 禁用系统代理
+    session = requests.Session()
+    session.trust_env = False
+    # 连接池优化：适配高并发
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool,
+        pool_maxsize=pool,
+        max_retries=2,
+    )
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _make_session()
 
 # Nginx 日志正则
 NGINX_LOG_PATTERN = re.compile(
@@ -75,23 +129,27 @@ def _decode_payload(raw: str, is_gzip: bool) -> str | None:
 
 
 def _encode_payload(json_str: str, is_gzip: bool) -> str:
-    """将 JSON 字符串编码回 base64 (可选 gzip)"""
+    """将 JSON 字符串编码回 base64 (可选 gzip，压缩级别为 GZIP_LEVEL)"""
     data = json_str.encode("utf-8")
     if is_gzip:
-        data = gzip.compress(data)
+        data = gzip.compress(data, compresslevel=GZIP_LEVEL)
     return base64.b64encode(data).decode("utf-8")
 
 
-def _rewrite_time_in_json(json_str: str, ts_start_ms: int, ts_end_ms: int) -> str:
-    """在 JSON 字符串中替换 time 字段为指定范围内的随机时间戳"""
+def _rewrite_time_in_json(json_str: str, ts_start_ms: int | None, ts_end_ms: int | None) -> str:
+    """在 JSON 字符串中替换 time 字段为指定范围内的随机时间戳（ts_start_ms 为 None 时不改时间），
+    并按当前放大副本改写身份 / 项目、注入新属性"""
     try:
         obj = json.loads(json_str)
     except Exception:
         return json_str
 
     def _patch(item):
-        if isinstance(item, dict) and "time" in item:
+        if not isinstance(item, dict):
+            return
+        if ts_start_ms is not None and "time" in item:
             item["time"] = random.randint(ts_start_ms, ts_end_ms)
+        _amplify_event(item)
 
     if isinstance(obj, list):
         for item in obj:
@@ -101,8 +159,28 @@ def _rewrite_time_in_json(json_str: str, ts_start_ms: int, ts_end_ms: int) -> st
     return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
 
-def _rewrite_payload(raw: str, is_gzip: bool, ts_start_ms: int, ts_end_ms: int) -> str:
-    """解码 → 改时间 → 重新编码"""
+# 快速路径：只替换 "time": <13 位毫秒时间戳>，不做 JSON 解析与序列化
+_TIME_FIELD = re.compile(rb'("time"\s*:\s*)(\d{13})(?!\d)')
+
+
+def _rewrite_payload_fast(raw: str, is_gzip: bool, ts_start_ms: int, ts_end_ms: int) -> str:
+    """解码 → 按正则替换 time 数字 → 重新编码，保留原始 JSON 格式"""
+    try:
+        data = base64.b64decode(unquote(raw))
+        if is_gzip:
+            data = gzip.decompress(data)
+    except Exception:
+        return raw
+    data = _TIME_FIELD.sub(lambda m: m.group(1) + str(random.randint(ts_start_ms, ts_end_ms)).encode(), data)
+    if is_gzip:
+        data = gzip.compress(data, compresslevel=GZIP_LEVEL)
+    return base64.b64encode(data).decode("utf-8")
+
+
+def _rewrite_payload(raw: str, is_gzip: bool, ts_start_ms: int | None, ts_end_ms: int | None) -> str:
+    """解码 → 改时间 / 派生副本 → 重新编码"""
+    if REWRITE_MODE == "fast" and ts_start_ms is not None and not _amplifying():
+        return _rewrite_payload_fast(raw, is_gzip, ts_start_ms, ts_end_ms)
     json_str = _decode_payload(raw, is_gzip)
     if json_str is None:
         return raw
@@ -110,7 +188,7 @@ def _rewrite_payload(raw: str, is_gzip: bool, ts_start_ms: int, ts_end_ms: int)
     return _encode_payload(json_str, is_gzip)
 
 
-def _rewrite_form_body(body: str, ts_start_ms: int, ts_end_ms: int) -> str:
+def _rewrite_form_body(body: str, ts_start_ms: int | None, ts_end_ms: int | None) -> str:
     """处理 POST 表单体：data=xxx 或 data_list=xxx，解码→改时间→重编码
 
     POST body 格式示例：
@@ -144,21 +222,648 @@ def _rewrite_form_body(body: str, ts_start_ms: int, ts_end_ms: int) -> str:
     return _rewrite_payload(body, False, ts_start_ms, ts_end_ms)
 
 
+# 改写参数（由 main() 设置，子进程通过 apply_rewrite_config 同步）
+# full: JSON 解析后改写顶层事件的 time；fast: 正则替换所有 "time": 13 位时间戳，属性中同名字段也会被替换
+REWRITE_MODE = "full"
+GZIP_LEVEL = 9
+
+
+# ---- 负载放大 ----
+#
+# 每条日志派生 AMPLIFY 份副本：第 0 份保持原样，第 k 份的 distinct_id / original_id / login_id /
+# anonymous_id / identities 追加 "_a{k}" 后缀（AMPLIFY_PROJECT 时项目名同样加后缀）。
+# NEW_PROP_RATE > 0 时每个事件按该概率注入一个从未出现过的属性，制造元数据注册压力。
+# 副本在构造请求时逐份生成，不落盘、不在内存中保留 N 倍数据。
+
+AMPLIFY = 1
+AMPLIFY_PROJECT = False
+NEW_PROP_RATE = 0.0
+AMPLIFY_COPY = 0            # 当前正在构造的副本序号
+
+_IDENTITY_FIELDS = ("distinct_id", "original_id", "login_id", "anonymous_id")
+_new_prop_seq = 0
+_new_prop_prefix = (None, "")   # (生成前缀的进程 pid, 前缀)；fork 出的子进程按自己的 pid 重新生成
+
+
+def _new_prop_prefix_for_pid() -> str:
+    """当前进程的新属性名前缀；子进程 fork 后 pid 变化，前缀与序号随之重置，避免各分片生成同名属性"""
+    global _new_prop_prefix, _new_prop_seq
+    pid = os.getpid()
+    if _new_prop_prefix[0] != pid:
+        _new_prop_prefix = (pid, f"amp_{pid:x}{random.getrandbits(24):06x}")
+        _new_prop_seq = 0
+    return _new_prop_prefix[1]
+
+
+def _amplifying() -> bool:
+    return AMPLIFY_COPY > 0 or NEW_PROP_RATE > 0
+
+
+def _copy_suffix() -> str:
+    return f"_a{AMPLIFY_COPY}"
+
+
+def _amplify_event(item: dict):
+    """按当前副本改写单个事件的身份与项目，并按概率注入新属性"""
+    global _new_prop_seq
+    if AMPLIFY_COPY > 0:
+        suffix = _copy_suffix()
+        for key in _IDENTITY_FIELDS:
+            value = item.get(key)
+            if isinstance(value, str) and value not in ("", "-1"):
+                item[key] = value + suffix
+        identities = item.get("identities")
+        if isinstance(identities, dict):
+            item["identities"] = {k: v + suffix if isinstance(v, str) and v else v for k, v in identities.items()}
+        if AMPLIFY_PROJECT and isinstance(item.get("project"), str):
+            item["project"] = item["project"] + suffix
+    if NEW_PROP_RATE > 0 and random.random() < NEW_PROP_RATE:
+        props = item.get("properties")
+        if isinstance(props, dict):
+            prefix = _new_prop_prefix_for_pid()
+            _new_prop_seq += 1
+            props[f"{prefix}_{_new_prop_seq}"] = _new_prop_seq
+
+
+# ---- 批量重组 ----
+#
+# REPACK > 1 时把已构造请求中的事件按 (project, token) 重新分组，凑满 REPACK 条即发出一个
+# data_list=<base64(gzip(JSON 数组))>&gzip=1 的 POST（与 SDK 批量上报相同）；文件（或分片）结束时发出不满的尾批。
+# REPACK == 1 时反向拆分：每个事件单独发一个 data=<base64(JSON)> 的 GET。
+# 重组在发送端对请求流做变换，对原始日志、预编译语料与改写流水线都生效。
+
+REPACK = 0
+
+
+def _request_events(req):
+    """解码已构造请求中的事件，返回 (去掉载荷的查询参数, 事件列表)；没有可解码的载荷时返回 None"""
+    method, query, headers, body = req[:4]
+    params = dict(parse_qsl(query, keep_blank_values=True))
+    source = dict(parse_qsl(bytes(body).decode("utf-8"), keep_blank_values=True)) if body else params
+    for key in ("data_list", "data"):
+        if key in source:
+            break
+    else:
+        return None
+    is_gzip = key == "data_list" or source.get("gzip", params.get("gzip", "-")) not in ("", "-")
+    json_str = _decode_payload(source[key], is_gzip)
+    if json_str is None:
+        return None
+    try:
+        obj = json.loads(json_str)
+    except ValueError:
+        return None
+    for key in ("data_list", "data", "gzip"):
+        params.pop(key, None)
+    return params, obj if isinstance(obj, list) else [obj]
+
+
+def _dumps_events(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class Repacker:
+    """请求流变换：feed 每个构造好的请求（或 ReplayResult），返回重组后可发送的项；流结束时调用 flush 取尾批"""
+
+    def __init__(self, size):
+        self.size = size
+        self.groups = {}            # (project, token) -> [查询参数, headers, 事件列表, 最后一条的 msec]
+        self.counters = {"requests_in": 0, "events": 0, "requests_out": 0}
+
+    def _batch(self, params, headers, events, msec):
+        data = base64.b64encode(gzip.compress(_dumps_events(events), compresslevel=GZIP_LEVEL)).decode("ascii")
+        self.counters["requests_out"] += 1
+        body = f"data_list={quote(data, safe='')}&gzip=1".encode("ascii")
+        return "POST", urlencode(params), headers, body, msec
+
+    def _single(self, params, headers, event, msec):
+        self.counters["requests_out"] += 1
+        data = base64.b64encode(_dumps_events(event)).decode("ascii")
+        return "GET", urlencode({**params, "data": data}), headers, None, msec
+
+    def feed(self, item) -> list:
+        if isinstance(item, ReplayResult):
+            return [item]
+        decoded = _request_events(item)
+        if decoded is None:
+            return [item]
+        params, events = decoded
+        headers, msec = item[2], item[4]
+        self.counters["requests_in"] += 1
+        self.counters["events"] += len(events)
+        if self.size == 1:
+            return [self._single(params, headers, event, msec) for event in events]
+        group = self.groups.setdefault((params.get("project"), params.get("token")), [params, headers, [], msec])
+        group[2].extend(events)
+        group[3] = msec
+        out = []
+        while len(group[2]) >= self.size:
+            out.append(self._batch(group[0], group[1], group[2][:self.size], msec))
+            del group[2][:self.size]
+        return out
+
+    def flush(self) -> list:
+        out = [self._batch(params, headers, events, msec)
+               for params, headers, events, msec in self.groups.values() if events]
+        self.groups.clear()
+        STATS.repack_add(self.counters)
+        self.counters = dict.fromkeys(self.counters, 0)
+        return out
+
+
+def repack_items(items):
+    """对请求流应用 Repacker（REPACK 为 0 时原样产出）"""
+    if not REPACK:
+        yield from items
+        return
+    repacker = Repacker(REPACK)
+    for item in items:
+        yield from repacker.feed(item)
+    yield from repacker.flush()
+
+
+# ---- 统计 ----
+
+class ReplayResult(NamedTuple):
+    """单行重放结果：status 为 0 表示未得到响应（跳过或异常），error 为异常类名或 skip
+
+    开环模式下 latency 从计划发送时间算起（修正 coordinated omission），lag 为实际发送晚于计划的时间。
+    """
+    ok: bool
+    status: int
+    latency: float
+    error: str | None
+    finished: float
+    lag: float | None = None
+    target: str | None = None
+
+
+SKIPPED = ReplayResult(False, 0, 0.0, "skip", 0.0)
+
+
+class LatencyHistogram:
+    """HDR 风格的对数-线性延迟直方图（微秒）
+
+    小于 128us 按 1us 计数，之后每个 2 的幂区间再分 64 个桶，相对误差 < 1.6%。
+    只保存非空桶的计数，可直接相加合并（多进程汇总、按秒汇总）。
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    @staticmethod
+    def _index(us):
+        if us < 128:
+            return us
+        shift = us.bit_length() - 7
+        return 128 + (shift - 1) * 64 + (us >> shift) - 64
+
+    @staticmethod
+    def _upper(idx):
+        """桶内最大值"""
+        if idx < 128:
+            return idx
+        shift = (idx - 128) // 64 + 1
+        return (((idx - 128) % 64 + 65) << shift) - 1
+
+    def record(self, seconds):
+        us = max(0, int(seconds * 1_000_000))
+        idx = self._index(us)
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.count += 1
+        self.total_us += us
+        self.max_us = max(self.max_us, us)
+
+    def merge(self, other):
+        for idx, n in other.counts.items():
+            self.counts[idx] = self.counts.get(idx, 0) + n
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile_ms(self, p):
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen >= rank:
+                return min(self._upper(idx), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def mean_ms(self):
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class ReplayStats:
+    """一次重放的延迟分布、状态码/异常计数与按秒时间序列，可跨进程合并
+
+    多目标重放时按 ReplayResult.target 另外为每个目标记录一份（不再嵌套）。
+    """
+
+    def __init__(self, per_target=True):
+        self.latency = LatencyHistogram()
+        self.statuses = {}
+        self.errors = {}
+        self.lag = LatencyHistogram()
+        self.stages = {}            # 改写流水线各段计数，见 RewritePipeline.counters
+        self.repack = {}            # 批量重组计数，见 Repacker
+        self.timeline = {}          # epoch 秒 -> [请求数, 成功数, LatencyHistogram, 最大调度滞后秒数]
+        self.targets = {} if per_target else None   # 目标地址 -> 该目标的 ReplayStats
+
+    def record(self, result: ReplayResult):
+        if result.target is not None and self.targets is not None:
+            node = self.targets.get(result.target)
+            if node is None:
+                node = self.targets[result.target] = ReplayStats(per_target=False)
+            node.record(result)
+        if result.error is not None:
+            self.errors[result.error] = self.errors.get(result.error, 0) + 1
+        else:
+            self.statuses[result.status] = self.statuses.get(result.status, 0) + 1
+            self.latency.record(result.latency)
+        if result.error == "skip":
+            return
+        if result.lag is not None:
+            self.lag.record(result.lag)
+        slot = self.timeline.get(int(result.finished))
+        if slot is None:
+            slot = self.timeline[int(result.finished)] = [0, 0, LatencyHistogram(), 0.0]
+        slot[0] += 1
+        if result.ok:
+            slot[1] += 1
+        if result.error is None:
+            slot[2].record(result.latency)
+        if result.lag is not None:
+            slot[3] = max(slot[3], result.lag)
+
+    def merge(self, other):
+        self.latency.merge(other.latency)
+        self.lag.merge(other.lag)
+        self.add_stages(other.stages)
+        for src, dst in ((other.statuses, self.statuses), (other.errors, self.errors), (other.repack, self.repack)):
+            for k, n in src.items():
+                dst[k] = dst.get(k, 0) + n
+        for sec, (n, ok, hist, lag) in other.timeline.items():
+            slot = self.timeline.get(sec)
+            if slot is None:
+                slot = self.timeline[sec] = [0, 0, LatencyHistogram(), 0.0]
+            slot[0] += n
+            slot[1] += ok
+            slot[2].merge(hist)
+            slot[3] = max(slot[3], lag)
+        for target, node in (other.targets or {}).items():
+            mine = self.targets.get(target)
+            if mine is None:
+                mine = self.targets[target] = ReplayStats(per_target=False)
+            mine.merge(node)
+
+    def add_stages(self, counters: dict):
+        for k, v in counters.items():
+            self.stages[k] = self.stages.get(k, 0) + v
+
+    def repack_add(self, counters: dict):
+        for k, v in counters.items():
+            self.repack[k] = self.repack.get(k, 0) + v
+
+    def summary(self) -> dict:
+        lat = self.latency
+        summary = {
+            "latency_ms": {**{f"p{p:g}": lat.percentile_ms(p) for p in PERCENTILES},
+                           "max": lat.max_us / 1000, "mean": round(lat.mean_ms(), 3), "count": lat.count},
+            "status": {str(k): v for k, v in sorted(self.statuses.items())},
+            "errors": dict(sorted(self.errors.items(), key=lambda kv: -kv[1])),
+        }
+        if self.stages:
+            summary["pipeline"] = {k: round(v, 3) for k, v in self.stages.items()}
+        if self.repack:
+            summary["repack"] = dict(self.repack)
+        if self.lag.count:
+            summary["schedule_lag_ms"] = {"p50": self.lag.percentile_ms(50), "p99": self.lag.percentile_ms(99),
+                                          "max": self.lag.max_us / 1000}
+        if self.targets:
+            summary["targets"] = {target: node.target_summary() for target, node in self.targets.items()}
+        return summary
+
+    def target_summary(self) -> dict:
+        """单个目标的汇总：在 summary() 基础上加请求数与成功数（不含跳过，跳过的请求不分配目标）"""
+        total = self.latency.count + sum(self.errors.values())
+        success = sum(n for status, n in self.statuses.items() if status < 400)
+        return {"requests": total, "success": success, "failed": total - success, **self.summary()}
+
+    def series(self) -> list:
+        if not self.timeline:
+            return []
+        first = min(self.timeline)
+        rows = []
+        for sec in range(first, max(self.timeline) + 1):
+            n, ok, hist, lag = self.timeline.get(sec, (0, 0, LatencyHistogram(), 0.0))
+            rows.append({"second": sec - first, "epoch": sec, "requests": n, "success": ok, "failed": n - ok,
+                         "p50_ms": hist.percentile_ms(50), "p99_ms": hist.percentile_ms(99),
+                         "max_ms": hist.max_us / 1000, "lag_max_ms": round(lag * 1000, 3)})
+        return rows
+
+    def write_timeseries(self, path, meta: dict):
+        """按扩展名写出 CSV（仅时间序列）或 JSON（运行参数 + 汇总 + 时间序列，多目标时另含各目标的时间序列）"""
+        rows = self.series()
+        if str(path).endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=["second", "epoch", "requests", "success", "failed",
+                                                       "p50_ms", "p99_ms", "max_ms", "lag_max_ms"])
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            out = {"run": meta, "summary": self.summary(), "series": rows}
+            if len(self.targets or ()) > 1:
+                out["target_series"] = {target: node.series() for target, node in self.targets.items()}
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(out, f, ensure_ascii=False, indent=2)
+
+
+# ---- 开环调度 ----
+
+class Schedule:
+    """开环模式下每个请求的计划发送时间（epoch 秒）
+
+    constant: 固定 rate req/s；step: 从 rate 起每 step_secs 秒增加 step_rate，max_rate > 0 时封顶；
+    original: 按日志 msec 的原始间隔除以 speed 重放。
+    """
+
+    def __init__(self, profile, rate=0.0, step_rate=0.0, step_secs=60.0, max_rate=0.0, speed=1.0):
+        self.profile = profile
+        self.rate = rate
+        self.step_rate = step_rate
+        self.step_secs = step_secs
+        self.max_rate = max_rate
+        self.speed = speed
+        self.start = 0.0
+        self.base_msec = None
+        self._offset = 0.0
+        self._last_msec = None
+
+    def split(self, procs):
+        """多进程时每个进程承担 1/procs 的速率；original 模式共用同一时间轴"""
+        part = Schedule(self.profile, self.rate / procs, self.step_rate / procs, self.step_secs,
+                        self.max_rate / procs, self.speed)
+        part.start = self.start
+        part.base_msec = self.base_msec
+        return part
+
+    def rate_at(self, t):
+        if self.profile == "step":
+            r = self.rate + self.step_rate * int(t // self.step_secs)
+            return min(r, self.max_rate) if self.max_rate > 0 else r
+        return self.rate
+
+    def next(self, msec):
+        if self.profile == "original":
+            if msec is None:
+                msec = self._last_msec
+            if msec is None:
+                return time.time()
+            self._last_msec = msec
+            if self.base_msec is None:
+                self.base_msec = msec
+            return self.start + max(0.0, msec - self.base_msec) / self.speed
+        t = self._offset
+        self._offset += 1.0 / self.rate_at(t)
+        return self.start + t
+
+    def describe(self):
+        if self.profile == "original":
+            return f"开环 original × {self.speed:g} 倍速"
+        if self.profile == "step":
+            cap = f"，上限 {self.max_rate:g}" if self.max_rate > 0 else ""
+            return f"开环 step 从 {self.rate:g} req/s 起每 {self.step_secs:g}s +{self.step_rate:g}{cap}"
+        return f"开环 constant {self.rate:g} req/s"
+
+
+def _first_msec(log_files):
+    """第一条可解析日志的 msec，作为 original 模式的时间轴起点"""
+    for log_file in log_files:
+        for line in iter_lines(log_file):
+            match = NGINX_LOG_PATTERN.match(line.strip())
+            if match:
+                return _parse_msec(match.group("msec"))
+    return None
+
+
+def _parse_msec(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ---- 追踪标记 ----
+#
+# 重放期间每隔 interval 秒额外发送一个标记事件：事件名 replay_marker_<id> 每次唯一（Vector 只把新事件转发给
+# meta-api），properties 带 tracer_id 与发送时刻 tracer_sent_ms，time 为发送时刻（落在当前 dt/hour 分区）。
+# 发送记录写入 JSONL 文件，meta-api 的 /metrics 与 /stats 统计发送 → 注册延迟，check_markers.py 对照输出目录统计落地延迟。
+
+MARKER_PREFIX = "replay_marker_"
+MARKER_DIR = ".markers"
+
+
+class MarkerEmitter:
+    """后台线程按固定间隔发送追踪标记，每个标记一行 {"id", "sent_ms", "status"} 写入 path"""
+
+    def __init__(self, interval, path, project="default"):
+        self.interval = interval
+        self.path = Path(path)
+        self.project = project
+        self.token = f"{random.getrandbits(32):08x}"
+        self.sent = 0
+        self.failed = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _emit(self, out):
+        tracer_id = f"{self.token}{self.sent + self.failed:05d}"
+        sent_ms = int(time.time() * 1000)
+        event = {"type": "track", "event": MARKER_PREFIX + tracer_id, "distinct_id": "replay_tracer",
+                 "time": sent_ms, "properties": {"tracer_id": tracer_id, "tracer_sent_ms": sent_ms}}
+        data = base64.b64encode(json.dumps(event, separators=(",", ":")).encode("utf-8")).decode("ascii")
+        try:
+            status = SESSION.get(_request_url(urlencode({"project": self.project, "data": data})), timeout=10).status_code
+        except Exception as e:
+            status = type(e).__name__
+        if status == 200:
+            self.sent += 1
+        else:
+            self.failed += 1
+        out.write(json.dumps({"id": tracer_id, "sent_ms": sent_ms, "status": status}) + "\n")
+        out.flush()
+
+    def start(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        def _loop():
+            with open(self.path, "a", encoding="utf-8") as out:
+                self._emit(out)
+                while not self._stop.wait(self.interval):
+                    self._emit(out)
+
+        self._thread = threading.Thread(target=_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+# ---- 多目标 ----
+#
+# --target 可给出多个采集端地址，由重放端按 --balance 策略分配请求，直接压各节点而不经过 HAProxy：
+#   round-robin  依次轮询
+#   least        选择本进程在途请求最少的目标（多进程时各进程独立计数），并列时轮流
+#   sticky       按首个事件 distinct_id 的 CRC32 取模固定目标，模拟负载均衡的会话亲和；
+#                需在发送端解码载荷，取不到 distinct_id 时按 Cookie / X-Forwarded-For 哈希
+# 每个目标使用独立的连接池，统计按 ReplayResult.target 拆分。
+
+BALANCE_POLICIES = ("round-robin", "least", "sticky")
+
+
+def normalize_target(value: str) -> str:
+    """补全目标地址：缺少协议时加 http://，缺少路径时加 /sa（可直接写 10.0.0.5:8080）"""
+    value = value.strip()
+    if "://" not in value:
+        value = "http://" + value
+    if value.split("://", 1)[1].find("/") < 0:
+        value += "/sa"
+    return value
+
+
+def _affinity_key(req) -> bytes:
+    """sticky 策略的哈希键"""
+    try:
+        decoded = _request_events(req)
+    except Exception:
+        decoded = None
+    if decoded and decoded[1] and isinstance(decoded[1][0], dict) and decoded[1][0].get("distinct_id") is not None:
+        return str(decoded[1][0]["distinct_id"]).encode("utf-8")
+    headers = req[2]
+    return (headers.get("Cookie") or headers.get("X-Forwarded-For") or "").encode("utf-8")
+
+
+class Balancer:
+    """为每个请求选择目标：acquire 返回目标下标并计入在途，请求完成后 release；线程引擎下由锁保护计数"""
+
+    def __init__(self, targets, policy="round-robin"):
+        self.targets = list(targets)
+        self.policy = policy
+        self.outstanding = [0] * len(self.targets)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, req) -> int:
+        n = len(self.targets)
+        if n == 1:
+            return 0
+        if self.policy == "sticky":
+            idx = zlib.crc32(_affinity_key(req)) % n
+        with self._lock:
+            if self.policy == "round-robin":
+                idx = self._next
+                self._next = (idx + 1) % n
+            elif self.policy == "least":
+                start = self._next
+                self._next = (start + 1) % n
+                idx = min(((start + i) % n for i in range(n)), key=self.outstanding.__getitem__)
+            self.outstanding[idx] += 1
+        return idx
+
+    def release(self, idx):
+        if len(self.targets) > 1:
+            with self._lock:
+                self.outstanding[idx] -= 1
+
+
 # ---- 回放 ----
 
 # 全局时间范围（由 main() 设置，None 表示不改写）
 TIME_RANGE: tuple[int, int] | None = None
 
+# 多进程模式下本进程的实时计数 [完成数, 成功数, 跳过数]，位于共享内存，由主进程每秒汇总
+PROGRESS = None
+
+# 本进程的延迟与错误统计（多进程模式下各子进程结束时发回主进程合并）
+STATS = ReplayStats()
+
+# 开环调度（None 表示闭环：在途请求满窗口时等待响应）
+SCHEDULE: Schedule | None = None
+
+# 改写流水线（None 表示在发送端逐行解析改写）
+PIPELINE = None
+
+# 目标选择（由 main() 按 --target / --balance 设置）与线程引擎各目标的 requests 会话
+BALANCER = Balancer([NGINX_URL])
+TARGET_SESSIONS = None
+
+
+def rewrite_config() -> dict:
+    """影响请求构造结果的全局参数，传给子进程与语料编译"""
+    return {"time_range": TIME_RANGE, "rewrite_mode": REWRITE_MODE, "gzip_level": GZIP_LEVEL,
+            "amplify": AMPLIFY, "amplify_project": AMPLIFY_PROJECT, "new_prop_rate": NEW_PROP_RATE,
+            "repack": REPACK}
 
-def replay_line(line):
-    """解析并重放单行日志，返回 (success: bool, status_code: int)"""
+
+def apply_rewrite_config(config: dict):
+    global TIME_RANGE, REWRITE_MODE, GZIP_LEVEL, AMPLIFY, AMPLIFY_PROJECT, NEW_PROP_RATE, REPACK
+    TIME_RANGE = config["time_range"]
+    REWRITE_MODE = config["rewrite_mode"]
+    GZIP_LEVEL = config["gzip_level"]
+    AMPLIFY = config["amplify"]
+    AMPLIFY_PROJECT = config["amplify_project"]
+    NEW_PROP_RATE = config["new_prop_rate"]
+    REPACK = config["repack"]
+
+
+def _record(result: ReplayResult):
+    STATS.record(result)
+    if PROGRESS is None:
+        return
+    PROGRESS[0] += 1
+    if result.ok:
+        PROGRESS[1] += 1
+    elif result.status == 0:
+        PROGRESS[2] += 1
+
+
+def iter_lines(file_path, start_byte=0, end_byte=None):
+    """逐行读取起始位置落在 [start_byte, end_byte) 内的行，区间边界不必对齐行首"""
+    with open(file_path, "rb") as f:
+        if start_byte > 0:
+            # 从前一个字节开始丢弃半行：start_byte 恰好是行首时只丢弃前一行的换行符
+            f.seek(start_byte - 1)
+            f.readline()
+        pos = f.tell()
+        for raw in f:
+            if end_byte is not None and pos >= end_byte:
+                break
+            pos += len(raw)
+            yield raw.decode("utf-8")
+
+
+def build_request(line):
+    """解析单行日志并构造重放请求，返回 (method, query, headers, body, msec)，无法重放时返回 None
+
+    query 为已 URL 编码的查询串（与 requests 的 params 编码一致），body 为 bytes 或 None。
+    """
     line = line.strip()
     if not line:
-        return False, 0
+        return None
 
     match = NGINX_LOG_PATTERN.match(line)
     if not match:
-        return False, 0
+        return None
 
     data = match.groupdict()
     method = data.get("request_method")
@@ -179,56 +884,786 @@ def replay_line(line):
     }
     headers = {k: v for k, v in headers.items() if v and v != "-"}
 
+    rewrite = TIME_RANGE is not None or _amplifying()
+    time_range = TIME_RANGE or (None, None)
+    if AMPLIFY_COPY > 0 and AMPLIFY_PROJECT:
+        params["project"] = params.get("project", "default") + _copy_suffix()
+
+    if method == "GET":
+        if data.get("arg_data") and data.get("arg_data") != "-":
+            payload = data.get("arg_data")
+            if rewrite:
+                payload = _rewrite_payload(payload, is_gzip, *time_range)
+            params["data"] = payload
+        elif data.get("arg_data_list") and data.get("arg_data_list") != "-":
+            payload = data.get("arg_data_list")
+            if rewrite:
+                # data_list 在 GET 参数中也可能是 gzip 压缩
+                payload = _rewrite_payload(payload, True, *time_range)
+            params["data_list"] = payload
+        return "GET", urlencode(params), headers, None, _parse_msec(data.get("msec"))
+
+    elif method == "POST":
+        body = data.get("request_body")
+        if body and body != "-":
+            if rewrite:
+                # POST body 是表单格式 data=xxx 或 data_list=xxx
+                body = _rewrite_form_body(body, *time_range)
+            return "POST", urlencode(params), headers, body.encode("utf-8"), _parse_msec(data.get("msec"))
+
+    return None
+
+
+def _request_url(query, target=None):
+    target = target or NGINX_URL
+    return f"{target}?{query}" if query else target
+
+
+def _target_sessions(pool=100):
+    """线程引擎各目标的会话：单目标时沿用 SESSION，多目标时每个目标一个连接池为 pool 的会话"""
+    global TARGET_SESSIONS
+    if TARGET_SESSIONS is None:
+        if len(BALANCER.targets) == 1:
+            TARGET_SESSIONS = [SESSION]
+        else:
+            TARGET_SESSIONS = [_make_session(max(100, pool)) for _ in BALANCER.targets]
+    return TARGET_SESSIONS
+
+
+def _build_item(line):
+    """构造请求；无法重放时返回对应的 ReplayResult（跳过或构造异常）"""
     try:
-        if method == "GET":
-            if data.get("arg_data") and data.get("arg_data") != "-":
-                payload = data.get("arg_data")
-                if TIME_RANGE:
-                    payload = _rewrite_payload(payload, is_gzip, *TIME_RANGE)
-                params["data"] = payload
-            elif data.get("arg_data_list") and data.get("arg_data_list") != "-":
-                payload = data.get("arg_data_list")
-                if TIME_RANGE:
-                    # data_list 在 GET 参数中也可能是 gzip 压缩
-                    payload = _rewrite_payload(payload, True, *TIME_RANGE)
-                params["data_list"] = payload
-            resp = SESSION.get(NGINX_URL, params=params, headers=headers, timeout=10)
-            return resp.status_code < 400, resp.status_code
-
-        elif method == "POST":
-            body = data.get("request_body")
-            if body and body != "-":
-                if TIME_RANGE:
-                    # POST body 是表单格式 data=xxx 或 data_list=xxx
-                    body = _rewrite_form_body(body, *TIME_RANGE)
-                resp = SESSION.post(NGINX_URL, params=params, data=body, headers=headers, timeout=10)
-                return resp.status_code < 400, resp.status_code
-    except Exception:
-        pass
+        req = build_request(line)
+    except Exception as e:
+        return ReplayResult(False, 0, 0.0, type(e).__name__, time.time())
+    return SKIPPED if req is None else req
+
+
+def _build_items(line) -> list:
+    """构造一行日志的全部放大副本；无法重放的行只返回一个 ReplayResult"""
+    global AMPLIFY_COPY
+    first = _build_item(line)
+    if AMPLIFY <= 1 or isinstance(first, ReplayResult):
+        return [first]
+    items = [first]
+    try:
+        for copy in range(1, AMPLIFY):
+            AMPLIFY_COPY = copy
+            items.append(_build_item(line))
+    finally:
+        AMPLIFY_COPY = 0
+    return items
 
-    return False, 0
 
+def iter_requests(file_path, start_byte=0, end_byte=None):
+    """逐项产出待发送的请求；无法重放的行产出对应的 ReplayResult
 
-def process_file(file_path, max_workers):
-    """处理单个日志文件，返回 (总行数, 成功数, 跳过数, 耗时)"""
-    with open(file_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+    file_path 为预编译语料时直接读取已构造好的请求；启用改写流水线时由进程池构造，否则逐行解析原始日志。
+    设置了 --repack 时再经过批量重组。
+    """
+    if str(file_path).endswith(CORPUS_SUFFIX):
+        items = iter_corpus(file_path, start_byte, end_byte)
+    elif PIPELINE is not None:
+        items = PIPELINE.iter_requests(file_path, start_byte, end_byte)
+    else:
+        items = (item for line in iter_lines(file_path, start_byte, end_byte) for item in _build_items(line))
+    yield from repack_items(items)
+
+
+async def aiter_requests(file_path, start_byte=0, end_byte=None):
+    """iter_requests 的异步版本：等待改写流水线时不阻塞事件循环"""
+    if PIPELINE is not None and not str(file_path).endswith(CORPUS_SUFFIX):
+        repacker = Repacker(REPACK) if REPACK else None
+        async for item in PIPELINE.aiter_requests(file_path, start_byte, end_byte):
+            for out in (repacker.feed(item) if repacker else (item,)):
+                yield out
+        if repacker:
+            for out in repacker.flush():
+                yield out
+    else:
+        for item in iter_requests(file_path, start_byte, end_byte):
+            yield item
 
+
+def send_request(req, sessions=None) -> ReplayResult:
+    """用 requests 会话发送一个已构造的请求，目标由 BALANCER 选择"""
+    method, query, headers, body = req[:4]
+    if isinstance(body, memoryview):
+        body = bytes(body)
+    idx = BALANCER.acquire(req)
+    target = BALANCER.targets[idx]
+    session = (sessions or _target_sessions())[idx]
+    t0 = time.perf_counter()
+    try:
+        resp = session.request(method, _request_url(query, target), data=body, headers=headers, timeout=10)
+    except Exception as e:
+        return ReplayResult(False, 0, time.perf_counter() - t0, type(e).__name__, time.time(), None, target)
+    finally:
+        BALANCER.release(idx)
+    return ReplayResult(resp.status_code < 400, resp.status_code, time.perf_counter() - t0, None, time.time(),
+                        None, target)
+
+
+def replay_line(line) -> ReplayResult:
+    """解析并重放单行日志"""
+    try:
+        req = build_request(line)
+    except Exception as e:
+        return ReplayResult(False, 0, 0.0, type(e).__name__, time.time())
+    if req is None:
+        return SKIPPED
+    return send_request(req)
+
+
+def process_file(file_path, max_workers, start_byte=0, end_byte=None):
+    """处理单个日志文件（或其中的字节区间），返回 (总请求数, 成功数, 跳过数, 耗时)
+
+    逐项提交给线程池，未完成的请求超过 max_workers * 4 时先等待一部分完成，内存不随文件大小增长。
+    """
     start = time.time()
+    total = 0
     success = 0
     skipped = 0
 
+    def _tally(result):
+        nonlocal success, skipped
+        _record(result)
+        if result.ok:
+            success += 1
+        elif result.status == 0:
+            skipped += 1
+
+    sessions = _target_sessions(max_workers)
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(replay_line, line): line for line in lines}
+        futures = set()
+        for item in iter_requests(file_path, start_byte, end_byte):
+            total += 1
+            if isinstance(item, ReplayResult):
+                _tally(item)
+                continue
+            if len(futures) >= max_workers * 4:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _tally(future.result())
+            futures.add(executor.submit(send_request, item, sessions))
         for future in as_completed(futures):
-            ok, code = future.result()
-            if ok:
-                success += 1
-            elif code == 0:
-                skipped += 1
+            _tally(future.result())
+
+    elapsed = time.time() - start
+    return total, success, skipped, elapsed
+
+
+# ---- 改写流水线 ----
+
+def _rewrite_batch(lines):
+    """改写进程：把一批原始日志行构造为请求，返回 (结果列表, CPU 耗时)"""
+    t0 = time.process_time()
+    items = [item for line in lines for item in _build_items(line)]
+    return items, time.process_time() - t0
+
+
+class RewritePipeline:
+    """读取 → 改写 → 发送 三段流水线
+
+    读取线程按 batch_lines 行分批提交给改写进程池，Future 按提交顺序放入容量为 depth 批的有界队列，
+    发送端按顺序取出结果。队列满时读取线程阻塞（改写或发送跟不上），队列空时发送端等待（改写跟不上），
+    两种等待时间与各段行数一起汇报，用于判断瓶颈在哪一段。
+    """
+
+    def __init__(self, procs, batch_lines=256, depth=0):
+        self.procs = procs
+        self.batch_lines = batch_lines
+        self.depth = depth or procs * 4
+        self.pool = ProcessPoolExecutor(max_workers=procs, initializer=apply_rewrite_config,
+                                        initargs=(rewrite_config(),))
+        self.counters = {"read_lines": 0, "read_blocked_s": 0.0, "rewrite_lines": 0, "rewrite_cpu_s": 0.0,
+                         "send_lines": 0, "send_starved_s": 0.0}
+        self._queues = []
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    def _on_rewritten(self, fut):
+        if not fut.cancelled() and fut.exception() is None:
+            items, cpu = fut.result()
+            self.counters["rewrite_lines"] += len(items)
+            self.counters["rewrite_cpu_s"] += cpu
+
+    def _reader(self, q, file_path, start_byte, end_byte):
+        try:
+            batch = []
+            for line in iter_lines(file_path, start_byte, end_byte):
+                batch.append(line)
+                if len(batch) >= self.batch_lines:
+                    self._submit(q, batch)
+                    batch = []
+            if batch:
+                self._submit(q, batch)
+        except Exception as e:
+            q.put(e)
+        finally:
+            q.put(None)
+
+    def _submit(self, q, batch):
+        fut = self.pool.submit(_rewrite_batch, batch)
+        fut.add_done_callback(self._on_rewritten)
+        self.counters["read_lines"] += len(batch)
+        t0 = time.perf_counter()
+        q.put(fut)
+        self.counters["read_blocked_s"] += time.perf_counter() - t0
+
+    def _start(self, file_path, start_byte, end_byte):
+        q = queue.Queue(self.depth)
+        self._queues.append(q)
+        threading.Thread(target=self._reader, args=(q, file_path, start_byte, end_byte), daemon=True).start()
+        return q
+
+    def _finish(self, q):
+        self._queues.remove(q)
+
+    def iter_requests(self, file_path, start_byte=0, end_byte=None):
+        q = self._start(file_path, start_byte, end_byte)
+        try:
+            while True:
+                t0 = time.perf_counter()
+                fut = q.get()
+                if fut is None:
+                    return
+                if isinstance(fut, Exception):
+                    raise fut
+                items = fut.result()[0]
+                self.counters["send_starved_s"] += time.perf_counter() - t0
+                self.counters["send_lines"] += len(items)
+                yield from items
+        finally:
+            self._finish(q)
+
+    async def aiter_requests(self, file_path, start_byte=0, end_byte=None):
+        loop = asyncio.get_running_loop()
+        q = self._start(file_path, start_byte, end_byte)
+        try:
+            while True:
+                t0 = time.perf_counter()
+                try:
+                    fut = q.get_nowait()
+                except queue.Empty:
+                    fut = await loop.run_in_executor(None, q.get)
+                if fut is None:
+                    return
+                if isinstance(fut, Exception):
+                    raise fut
+                items = (await asyncio.wrap_future(fut))[0]
+                self.counters["send_starved_s"] += time.perf_counter() - t0
+                self.counters["send_lines"] += len(items)
+                for item in items:
+                    yield item
+        finally:
+            self._finish(q)
+
+    def queued(self) -> int:
+        return sum(q.qsize() for q in self._queues)
+
+    def start_readout(self, interval=2.0):
+        """后台每 interval 秒打印各段吞吐与队列长度，返回用于停止的 Event"""
+        stop = threading.Event()
+
+        def _loop():
+            last = dict(self.counters)
+            while not stop.wait(interval):
+                cur = dict(self.counters)
+                rate = {k: (cur[k] - last[k]) / interval for k in ("read_lines", "rewrite_lines", "send_lines")}
+                print(f"  [流水线] 读取 {rate['read_lines']:,.0f} 行/s | 改写 {rate['rewrite_lines']:,.0f} 行/s | "
+                      f"发送 {rate['send_lines']:,.0f} 行/s | 队列 {self.queued()}/{self.depth} 批 | "
+                      f"读取阻塞 {cur['read_blocked_s'] - last['read_blocked_s']:.1f}s "
+                      f"发送等待 {cur['send_starved_s'] - last['send_starved_s']:.1f}s", flush=True)
+                last = cur
+
+        threading.Thread(target=_loop, daemon=True).start()
+        return stop
+
+
+# ---- 预编译语料 ----
+#
+# 每个源日志文件编译为一个 .corpus 文件，文件名包含源文件内容的 sha1 与改写参数，源文件变化时自动失效。
+# 源文件的 sha1 按 (大小, mtime) 记录在语料目录的 .sources.json 中，两者未变时不再重新计算。
+# 指定时间范围时，编译阶段把 time 字段改写为占位值，记录解码后的 JSON 与各 time 数字的偏移；
+# 重放时按本次的 --date/--start-time 逐个填入随机时间戳再编码（gzip 按 --gzip-level），
+# 同一份语料每次重放都得到新的时间，且不再做正则解析与 JSON 往返。
+#
+# 布局：MAGIC | 记录... | 尾部 JSON（行数、稀疏索引）| u64 尾部偏移 | MAGIC
+# 记录：<BdIII>（类型, msec, query 长度, headers 长度, body 长度）+ query + headers + body
+#   类型 0/1 = GET/POST；2 = 跳过；3 = 构造异常（query 字段为异常类名）
+#   类型 4/5 = 带时间模板的 GET/POST：query（GET）/ body（POST）中去掉了载荷，其后紧跟
+#     <IIHB>（载荷插入位置, JSON 长度, time 偏移个数, 标志 bit0=gzip bit1=URL 编码）+ JSON + u32 偏移...
+#   headers 为 "名\0值\0..." 编码
+
+CORPUS_MAGIC = b"RPLCORP1"
+CORPUS_SUFFIX = ".corpus"
+CORPUS_RECORD = struct.Struct("<BdIII")
+CORPUS_TEMPLATE = struct.Struct("<IIHB")
+CORPUS_INDEX_EVERY = 1024
+CORPUS_SOURCES = ".sources.json"
+_METHODS = ("GET", "POST")
+
+# 编译时写入 time 字段的占位值（13 位，与真实毫秒时间戳等长），编译后据此定位偏移
+_TIME_PLACEHOLDER = 9999999999999
+_PLACEHOLDER_FIELD = re.compile(rb'"time"\s*:\s*(%d)(?!\d)' % _TIME_PLACEHOLDER)
+_TEMPLATE_GZIP = 1
+_TEMPLATE_QUOTED = 2
+
+
+def _file_sha1(path) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _source_sha1s(corpus_dir, log_files) -> dict:
+    """源文件 -> sha1；大小与 mtime 均未变的文件沿用 .sources.json 中记录的值，只对变化的文件重新计算"""
+    index_path = corpus_dir / CORPUS_SOURCES
+    try:
+        known = json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        known = {}
+    digests = {}
+    changed = False
+    for log_file in log_files:
+        st = log_file.stat()
+        key = str(log_file.resolve())
+        entry = known.get(key)
+        if entry and entry[:2] == [st.st_size, st.st_mtime_ns]:
+            digests[log_file] = entry[2]
+        else:
+            digests[log_file] = _file_sha1(log_file)
+            known[key] = [st.st_size, st.st_mtime_ns, digests[log_file]]
+            changed = True
+    if changed:
+        tmp = index_path.with_name(index_path.name + ".tmp")
+        tmp.write_text(json.dumps(known, ensure_ascii=False))
+        tmp.replace(index_path)
+    return digests
+
+
+def _window_tag(config) -> str:
+    """语料的改写参数标签；时间范围在重放时填入，因此只区分是否改写时间，不包含具体范围"""
+    if not config["time_range"]:
+        return "orig"
+    tag = "shift"
+    if (config["rewrite_mode"], config["gzip_level"]) != ("full", 9):
+        tag += f"-{config['rewrite_mode']}-g{config['gzip_level']}"
+    return tag
+
+
+def corpus_path(corpus_dir, log_file, config, sha1) -> Path:
+    return Path(corpus_dir) / f"{log_file.name}.{sha1[:16]}.{_window_tag(config)}{CORPUS_SUFFIX}"
+
+
+def _time_template(field: bytes):
+    """从已构造的 query / body 中取出载荷，返回 (去掉载荷的字段, 插入位置, 解码后的 JSON, time 偏移, 标志)；
+    载荷中没有占位 time 字段时返回 None"""
+    start, end, flags = 0, len(field), 0
+    pos = 0
+    for part in field.split(b"&"):
+        name, eq, _ = part.partition(b"=")
+        if eq and name in (b"data", b"data_list"):
+            start, end, flags = pos + len(name) + 1, pos + len(part), _TEMPLATE_QUOTED
+            break
+        pos += len(part) + 1
+    raw = field[start:end].decode("ascii", "replace")
+    try:
+        data = base64.b64decode(unquote(raw) if flags else raw)
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+            flags |= _TEMPLATE_GZIP
+    except Exception:
+        return None
+    offsets = [m.start(1) for m in _PLACEHOLDER_FIELD.finditer(data)]
+    if not offsets:
+        return None
+    return field[:start] + field[end:], start, data, offsets, flags
+
+
+def _fill_time_template(data, offsets, flags) -> bytes:
+    """按本次的 TIME_RANGE 在 JSON 副本的各偏移处填入随机时间戳，再编码为与编译时相同格式的载荷"""
+    data = bytearray(data)
+    ts_start_ms, ts_end_ms = TIME_RANGE
+    for off in reversed(offsets):
+        data[off:off + 13] = str(random.randint(ts_start_ms, ts_end_ms)).encode()
+    if flags & _TEMPLATE_GZIP:
+        data = gzip.compress(data, compresslevel=GZIP_LEVEL)
+    encoded = base64.b64encode(data).decode("ascii")
+    return (quote(encoded, safe="") if flags & _TEMPLATE_QUOTED else encoded).encode("ascii")
+
+
+def compile_corpus(log_file, target, config):
+    """把一个源日志文件编译为 target，返回 (行数, 可发送请求数)；指定了时间范围时 time 字段以占位值编译为模板"""
+    templated = config["time_range"] is not None
+    apply_rewrite_config(dict(config, time_range=(_TIME_PLACEHOLDER, _TIME_PLACEHOLDER)) if templated else config)
+    lines = 0
+    sendable = 0
+    index = []
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as out:
+        out.write(CORPUS_MAGIC)
+        for line in iter_lines(log_file):
+            if lines % CORPUS_INDEX_EVERY == 0:
+                index.append(out.tell())
+            lines += 1
+            try:
+                req = build_request(line)
+            except Exception as e:
+                out.write(CORPUS_RECORD.pack(3, float("nan"), len(type(e).__name__), 0, 0))
+                out.write(type(e).__name__.encode("ascii"))
+                continue
+            if req is None:
+                out.write(CORPUS_RECORD.pack(2, float("nan"), 0, 0, 0))
+                continue
+            method, query, headers, body, msec = req
+            kind = _METHODS.index(method)
+            q = query.encode("ascii")
+            h = "\0".join(f"{k}\0{v}" for k, v in headers.items()).encode("utf-8")
+            b = body or b""
+            template = _time_template(q if method == "GET" else b) if templated else None
+            if template is not None:
+                kind += 4
+                if method == "GET":
+                    q = template[0]
+                else:
+                    b = template[0]
+            out.write(CORPUS_RECORD.pack(kind, float("nan") if msec is None else msec, len(q), len(h), len(b)))
+            out.write(q)
+            out.write(h)
+            out.write(b)
+            if template is not None:
+                _, splice, data, offsets, flags = template
+                out.write(CORPUS_TEMPLATE.pack(splice, len(data), len(offsets), flags))
+                out.write(data)
+                out.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            sendable += 1
+        footer = out.tell()
+        out.write(json.dumps({"source": log_file.name, "lines": lines, "requests": sendable,
+                              "time_template": templated, "index": index}).encode("utf-8"))
+        out.write(struct.pack("<Q", footer))
+        out.write(CORPUS_MAGIC)
+    tmp.replace(target)
+    return lines, sendable
+
+
+def _compile_job(job):
+    log_file, target, config = job
+    return log_file, compile_corpus(log_file, target, config)
+
+
+def ensure_corpus(log_files, corpus_dir, config, procs=1, force=False):
+    """为每个源文件找到或编译语料，返回语料路径列表；同一源文件、同一改写参数的旧版本会被删除"""
+    corpus_dir = Path(corpus_dir)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    sha1s = _source_sha1s(corpus_dir, log_files)
+    targets = [corpus_path(corpus_dir, f, config, sha1s[f]) for f in log_files]
+    jobs = [(f, t, config) for f, t in zip(log_files, targets) if force or not t.exists()]
+    for f, t, _ in jobs:
+        stale_name = re.compile(re.escape(f.name) + r"\.[0-9a-f]{16}\." + re.escape(_window_tag(config) + CORPUS_SUFFIX))
+        for stale in corpus_dir.glob(f"{f.name}.*.{_window_tag(config)}{CORPUS_SUFFIX}"):
+            if stale != t and stale_name.fullmatch(stale.name):
+                stale.unlink()
+    if jobs:
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=max(1, procs)) as pool:
+            for log_file, (lines, sendable) in pool.map(_compile_job, jobs):
+                print(f"  [编译] {log_file.name}: {lines} 行 → {sendable} 个请求")
+        print(f"  语料编译完成: {len(jobs)} 个文件, {time.time() - start:.1f}s, 目录 {corpus_dir}")
+    return targets
+
+
+def _corpus_footer(mm):
+    if mm[:len(CORPUS_MAGIC)] != CORPUS_MAGIC or mm[-len(CORPUS_MAGIC):] != CORPUS_MAGIC:
+        raise ValueError("不是有效的语料文件")
+    tail = len(mm) - len(CORPUS_MAGIC) - 8
+    (footer,) = struct.unpack_from("<Q", mm, tail)
+    return footer, json.loads(bytes(mm[footer:tail]))
+
+
+def iter_corpus(path, start_byte=0, end_byte=None):
+    """mmap 读取语料中起始位置落在 [start_byte, end_byte) 内的记录，body 为指向映射内存的 memoryview
+
+    带时间模板的记录按当前 TIME_RANGE 填入时间戳后重新编码，其 query / body 为新生成的 str / bytes。
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    footer, meta = _corpus_footer(mm)
+    end = footer if end_byte is None else min(end_byte, footer)
+    # 从稀疏索引中不晚于 start_byte 的检查点开始向后跳
+    pos = len(CORPUS_MAGIC)
+    for checkpoint in meta["index"]:
+        if checkpoint > start_byte:
+            break
+        pos = checkpoint
+    view = memoryview(mm)
+    size = CORPUS_RECORD.size
+    while pos < end:
+        rec_start = pos
+        kind, msec, qlen, hlen, blen = CORPUS_RECORD.unpack_from(mm, pos)
+        rec = pos + size
+        pos = rec + qlen + hlen + blen
+        template = None
+        if kind >= 4:
+            template = pos
+            splice, jlen, count, flags = CORPUS_TEMPLATE.unpack_from(mm, pos)
+            pos += CORPUS_TEMPLATE.size + jlen + 4 * count
+        if rec_start < start_byte:
+            continue
+        if kind == 2:
+            yield SKIPPED
+            continue
+        query = bytes(view[rec:rec + qlen]).decode("ascii")
+        if kind == 3:
+            yield ReplayResult(False, 0, 0.0, query, time.time())
+            continue
+        fields = bytes(view[rec + qlen:rec + qlen + hlen]).decode("utf-8").split("\0") if hlen else []
+        headers = dict(zip(fields[0::2], fields[1::2]))
+        body = view[rec + qlen + hlen:rec + qlen + hlen + blen] if blen else None
+        if template is not None:
+            start = template + CORPUS_TEMPLATE.size
+            offsets = struct.unpack_from(f"<{count}I", mm, start + jlen)
+            payload = _fill_time_template(view[start:start + jlen], offsets, flags)
+            kind -= 4
+            if kind == 0:
+                query = query[:splice] + payload.decode("ascii") + query[splice:]
+            else:
+                body = b"".join((body[:splice], payload, body[splice:])) if body is not None else payload
+        yield _METHODS[kind], query, headers, body, (None if msec != msec else msec)
+
+
+# ---- asyncio 引擎 ----
+
+async def _send_async(sessions, req, intended=None) -> ReplayResult:
+    """发送单个请求，连接错误最多重试 2 次（与线程引擎的 HTTPAdapter 一致），延迟包含重试耗时
+
+    目标由 BALANCER 选择，sessions 为各目标的会话。
+    intended 为开环模式的计划发送时间（epoch 秒），此时延迟从计划时间算起并记录调度滞后。
+    """
+    idx = BALANCER.acquire(req)
+    try:
+        return await _send_target_async(sessions[idx], BALANCER.targets[idx], req, intended)
+    finally:
+        BALANCER.release(idx)
+
+
+async def _send_target_async(session, target, req, intended) -> ReplayResult:
+    method, query, headers, data = req[:4]
+    url = yarl.URL(_request_url(query, target), encoded=True)
+    if intended is None:
+        lag = None
+        t0 = time.perf_counter()
+    else:
+        lag = max(0.0, time.time() - intended)
+        t0 = time.perf_counter() - lag
+    for attempt in range(3):
+        try:
+            async with session.request(method, url, headers=headers, data=data) as resp:
+                await resp.read()
+                return ReplayResult(resp.status < 400, resp.status, time.perf_counter() - t0, None,
+                                    time.time(), lag, target)
+        except aiohttp.ClientConnectionError as e:
+            if attempt == 2:
+                return ReplayResult(False, 0, time.perf_counter() - t0, type(e).__name__, time.time(), lag, target)
+        except Exception as e:
+            return ReplayResult(False, 0, time.perf_counter() - t0, type(e).__name__, time.time(), lag, target)
+
+
+async def process_file_async(file_path, sessions, window, start_byte=0, end_byte=None):
+    """流式读取日志并保持最多 window 个在途请求，返回值同 process_file
+
+    开环模式（SCHEDULE 非空）下按计划时间发送，window 只作为在途请求的安全上限；
+    上限打满时发送会晚于计划，这部分等待计入延迟与调度滞后。
+    """
+    start = time.time()
+    total = 0
+    success = 0
+    skipped = 0
+    pending = set()
+
+    def _on_done(task):
+        nonlocal success, skipped
+        pending.discard(task)
+        result = task.result()
+        _record(result)
+        if result.ok:
+            success += 1
+        elif result.status == 0:
+            skipped += 1
+
+    async for req in aiter_requests(file_path, start_byte, end_byte):
+        total += 1
+        if isinstance(req, ReplayResult):
+            skipped += 1
+            _record(req)
+            continue
+        intended = None
+        if SCHEDULE is not None:
+            intended = SCHEDULE.next(req[4])
+            delay = intended - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        while len(pending) >= window:
+            await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        task = asyncio.create_task(_send_async(sessions, req, intended))
+        task.add_done_callback(_on_done)
+        pending.add(task)
+
+    if pending:
+        await asyncio.wait(pending)
 
     elapsed = time.time() - start
-    return len(lines), success, skipped, elapsed
+    return total, success, skipped, elapsed
+
+
+async def replay_files_async(units, window, report):
+    """依次重放 (文件, 起始字节, 结束字节) 列表，每个目标一个 keep-alive 连接池（上限均为 window），
+    每项完成后回调 report(项, 结果)"""
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with contextlib.AsyncExitStack() as stack:
+        sessions = [await stack.enter_async_context(
+                        aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=window, ttl_dns_cache=300),
+                                              timeout=timeout, cookie_jar=aiohttp.DummyCookieJar()))
+                    for _ in BALANCER.targets]
+        for unit in units:
+            report(unit, await process_file_async(unit[0], sessions, window, unit[1], unit[2]))
+
+
+# ---- 多进程分片 ----
+
+def plan_shards(log_files, procs):
+    """按字节数把文件均分给 procs 个进程，大文件切成多个字节区间，返回每个进程的 [(文件, 起始, 结束), ...]"""
+    sizes = [(f, f.stat().st_size) for f in log_files]
+    target = max(1, -(-sum(size for _, size in sizes) // procs))
+    shards = [[] for _ in range(procs)]
+    idx = 0
+    room = target
+    for f, size in sizes:
+        pos = 0
+        while pos < size:
+            take = min(room, size - pos)
+            shards[idx].append((f, pos, pos + take))
+            pos += take
+            room -= take
+            if room == 0 and idx < procs - 1:
+                idx += 1
+                room = target
+    return [shard for shard in shards if shard]
+
+
+def _shard_worker(units, engine, window, config, rewrite_procs, schedule, progress, results, targets, balance):
+    """子进程入口：用自己的 HTTP 引擎（及改写进程池）重放分到的区间，每完成一个区间把结果放入 results 队列"""
+    global NGINX_URL, BALANCER, TARGET_SESSIONS, PROGRESS, SCHEDULE, PIPELINE
+    NGINX_URL = targets[0]
+    BALANCER = Balancer(targets, balance)
+    TARGET_SESSIONS = None
+    apply_rewrite_config(config)
+    SCHEDULE = schedule
+    PROGRESS = progress
+    if rewrite_procs > 0:
+        PIPELINE = RewritePipeline(rewrite_procs)
+
+    def report(unit, result):
+        results.put((str(unit[0]), result, time.time() - result[3]))
+
+    if engine == "async":
+        asyncio.run(replay_files_async(units, window, report))
+    else:
+        for unit in units:
+            report(unit, process_file(unit[0], window, unit[1], unit[2]))
+    if PIPELINE is not None:
+        STATS.add_stages(PIPELINE.counters)
+        PIPELINE.close()
+    results.put((os.getpid(), STATS))
+
+
+def replay_sharded(log_files, procs, engine, window, report, rewrite_procs=0):
+    """多进程重放：汇总各进程的区间结果，文件的全部区间完成后回调 report(log_file, 结果)，并每秒打印实时进度
+
+    各子进程的延迟与错误统计在结束时合并进本进程的 STATS。子进程异常退出（未捕获异常、被 OOM 杀掉）时
+    不再等待它，返回异常退出的进程数，其未完成的区间不计入结果。
+    """
+    shards = plan_shards(log_files, procs)
+    remaining = {}
+    for shard in shards:
+        for f, _, _ in shard:
+            remaining[str(f)] = remaining.get(str(f), 0) + 1
+    by_name = {str(f): f for f in log_files}
+    merged = {}
+    for f in log_files:
+        if str(f) not in remaining:
+            report(f, (0, 0, 0, 0.0))
+
+    results = multiprocessing.Queue()
+    counters = [multiprocessing.Array("q", 3, lock=False) for _ in shards]
+    workers = [multiprocessing.Process(target=_shard_worker,
+                                       args=(shard, engine, window, rewrite_config(), rewrite_procs,
+                                             SCHEDULE.split(len(shards)) if SCHEDULE is not None else None,
+                                             counters[i], results, BALANCER.targets, BALANCER.policy))
+               for i, shard in enumerate(shards)]
+    for w in workers:
+        w.start()
+
+    stop = threading.Event()
+
+    def _progress_loop():
+        started = time.time()
+        last = 0
+        while not stop.wait(1.0):
+            done = sum(c[0] for c in counters)
+            success = sum(c[1] for c in counters)
+            skipped = sum(c[2] for c in counters)
+            per_proc = " ".join(str(c[0]) for c in counters)
+            print(f"  [进度] {time.time() - started:6.0f}s 完成 {done:,} 成功 {success:,} 跳过 {skipped:,}, "
+                  f"{done - last:,} req/s (各进程完成数: {per_proc})", flush=True)
+            last = done
+
+    progress_thread = threading.Thread(target=_progress_loop, daemon=True)
+    progress_thread.start()
+
+    finished = set()            # 已发回统计（正常结束）或已确认异常退出的子进程 pid
+    failed = 0
+    while len(finished) < len(workers):
+        try:
+            item = results.get(timeout=1.0)
+        except queue.Empty:
+            for w in workers:
+                if w.pid not in finished and w.exitcode is not None:
+                    # 正常结束的进程在退出前已发回统计，get 超时后仍未收到说明它没能发出
+                    finished.add(w.pid)
+                    failed += 1
+                    print(f"  [错误] 重放进程 {w.pid} 异常退出 (exitcode={w.exitcode})，其分片结果不完整", flush=True)
+            continue
+        if len(item) == 2:      # (pid, ReplayStats)：子进程结束
+            STATS.merge(item[1])
+            finished.add(item[0])
+            continue
+        name, (total, success, skipped, elapsed), began = item
+        acc = merged.setdefault(name, [0, 0, 0, began, began + elapsed])
+        acc[0] += total
+        acc[1] += success
+        acc[2] += skipped
+        acc[3] = min(acc[3], began)
+        acc[4] = max(acc[4], began + elapsed)
+        remaining[name] -= 1
+        if remaining[name] == 0:
+            report(by_name[name], (acc[0], acc[1], acc[2], acc[4] - acc[3]))
+
+    # 异常退出的进程留下未完成的文件：按已完成的区间汇报部分结果
+    for name, left in remaining.items():
+        if left > 0:
+            acc = merged.get(name)
+            report(by_name[name], (acc[0], acc[1], acc[2], acc[4] - acc[3]) if acc else (0, 0, 0, 0.0))
+
+    stop.set()
+    progress_thread.join()
+    for w in workers:
+        w.join()
+    return failed
 
 
 def _parse_datetime(s: str) -> datetime:
@@ -241,83 +1676,253 @@ def _parse_datetime(s: str) -> datetime:
     raise argparse.ArgumentTypeError(f"无法解析时间: {s}，格式应为 YYYY-MM-DD 或 YYYY-MM-DD HH:MM:SS")
 
 
+def resolve_time_range(args):
+    """由 --date / --start-time / --end-time 得到 (TIME_RANGE, 说明文字)，参数不合法时抛 ValueError"""
+    if args.date:
+        dt = _parse_datetime(args.date)
+        ts_start = int(dt.timestamp() * 1000)
+        ts_end = int((dt + timedelta(hours=23, minutes=59, seconds=59)).timestamp() * 1000)
+        return (ts_start, ts_end), f"{args.date} 00:00:00 ~ 23:59:59"
+    if args.start_time and args.end_time:
+        dt_start = _parse_datetime(args.start_time)
+        dt_end = _parse_datetime(args.end_time)
+        if dt_end <= dt_start:
+            raise ValueError("--end-time 必须晚于 --start-time")
+        return (int(dt_start.timestamp() * 1000), int(dt_end.timestamp() * 1000)), f"{dt_start} ~ {dt_end}"
+    if args.start_time or args.end_time:
+        raise ValueError("--start-time 和 --end-time 必须同时指定")
+    return None, "原始时间（不改写）"
+
+
+def find_log_files(files=0):
+    """test_data 下的原始日志文件（files > 0 时只取前 files 个），目录不存在或为空时打印原因并返回空列表"""
+    test_data_path = Path(__file__).parent.parent / TEST_DATA_DIR
+    if not test_data_path.exists():
+        print(f"错误: 测试数据目录不存在 {test_data_path}")
+        return []
+    log_files = sorted(test_data_path.glob("nginx_log_part_*.txt"))
+    if not log_files:
+        print("未找到测试日志文件")
+        return []
+    return log_files[:files] if files > 0 else log_files
+
+
 def main():
-    global TIME_RANGE
+    global NGINX_URL, BALANCER, TIME_RANGE, SCHEDULE, PIPELINE, REWRITE_MODE, GZIP_LEVEL, AMPLIFY, AMPLIFY_PROJECT, NEW_PROP_RATE, REPACK
 
     parser = argparse.ArgumentParser(description="神策埋点日志重放压测")
     parser.add_argument("--files", type=int, default=0, help="重放文件数量 (0=全部)")
-    parser.add_argument("--workers", type=int, default=20, help="并发线程数 (默认 20)")
+    parser.add_argument("--workers", type=int, default=20,
+                        help="并发数 (默认 20)：thread 引擎为线程数，async 引擎为在途请求窗口")
+    parser.add_argument("--engine", choices=("thread", "async"), default="thread",
+                        help="重放引擎：thread = 线程池 + requests；async = asyncio + aiohttp 流式读取")
+    parser.add_argument("--timeseries", type=str, default=None,
+                        help="按秒时间序列输出文件：.csv 仅时间序列，其他扩展名写 JSON（含运行参数与延迟/状态码汇总）")
+    parser.add_argument("--rate", type=float, default=0,
+                        help="开环模式目标速率 req/s（需 --engine async；step 模式为起始速率）")
+    parser.add_argument("--profile", choices=("constant", "step", "original"), default=None,
+                        help="开环负载曲线：constant 固定速率；step 阶梯加压；original 按日志 msec 原始间隔 × --speed")
+    parser.add_argument("--step-rate", type=float, default=0, help="step 模式每段增加的速率 req/s")
+    parser.add_argument("--step-secs", type=float, default=60, help="step 模式每段持续秒数 (默认 60)")
+    parser.add_argument("--max-rate", type=float, default=0, help="step 模式速率上限 (0=不限)")
+    parser.add_argument("--speed", type=float, default=1.0, help="original 模式倍速 (默认 1.0)")
+    parser.add_argument("--rewrite", choices=("full", "fast"), default="full",
+                        help="时间改写方式：full 解析 JSON 改写顶层 time；fast 只用正则替换 \"time\": 13 位时间戳，不做 JSON 往返")
+    parser.add_argument("--gzip-level", type=int, default=9, choices=range(0, 10), metavar="0-9",
+                        help="改写后重新 gzip 的压缩级别 (默认 9，服务端不需要高压缩比时可用 1)")
+    parser.add_argument("--rewrite-procs", type=int, default=0,
+                        help="改写流水线进程数 (0=关闭)：读取 → 进程池改写 → 发送，段间有界队列背压；--procs 时每个进程各自一组")
+    parser.add_argument("--amplify", type=int, default=1,
+                        help="负载放大倍数 (默认 1)：每条日志派生 N 份副本，副本的 distinct_id/login_id 等加 _a{k} 后缀")
+    parser.add_argument("--amplify-project", action="store_true",
+                        help="放大副本的项目名同样加 _a{k} 后缀（测试项目数增长）")
+    parser.add_argument("--new-prop-rate", type=float, default=0.0,
+                        help="每个事件注入一个全新属性的概率 (0~1，默认 0)，用于制造元数据注册压力")
+    parser.add_argument("--repack", type=int, default=0,
+                        help="批量重组 (0=关闭)：N > 1 按 project/token 合并为每批 N 个事件的 gzip data_list POST；"
+                             "1 拆成单事件 data= GET")
+    parser.add_argument("--marker-interval", type=float, default=0,
+                        help="追踪标记发送间隔秒数 (0=关闭)，记录写入 test_data/.markers/，配合 check_markers.py 使用")
+    parser.add_argument("--marker-project", type=str, default="default", help="追踪标记所属项目 (默认 default)")
+    parser.add_argument("--compile", action="store_true",
+                        help="只编译重放语料（按源文件哈希与时间范围缓存）后退出；配合 --procs 并行编译")
+    parser.add_argument("--corpus", action="store_true",
+                        help="从预编译语料重放，缺失或过期时先编译")
+    parser.add_argument("--corpus-dir", type=str, default=None,
+                        help="语料缓存目录 (默认 test_data/.corpus)")
+    parser.add_argument("--procs", type=int, default=1,
+                        help="重放进程数 (默认 1)：按字节把文件分片给各进程，每个进程独立运行 --engine 与 --workers")
     parser.add_argument("--date", type=str, default=None,
                         help="将事件时间映射到指定日期 (YYYY-MM-DD)，简写，等价于 --start-time DATE 00:00:00 --end-time DATE 23:59:59")
     parser.add_argument("--start-time", type=str, default=None,
                         help="事件时间范围起始 (YYYY-MM-DD 或 YYYY-MM-DD HH:MM:SS)")
     parser.add_argument("--end-time", type=str, default=None,
                         help="事件时间范围结束 (YYYY-MM-DD 或 YYYY-MM-DD HH:MM:SS)")
+    parser.add_argument("--target", type=str, nargs="+", default=None, metavar="URL",
+                        help=f"采集端地址，可给多个（空格或逗号分隔，host:port 自动补全为 http://host:port/sa），"
+                             f"默认 {NGINX_URL}")
+    parser.add_argument("--balance", choices=BALANCE_POLICIES, default="round-robin",
+                        help="多目标时的分配策略：round-robin 轮询 / least 在途最少 / sticky 按 distinct_id 哈希 "
+                             "(默认 round-robin)")
+    parser.add_argument("--calibrate", action="store_true",
+                        help="校准模式：启动本机采集端替身 (collector_stub.py) 并重放到它，测量重放端自身的吞吐上限")
+    parser.add_argument("--stub-procs", type=int, default=2, help="校准模式下替身的服务进程数 (默认 2)")
+    parser.add_argument("--stub-decode", action=argparse.BooleanOptionalAction, default=True,
+                        help="校准模式下替身是否按 sa_decode 规则解码载荷并计事件数 (默认解码)")
     args = parser.parse_args()
 
     # 处理时间范围参数
-    time_label = "原始时间（不改写）"
-    if args.date:
-        dt = _parse_datetime(args.date)
-        ts_start = int(dt.timestamp() * 1000)
-        ts_end = int((dt + timedelta(hours=23, minutes=59, seconds=59)).timestamp() * 1000)
-        TIME_RANGE = (ts_start, ts_end)
-        time_label = f"{args.date} 00:00:00 ~ 23:59:59"
-    elif args.start_time and args.end_time:
-        dt_start = _parse_datetime(args.start_time)
-        dt_end = _parse_datetime(args.end_time)
-        if dt_end <= dt_start:
-            print("错误: --end-time 必须晚于 --start-time")
-            return
-        ts_start = int(dt_start.timestamp() * 1000)
-        ts_end = int(dt_end.timestamp() * 1000)
-        TIME_RANGE = (ts_start, ts_end)
-        time_label = f"{dt_start} ~ {dt_end}"
-    elif args.start_time or args.end_time:
-        print("错误: --start-time 和 --end-time 必须同时指定")
+    try:
+        TIME_RANGE, time_label = resolve_time_range(args)
+    except ValueError as e:
+        print(f"错误: {e}")
         return
 
-    project_root = Path(__file__).parent.parent
-    test_data_path = project_root / TEST_DATA_DIR
+    REWRITE_MODE = args.rewrite
+    GZIP_LEVEL = args.gzip_level
+    AMPLIFY = max(1, args.amplify)
+    AMPLIFY_PROJECT = args.amplify_project
+    NEW_PROP_RATE = args.new_prop_rate
+    REPACK = max(0, args.repack)
+    if (AMPLIFY > 1 or NEW_PROP_RATE > 0) and (args.compile or args.corpus):
+        print("错误: --amplify / --new-prop-rate 在重放时逐份生成，不能与 --compile / --corpus 同时使用")
+        return
 
-    if not test_data_path.exists():
-        print(f"错误: 测试数据目录不存在 {test_data_path}")
+    if args.engine == "async" and aiohttp is None:
+        print("错误: --engine async 需要安装 aiohttp (pip install aiohttp)")
         return
 
-    log_files = sorted(list(test_data_path.glob("nginx_log_part_*.txt")))
+    if args.target:
+        if args.calibrate:
+            print("错误: --calibrate 使用本机替身作为目标，不能与 --target 同时使用")
+            return
+        targets = [normalize_target(t) for value in args.target for t in value.split(",") if t.strip()]
+        if len(set(targets)) != len(targets):
+            print("错误: --target 中有重复地址")
+            return
+        NGINX_URL = targets[0]
+        BALANCER = Balancer(targets, args.balance)
+
+    profile = args.profile or ("constant" if args.rate > 0 else None)
+    if profile is not None:
+        if args.engine != "async":
+            print("错误: 开环模式 (--rate / --profile) 需要 --engine async")
+            return
+        if profile != "original" and args.rate <= 0:
+            print(f"错误: --profile {profile} 需要指定 --rate")
+            return
+        if profile == "original" and args.speed <= 0:
+            print("错误: --speed 必须大于 0")
+            return
+        SCHEDULE = Schedule(profile, args.rate, args.step_rate, args.step_secs, args.max_rate, args.speed)
+
+    log_files = find_log_files(args.files)
     if not log_files:
-        print("未找到测试日志文件")
         return
 
-    if args.files > 0:
-        log_files = log_files[: args.files]
+    corpus_dir = Path(args.corpus_dir) if args.corpus_dir else log_files[0].parent / ".corpus"
+    if args.compile:
+        ensure_corpus(log_files, corpus_dir, rewrite_config(), args.procs, force=True)
+        return
+
+    stub = None
+    if args.calibrate:
+        import collector_stub
+        stub = collector_stub.CollectorStub(procs=args.stub_procs, decode=args.stub_decode).start()
+        NGINX_URL = stub.url
+        BALANCER = Balancer([NGINX_URL])
 
     total_files = len(log_files)
     print(f"{'=' * 60}")
-    print(f"  压测配置: {total_files} 个文件, {args.workers} 并发")
-    print(f"  目标地址: {NGINX_URL}")
+    print(f"  压测配置: {total_files} 个文件, {args.procs} 进程 × {args.workers} 并发, {args.engine} 引擎")
+    if len(BALANCER.targets) > 1:
+        print(f"  目标地址: {len(BALANCER.targets)} 个, {BALANCER.policy} 分配, 每个目标独立连接池")
+        for target in BALANCER.targets:
+            print(f"            {target}")
+    else:
+        print(f"  目标地址: {NGINX_URL}"
+              + (f" (校准：本机替身 {stub.procs} 进程, {'解码' if stub.decode else '不解码'})" if stub is not None else ""))
     print(f"  时间范围: {time_label}")
+    print(f"  负载模式: {SCHEDULE.describe() if SCHEDULE is not None else '闭环（满窗口时等待响应）'}")
+    if args.corpus:
+        source_label = f"预编译语料 {corpus_dir}"
+    elif args.rewrite_procs > 0:
+        source_label = f"改写流水线 {args.rewrite_procs} 进程"
+    else:
+        source_label = "逐行解析原始日志"
+    print(f"  请求来源: {source_label} (改写 {args.rewrite}, gzip {args.gzip_level} 级)")
+    if AMPLIFY > 1 or NEW_PROP_RATE > 0:
+        print(f"  负载放大: {AMPLIFY} 份副本{'（含项目名）' if AMPLIFY_PROJECT else ''}, 新属性注入率 {NEW_PROP_RATE:g}")
+    if REPACK:
+        print(f"  批量重组: {'拆成单事件 GET' if REPACK == 1 else f'每批 {REPACK} 个事件的 gzip data_list POST'}")
     print(f"{'=' * 60}")
 
+    replay_files = log_files
+    if args.corpus:
+        replay_files = ensure_corpus(log_files, corpus_dir, rewrite_config(), args.procs)
+    source_of = dict(zip(replay_files, log_files))
+
     grand_total = 0
     grand_success = 0
     grand_skipped = 0
 
-    overall_start = time.time()
+    done_files = 0
 
-    for i, log_file in enumerate(log_files, 1):
-        total, success, skipped, elapsed = process_file(log_file, args.workers)
+    def report(log_file, result):
+        nonlocal grand_total, grand_success, grand_skipped, done_files
+        total, success, skipped, elapsed = result
+        done_files += 1
         grand_total += total
         grand_success += success
         grand_skipped += skipped
         rps = success / elapsed if elapsed > 0 else 0
         print(
-            f"  [{i:3d}/{total_files}] {log_file.name}: "
+            f"  [{done_files:3d}/{total_files}] {source_of[log_file].name}: "
             f"{success}/{total} 成功, {skipped} 跳过, "
             f"{elapsed:.1f}s, {rps:.0f} req/s"
         )
 
+    overall_start = time.time()
+    if SCHEDULE is not None:
+        if SCHEDULE.profile == "original":
+            SCHEDULE.base_msec = _first_msec(log_files)
+        # 多进程时留出子进程启动时间，所有进程共用同一个计划起点
+        SCHEDULE.start = overall_start + (1.0 if args.procs > 1 else 0.0)
+
+    emitter = None
+    if args.marker_interval > 0:
+        marker_file = log_files[0].parent / MARKER_DIR / f"markers-{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+        emitter = MarkerEmitter(args.marker_interval, marker_file, args.marker_project)
+        emitter.start()
+
+    readout = None
+    if args.rewrite_procs > 0 and not args.corpus and args.procs <= 1:
+        PIPELINE = RewritePipeline(args.rewrite_procs)
+        readout = PIPELINE.start_readout()
+
+    failed_procs = 0
+    if args.procs > 1:
+        failed_procs = replay_sharded(replay_files, args.procs, args.engine, args.workers, report,
+                       0 if args.corpus else args.rewrite_procs)
+    elif args.engine == "async":
+        asyncio.run(replay_files_async([(f, 0, None) for f in replay_files], args.workers,
+                                       lambda unit, result: report(unit[0], result)))
+    else:
+        for log_file in replay_files:
+            report(log_file, process_file(log_file, args.workers))
+
+    if PIPELINE is not None:
+        readout.set()
+        STATS.add_stages(PIPELINE.counters)
+        PIPELINE.close()
+    if emitter is not None:
+        emitter.stop()
+
     overall_elapsed = time.time() - overall_start
+    stub_summary = None
+    if stub is not None:
+        stub_summary = stub.summary(overall_elapsed)
+        stub.stop()
     overall_rps = grand_success / overall_elapsed if overall_elapsed > 0 else 0
 
     print(f"\n{'=' * 60}")
@@ -328,8 +1933,71 @@ def main():
     print(f"  跳过数:     {grand_skipped:,} (无有效载荷)")
     print(f"  成功率:     {(grand_success / grand_total * 100):.1f}%" if grand_total > 0 else "  0%")
     print(f"  平均吞吐:   {overall_rps:,.0f} req/s")
+    if failed_procs:
+        print(f"  进程异常:   {failed_procs} 个重放进程异常退出，以上结果不完整")
+    summary = STATS.summary()
+    lat = summary["latency_ms"]
+    print("  延迟 (ms):  " + "  ".join(f"{k} {v:.1f}" for k, v in lat.items() if k not in ("mean", "count"))
+          + f"  (平均 {lat['mean']:.1f})")
+    print("  状态码:     " + ("  ".join(f"{k}={v:,}" for k, v in summary["status"].items()) or "-"))
+    print("  异常/跳过:  " + ("  ".join(f"{k}={v:,}" for k, v in summary["errors"].items()) or "-"))
+    if "pipeline" in summary:
+        stages = summary["pipeline"]
+        busy = stages["rewrite_cpu_s"] / (overall_elapsed * args.rewrite_procs * max(1, args.procs)) * 100
+        print(f"  改写流水线: 改写 CPU 利用率 {busy:.0f}%, 读取端因队列满阻塞 {stages['read_blocked_s']:.1f}s, "
+              f"发送端等待改写 {stages['send_starved_s']:.1f}s")
+    if "repack" in summary:
+        rp = summary["repack"]
+        per = rp["events"] / rp["requests_out"] if rp["requests_out"] else 0
+        print(f"  批量重组:   {rp['requests_in']:,} 个请求 / {rp['events']:,} 个事件 → "
+              f"{rp['requests_out']:,} 个请求 (平均 {per:.1f} 事件/请求)")
+    if emitter is not None:
+        print(f"  追踪标记:   发送 {emitter.sent} 个, 失败 {emitter.failed} 个, 记录 {emitter.path}")
+    if "schedule_lag_ms" in summary:
+        lag = summary["schedule_lag_ms"]
+        print(f"  调度滞后:   p50 {lag['p50']:.1f}  p99 {lag['p99']:.1f}  max {lag['max']:.1f} ms"
+              f"  (延迟从计划发送时间算起)")
+    if len(BALANCER.targets) > 1:
+        print("  按目标:")
+        nodes = summary.get("targets", {})
+        sent = sum(node["requests"] for node in nodes.values()) or 1
+        for target in BALANCER.targets:
+            node = nodes.get(target)
+            if node is None:
+                print(f"    {target}: 无请求")
+                continue
+            nlat = node["latency_ms"]
+            rps = node["requests"] / overall_elapsed if overall_elapsed > 0 else 0
+            bad = [f"{k}={v:,}" for k, v in node["status"].items() if int(k) >= 400]
+            bad += [f"{k}={v:,}" for k, v in node["errors"].items()]
+            print(f"    {target}: {node['requests']:,} 请求 ({node['requests'] / sent * 100:.1f}%), {rps:,.0f} req/s, "
+                  f"失败 {node['failed']:,}"
+                  + (f", p50 {nlat['p50']:.1f} p99 {nlat['p99']:.1f} max {nlat['max']:.1f} ms" if nlat["count"] else "")
+                  + (f"  ({'  '.join(bad)})" if bad else ""))
+    if stub_summary is not None:
+        print("  校准替身:")
+        print("\n".join(collector_stub.format_summary(stub_summary, stub.decode)))
+        print(f"  重放端上限: {stub_summary['req_per_s']:,.0f} req/s"
+              + (f", {stub_summary['events_per_s']:,.0f} events/s" if stub.decode else "")
+              + " （以此为基线对比真实采集端的压测结果）")
+        if stub_summary["cpu_util"] >= 0.8:
+            print(f"  注意: 替身 CPU 利用率 {stub_summary['cpu_util'] * 100:.0f}%，上限可能受替身限制，"
+                  f"请增加 --stub-procs")
     print(f"{'=' * 60}")
 
+    if args.timeseries:
+        STATS.write_timeseries(args.timeseries, {
+            "target": NGINX_URL, "targets": BALANCER.targets, "balance": BALANCER.policy, "files": total_files, "engine": args.engine, "procs": args.procs,
+            "workers": args.workers, "time_range": time_label, "started": int(overall_start),
+            "load": SCHEDULE.describe() if SCHEDULE is not None else "closed-loop",
+            "rewrite": args.rewrite, "gzip_level": args.gzip_level, "rewrite_procs": args.rewrite_procs,
+            "amplify": AMPLIFY, "amplify_project": AMPLIFY_PROJECT, "new_prop_rate": NEW_PROP_RATE,
+            "repack": REPACK, "elapsed": round(overall_elapsed, 3), "total": grand_total, "success": grand_success,
+            "calibration": stub_summary, "failed_procs": failed_procs,
+        })
+        print(f"  时间序列已写入 {args.timeseries}")
+    return 1 if failed_procs else 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())